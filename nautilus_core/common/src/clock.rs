@@ -15,7 +15,7 @@
 
 //! Real-time and static test `Clock` implementations.
 
-use std::{collections::HashMap, ops::Deref};
+use std::{collections::HashMap, ops::Deref, sync::Arc};
 
 use chrono::{DateTime, Utc};
 use nautilus_core::{
@@ -92,7 +92,7 @@ pub trait Clock {
 ///
 /// Stores the current timestamp internally which can be advanced.
 pub struct TestClock {
-    time: AtomicTime,
+    time: Arc<AtomicTime>,
     timers: HashMap<Ustr, TestTimer>,
     default_callback: Option<EventHandler>,
     callbacks: HashMap<Ustr, EventHandler>,
@@ -103,7 +103,7 @@ impl TestClock {
     #[must_use]
     pub fn new() -> Self {
         Self {
-            time: AtomicTime::new(false, UnixNanos::default()),
+            time: Arc::new(AtomicTime::new(false, UnixNanos::default())),
             timers: HashMap::new(),
             default_callback: None,
             callbacks: HashMap::new(),
@@ -115,6 +115,22 @@ impl TestClock {
         &self.timers
     }
 
+    /// Shares the time of the given `clock`, so that setting the time of either
+    /// clock (or any other clock sharing it) sets the time for all of them.
+    pub fn share_time(&mut self, clock: &Self) {
+        self.time = clock.time.clone();
+    }
+
+    /// Returns the earliest next time of the clocks active timers (if any).
+    #[must_use]
+    pub fn next_deadline_ns(&self) -> Option<UnixNanos> {
+        self.timers
+            .values()
+            .filter(|timer| !timer.is_expired())
+            .map(TestTimer::next_time_ns)
+            .min()
+    }
+
     pub fn advance_time(&mut self, to_time_ns: UnixNanos, set_time: bool) -> Vec<TimeEvent> {
         // Time should increase monotonically
         assert!(
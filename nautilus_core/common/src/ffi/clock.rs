@@ -92,6 +92,19 @@ pub extern "C" fn test_clock_set_time(clock: &TestClock_API, to_time_ns: u64) {
     clock.set_time(to_time_ns.into());
 }
 
+#[no_mangle]
+pub extern "C" fn test_clock_share_time(clock: &mut TestClock_API, source: &TestClock_API) {
+    clock.share_time(source);
+}
+
+/// Returns the earliest next time of the clocks active timers, or `u64::MAX` if none.
+#[no_mangle]
+pub extern "C" fn test_clock_next_deadline_ns(clock: &TestClock_API) -> u64 {
+    clock
+        .next_deadline_ns()
+        .map_or(u64::MAX, |deadline| deadline.as_u64())
+}
+
 #[no_mangle]
 pub extern "C" fn test_clock_timestamp(clock: &TestClock_API) -> f64 {
     clock.get_time()
@@ -95,6 +95,43 @@ mod tests {
         });
     }
 
+    #[rstest]
+    fn test_next_deadline_ns(mut test_clock: TestClock) {
+        pyo3::prepare_freethreaded_python();
+
+        Python::with_gil(|py| {
+            let py_list = PyList::empty(py);
+            let py_append = Py::from(py_list.getattr("append").unwrap());
+            let handler = EventHandler::new(py_append);
+            test_clock.register_default_handler(handler);
+
+            assert_eq!(test_clock.next_deadline_ns(), None);
+
+            test_clock
+                .set_timer_ns("TEST_TIME1", 10, 0.into(), None, None)
+                .unwrap();
+            test_clock
+                .set_timer_ns("TEST_TIME2", 5, 0.into(), None, None)
+                .unwrap();
+
+            assert_eq!(test_clock.next_deadline_ns(), Some(UnixNanos::from(5)));
+
+            test_clock.advance_time(5.into(), true);
+
+            assert_eq!(test_clock.next_deadline_ns(), Some(UnixNanos::from(10)));
+        });
+    }
+
+    #[rstest]
+    fn test_share_time(mut test_clock: TestClock) {
+        let other = TestClock::new();
+        test_clock.share_time(&other);
+
+        other.set_time(UnixNanos::from(100));
+
+        assert_eq!(test_clock.timestamp_ns(), UnixNanos::from(100));
+    }
+
     #[rstest]
     fn test_advance_within_stop_time_py(mut test_clock: TestClock) {
         pyo3::prepare_freethreaded_python();
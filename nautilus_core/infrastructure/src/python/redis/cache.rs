@@ -65,6 +65,24 @@ impl RedisCacheDatabase {
         }
     }
 
+    #[pyo3(name = "read_bulk")]
+    fn py_read_bulk(&mut self, py: Python, keys: Vec<String>) -> PyResult<Vec<Vec<PyObject>>> {
+        // Release the GIL while waiting on the database round trip
+        let result = py
+            .allow_threads(|| self.read_bulk(&keys))
+            .map_err(to_pyruntime_err)?;
+
+        Ok(result
+            .into_iter()
+            .map(|values| {
+                values
+                    .into_iter()
+                    .map(|r| PyBytes::new(py, r.as_ref()).into())
+                    .collect::<Vec<PyObject>>()
+            })
+            .collect())
+    }
+
     #[pyo3(name = "insert")]
     fn py_insert(&mut self, key: String, payload: Vec<Vec<u8>>) -> PyResult<()> {
         let payload: Vec<Bytes> = payload.into_iter().map(Bytes::from).collect();
@@ -65,6 +65,7 @@ const POSITIONS: &str = "positions";
 const ACTORS: &str = "actors";
 const STRATEGIES: &str = "strategies";
 const SNAPSHOTS: &str = "snapshots";
+const CHECKPOINTS: &str = "checkpoints";
 const HEALTH: &str = "health";
 
 // Index keys
@@ -212,10 +213,33 @@ impl RedisCacheDatabase {
             POSITIONS => read_list(&mut self.con, &key),
             ACTORS => read_string(&mut self.con, &key),
             STRATEGIES => read_string(&mut self.con, &key),
+            CHECKPOINTS => read_string(&mut self.con, &key),
             _ => anyhow::bail!("Unsupported operation: `read` for collection '{collection}'"),
         }
     }
 
+    /// Reads the values for all of the given `keys` in a single pipelined round trip.
+    ///
+    /// Only list collections (accounts, orders, positions) and checkpoints are supported.
+    pub fn read_bulk(&mut self, keys: &[String]) -> anyhow::Result<Vec<Vec<Bytes>>> {
+        let mut pipe = redis::pipe();
+
+        for key in keys {
+            let collection = get_collection_key(key)?;
+            let key = format!("{}{REDIS_DELIMITER}{}", self.trader_key, key);
+            match collection {
+                ACCOUNTS | ORDERS | POSITIONS => pipe.lrange(key, 0, -1),
+                CHECKPOINTS => pipe.get(key),
+                _ => anyhow::bail!(
+                    "Unsupported operation: `read_bulk` for collection '{collection}'"
+                ),
+            };
+        }
+
+        let values: Vec<redis::Value> = pipe.query(&mut self.con)?;
+        values.into_iter().map(value_to_bytes).collect()
+    }
+
     pub fn insert(&mut self, key: String, payload: Option<Vec<Bytes>>) -> anyhow::Result<()> {
         let op = DatabaseCommand::new(DatabaseOperation::Insert, key, payload);
         match self.tx.send(op) {
@@ -371,6 +395,21 @@ fn read_list(conn: &mut Connection, key: &str) -> anyhow::Result<Vec<Bytes>> {
     Ok(result)
 }
 
+fn value_to_bytes(value: redis::Value) -> anyhow::Result<Vec<Bytes>> {
+    match value {
+        redis::Value::Nil => Ok(vec![]),
+        redis::Value::BulkString(bytes) => Ok(vec![Bytes::from(bytes)]),
+        redis::Value::Array(values) => values
+            .into_iter()
+            .map(|value| match value {
+                redis::Value::BulkString(bytes) => Ok(Bytes::from(bytes)),
+                _ => anyhow::bail!("Unexpected value in list: {value:?}"),
+            })
+            .collect(),
+        _ => anyhow::bail!("Unexpected value: {value:?}"),
+    }
+}
+
 fn insert(
     pipe: &mut Pipeline,
     collection: &str,
@@ -421,6 +460,10 @@ fn insert(
             insert_list(pipe, key, value[0].as_ref());
             Ok(())
         }
+        CHECKPOINTS => {
+            insert_string(pipe, key, value[0].as_ref());
+            Ok(())
+        }
         HEALTH => {
             insert_string(pipe, key, value[0].as_ref());
             Ok(())
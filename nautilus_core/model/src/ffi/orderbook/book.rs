@@ -26,12 +26,13 @@ use crate::{
         delta::OrderBookDelta, deltas::OrderBookDeltas_API, depth::OrderBookDepth10,
         order::BookOrder, quote::QuoteTick, trade::TradeTick,
     },
-    enums::{BookType, OrderSide},
+    enums::{BookType, OrderSide, OrderSideSpecified},
     identifiers::InstrumentId,
     orderbook::{
         aggregation::{update_book_with_quote_tick, update_book_with_trade_tick},
         analysis::book_check_integrity,
         book::OrderBook,
+        ladder::Ladder,
     },
     types::{price::Price, quantity::Quantity},
 };
@@ -166,26 +167,70 @@ pub extern "C" fn orderbook_apply_depth(book: &mut OrderBook_API, depth: &OrderB
     book.apply_depth(depth);
 }
 
+/// Returns the top `depth` bid levels (all levels if `depth` is zero).
 #[no_mangle]
-pub extern "C" fn orderbook_bids(book: &mut OrderBook_API) -> CVec {
-    book.bids
-        .levels
-        .values()
-        .map(|level| Level_API::new(level.clone()))
-        .collect::<Vec<Level_API>>()
-        .into()
+pub extern "C" fn orderbook_bids(book: &mut OrderBook_API, depth: usize) -> CVec {
+    levels_to_cvec(&book.bids, depth)
 }
 
+/// Returns the top `depth` ask levels (all levels if `depth` is zero).
 #[no_mangle]
-pub extern "C" fn orderbook_asks(book: &mut OrderBook_API) -> CVec {
-    book.asks
+pub extern "C" fn orderbook_asks(book: &mut OrderBook_API, depth: usize) -> CVec {
+    levels_to_cvec(&book.asks, depth)
+}
+
+fn levels_to_cvec(ladder: &Ladder, depth: usize) -> CVec {
+    let depth = if depth == 0 { usize::MAX } else { depth };
+    ladder
         .levels
         .values()
+        .take(depth)
         .map(|level| Level_API::new(level.clone()))
         .collect::<Vec<Level_API>>()
         .into()
 }
 
+/// Writes the price, size and order count of the top `depth` levels for the given `side`
+/// into the given buffers, returning the number of levels written.
+///
+/// # Safety
+///
+/// Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+///
+/// # Panics
+///
+/// If `side` is not `Buy` or `Sell`.
+#[no_mangle]
+pub unsafe extern "C" fn orderbook_levels_to_arrays(
+    book: &OrderBook_API,
+    side: OrderSide,
+    depth: usize,
+    prices: *mut f64,
+    sizes: *mut f64,
+    counts: *mut u64,
+) -> usize {
+    if depth == 0 {
+        return 0;
+    }
+
+    let ladder = match side.as_specified() {
+        OrderSideSpecified::Buy => &book.bids,
+        OrderSideSpecified::Sell => &book.asks,
+    };
+    let prices = std::slice::from_raw_parts_mut(prices, depth);
+    let sizes = std::slice::from_raw_parts_mut(sizes, depth);
+    let counts = std::slice::from_raw_parts_mut(counts, depth);
+
+    let mut len = 0;
+    for level in ladder.levels.values().take(depth) {
+        prices[len] = level.price.value.as_f64();
+        sizes[len] = level.size();
+        counts[len] = level.len() as u64;
+        len += 1;
+    }
+    len
+}
+
 #[no_mangle]
 pub extern "C" fn orderbook_has_bid(book: &mut OrderBook_API) -> u8 {
     u8::from(book.has_bid())
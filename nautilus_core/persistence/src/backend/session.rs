@@ -13,11 +13,28 @@
 //  limitations under the License.
 // -------------------------------------------------------------------------------------------------
 
-use std::{collections::HashMap, sync::Arc, vec::IntoIter};
+use std::{
+    collections::HashMap,
+    fmt::Debug,
+    sync::{Arc, Mutex},
+    vec::IntoIter,
+};
 
 use compare::Compare;
 use datafusion::{
-    error::Result, logical_expr::expr::Sort, physical_plan::SendableRecordBatchStream, prelude::*,
+    arrow::{
+        datatypes::SchemaRef,
+        ffi_stream::ArrowArrayStreamReader,
+        record_batch::{RecordBatch, RecordBatchReader},
+    },
+    datasource::streaming::StreamingTable,
+    error::{DataFusionError, Result},
+    execution::TaskContext,
+    logical_expr::expr::Sort,
+    physical_plan::{
+        stream::RecordBatchStreamAdapter, streaming::PartitionStream, SendableRecordBatchStream,
+    },
+    prelude::*,
 };
 use futures::StreamExt;
 use nautilus_core::ffi::cvec::CVec;
@@ -71,8 +88,13 @@ impl DataBackendSession {
             .enable_all()
             .build()
             .unwrap();
-        let session_cfg =
-            SessionConfig::new().set_str("datafusion.optimizer.repartition_file_scans", "false");
+        // Queries must not be repartitioned, so that each stream remains ordered by `ts_init`
+        let session_cfg = SessionConfig::new()
+            .set_str("datafusion.optimizer.repartition_file_scans", "false")
+            .set_str(
+                "datafusion.optimizer.enable_round_robin_repartition",
+                "false",
+            );
         let session_ctx = SessionContext::new_with_config(session_cfg);
         Self {
             session_ctx,
@@ -129,6 +151,48 @@ impl DataBackendSession {
             parquet_options,
         ))?;
 
+        self.add_query::<T>(table_name, sql_query)
+    }
+
+    /// Query a stream of record batches for its records. the caller must specify `T`
+    /// to indicate the kind of data expected from this query.
+    ///
+    /// This allows data to be read by any reader which exports the Arrow C stream
+    /// interface (such as a `pyarrow` reader over an `fsspec` filesystem), while still
+    /// being queried, merged and decoded by the session. The stream is consumed once.
+    ///
+    /// `table_name`: Logical `table_name` assigned to this stream. Queries to this stream should
+    /// address it by its table name.
+    /// `reader`: The record batch stream reader.
+    /// `sql_query`: A custom sql query to retrieve records from the stream. If no query is provided
+    /// a default query "SELECT * FROM <`table_name`>" is run.
+    ///
+    /// # Safety
+    ///
+    /// The stream data must be ordered by the `ts_init` in ascending order for this
+    /// to work correctly.
+    pub fn add_record_batch_reader<T>(
+        &mut self,
+        table_name: &str,
+        reader: ArrowArrayStreamReader,
+        sql_query: Option<&str>,
+    ) -> Result<()>
+    where
+        T: DecodeDataFromRecordBatch + Into<Data>,
+    {
+        let schema = reader.schema();
+        let partition = RecordBatchReaderPartition::new(schema.clone(), reader);
+        let table = StreamingTable::try_new(schema, vec![Arc::new(partition)])?;
+        self.session_ctx
+            .register_table(table_name, Arc::new(table))?;
+
+        self.add_query::<T>(table_name, sql_query)
+    }
+
+    fn add_query<T>(&mut self, table_name: &str, sql_query: Option<&str>) -> Result<()>
+    where
+        T: DecodeDataFromRecordBatch + Into<Data>,
+    {
         let default_query = format!("SELECT * FROM {}", &table_name);
         let sql_query = sql_query.unwrap_or(&default_query);
         let query = self.runtime.block_on(self.session_ctx.sql(sql_query))?;
@@ -175,6 +239,65 @@ impl DataBackendSession {
 // Note: Intended to be used on a single Python thread
 unsafe impl Send for DataBackendSession {}
 
+/// Provides a single partition over a record batch stream reader, which can be
+/// executed once.
+struct RecordBatchReaderPartition {
+    schema: SchemaRef,
+    reader: Mutex<Option<SendableReader>>,
+}
+
+impl RecordBatchReaderPartition {
+    fn new(schema: SchemaRef, reader: ArrowArrayStreamReader) -> Self {
+        Self {
+            schema,
+            reader: Mutex::new(Some(SendableReader(reader))),
+        }
+    }
+}
+
+impl Debug for RecordBatchReaderPartition {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct(stringify!(RecordBatchReaderPartition))
+            .field("schema", &self.schema)
+            .finish()
+    }
+}
+
+impl PartitionStream for RecordBatchReaderPartition {
+    fn schema(&self) -> &SchemaRef {
+        &self.schema
+    }
+
+    fn execute(&self, _ctx: Arc<TaskContext>) -> SendableRecordBatchStream {
+        let reader = self
+            .reader
+            .lock()
+            .unwrap()
+            .take()
+            .expect("Record batch reader has already been consumed");
+
+        // The reader is blocking, and may need the GIL when backed by Python
+        let stream = futures::stream::iter(reader);
+        Box::pin(RecordBatchStreamAdapter::new(self.schema.clone(), stream))
+    }
+}
+
+/// Wraps the reader so it can be moved to the session runtime.
+struct SendableReader(ArrowArrayStreamReader);
+
+// Note: The Arrow C stream is only ever read from one thread at a time
+unsafe impl Send for SendableReader {}
+
+impl Iterator for SendableReader {
+    type Item = Result<RecordBatch>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.0
+            .next()
+            .map(|result| result.map_err(DataFusionError::from))
+    }
+}
+
 #[cfg_attr(
     feature = "python",
     pyo3::pyclass(module = "nautilus_trader.core.nautilus_pyo3.persistence")
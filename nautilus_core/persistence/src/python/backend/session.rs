@@ -13,6 +13,7 @@
 //  limitations under the License.
 // -------------------------------------------------------------------------------------------------
 
+use datafusion::arrow::{ffi_stream::ArrowArrayStreamReader, pyarrow::PyArrowType};
 use nautilus_core::{ffi::cvec::CVec, python::to_pyruntime_err};
 use nautilus_model::data::{
     bar::Bar, delta::OrderBookDelta, depth::OrderBookDepth10, quote::QuoteTick, trade::TradeTick,
@@ -83,9 +84,54 @@ impl DataBackendSession {
         }
     }
 
-    fn to_query_result(mut slf: PyRefMut<'_, Self>) -> DataQueryResult {
-        let query_result = slf.get_query_result();
-        DataQueryResult::new(query_result, slf.chunk_size)
+    /// Query a stream of record batches for its records. the caller must specify `T` to
+    /// indicate the kind of data expected from this query.
+    ///
+    /// table_name: Logical table_name assigned to this stream. Queries to this stream should
+    /// address it by its table name.
+    /// reader: Any object exporting the Arrow C stream interface, such as a `pyarrow.RecordBatchReader`.
+    /// sql_query: A custom sql query to retrieve records from the stream. If no query is provided
+    /// a default query "SELECT * FROM <table_name>" is run.
+    ///
+    /// # Safety
+    ///
+    /// The stream data must be ordered by the ts_init in ascending order for this
+    /// to work correctly.
+    #[pyo3(name = "add_record_batch_reader")]
+    fn add_record_batch_reader_py(
+        mut slf: PyRefMut<'_, Self>,
+        data_type: NautilusDataType,
+        table_name: &str,
+        reader: PyArrowType<ArrowArrayStreamReader>,
+        sql_query: Option<&str>,
+    ) -> PyResult<()> {
+        let _guard = slf.runtime.enter();
+        let reader = reader.0;
+
+        match data_type {
+            NautilusDataType::OrderBookDelta => slf
+                .add_record_batch_reader::<OrderBookDelta>(table_name, reader, sql_query)
+                .map_err(to_pyruntime_err),
+            NautilusDataType::OrderBookDepth10 => slf
+                .add_record_batch_reader::<OrderBookDepth10>(table_name, reader, sql_query)
+                .map_err(to_pyruntime_err),
+            NautilusDataType::QuoteTick => slf
+                .add_record_batch_reader::<QuoteTick>(table_name, reader, sql_query)
+                .map_err(to_pyruntime_err),
+            NautilusDataType::TradeTick => slf
+                .add_record_batch_reader::<TradeTick>(table_name, reader, sql_query)
+                .map_err(to_pyruntime_err),
+            NautilusDataType::Bar => slf
+                .add_record_batch_reader::<Bar>(table_name, reader, sql_query)
+                .map_err(to_pyruntime_err),
+        }
+    }
+
+    fn to_query_result(mut slf: PyRefMut<'_, Self>, py: Python<'_>) -> DataQueryResult {
+        // Release the GIL while merging, as Python backed readers need it to make progress
+        let session = &mut *slf;
+        let query_result = py.allow_threads(|| session.get_query_result());
+        DataQueryResult::new(query_result, session.chunk_size)
     }
 }
 
@@ -97,14 +143,16 @@ impl DataQueryResult {
     }
 
     /// Each iteration returns a chunk of values read from the parquet file.
-    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyObject>> {
-        match slf.next() {
+    fn __next__(mut slf: PyRefMut<'_, Self>, py: Python<'_>) -> PyResult<Option<PyObject>> {
+        // Release the GIL while merging, as Python backed readers need it to make progress
+        let result = &mut *slf;
+        match py.allow_threads(|| result.next()) {
             Some(acc) if !acc.is_empty() => {
                 let cvec = slf.set_chunk(acc);
-                Python::with_gil(|py| match PyCapsule::new_bound::<CVec>(py, cvec, None) {
+                match PyCapsule::new_bound::<CVec>(py, cvec, None) {
                     Ok(capsule) => Ok(Some(capsule.into_py(py))),
                     Err(e) => Err(to_pyruntime_err(e)),
-                })
+                }
             }
             _ => Ok(None),
         }
@@ -15,6 +15,10 @@
 
 #![allow(deprecated)] // TODO: Temporary for pyo3 upgrade
 
+use datafusion::{
+    arrow::ffi_stream::{ArrowArrayStreamReader, FFI_ArrowArrayStream},
+    parquet::arrow::arrow_reader::ParquetRecordBatchReaderBuilder,
+};
 use nautilus_core::ffi::cvec::CVec;
 use nautilus_model::data::{
     bar::Bar, delta::OrderBookDelta, is_monotonically_increasing_by_init, quote::QuoteTick,
@@ -237,6 +241,37 @@ fn test_quote_tick_query() {
     assert!(is_monotonically_increasing_by_init(&ticks));
 }
 
+#[rstest]
+fn test_quote_tick_record_batch_reader_query() {
+    let expected_length = 9_500;
+    let file = std::fs::File::open("../../tests/test_data/nautilus/quotes.parquet").unwrap();
+    let reader = ParquetRecordBatchReaderBuilder::try_new(file)
+        .unwrap()
+        .build()
+        .unwrap();
+    let stream = FFI_ArrowArrayStream::new(Box::new(reader));
+    let reader = ArrowArrayStreamReader::try_new(stream).unwrap();
+    let mut catalog = DataBackendSession::new(10_000);
+    catalog
+        .add_record_batch_reader::<QuoteTick>(
+            "quote_005",
+            reader,
+            Some("SELECT * FROM quote_005 WHERE ts_init >= 0"),
+        )
+        .unwrap();
+    let query_result: QueryResult = catalog.get_query_result();
+    let ticks: Vec<Data> = query_result.collect();
+
+    if let Data::Quote(q) = ticks[0] {
+        assert_eq!("EUR/USD.SIM", q.instrument_id.to_string());
+    } else {
+        panic!("Invalid test");
+    }
+
+    assert_eq!(ticks.len(), expected_length);
+    assert!(is_monotonically_increasing_by_init(&ticks));
+}
+
 #[rstest]
 fn test_quote_tick_multiple_query() {
     let expected_length = 9_600;
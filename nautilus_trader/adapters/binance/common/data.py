@@ -18,6 +18,7 @@ import decimal
 from decimal import Decimal
 
 import msgspec
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.adapters.binance.common.constants import BINANCE_VENUE
@@ -48,10 +49,7 @@ from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import secs_to_millis
 from nautilus_trader.core.uuid import UUID4
-from nautilus_trader.data.aggregation import BarAggregator
-from nautilus_trader.data.aggregation import TickBarAggregator
-from nautilus_trader.data.aggregation import ValueBarAggregator
-from nautilus_trader.data.aggregation import VolumeBarAggregator
+from nautilus_trader.data.batch_aggregation import BatchBarAggregator
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
@@ -63,14 +61,12 @@ from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AggregationSource
-from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
-from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Quantity
@@ -755,41 +751,13 @@ class BinanceCommonDataClient(LiveMarketDataClient):
 
         quantize_value = Decimal(f"1e-{instrument.size_precision}")
 
-        bars: list[Bar] = []
-        if bar_type.spec.aggregation == BarAggregation.TICK:
-            aggregator = TickBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        elif bar_type.spec.aggregation == BarAggregation.VOLUME:
-            aggregator = VolumeBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        elif bar_type.spec.aggregation == BarAggregation.VALUE:
-            aggregator = ValueBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        else:
-            raise RuntimeError(  # pragma: no cover (design-time error)
-                f"Cannot start aggregator: "  # pragma: no cover (design-time error)
-                f"BarAggregation.{bar_type.spec.aggregation_string_c()} "  # pragma: no cover (design-time error)
-                f"not supported in open-source",  # pragma: no cover (design-time error)
-            )
-
-        for binance_bar in binance_bars:
-            if binance_bar.count == 0:
-                continue
-            self._aggregate_bar_to_trade_ticks(
-                instrument=instrument,
-                aggregator=aggregator,
-                binance_bar=binance_bar,
-                quantize_value=quantize_value,
-            )
+        ts_event, prices, sizes = self._binance_bars_to_trade_columns(
+            instrument=instrument,
+            binance_bars=[b for b in binance_bars if b.count > 0],
+            quantize_value=quantize_value,
+        )
+        aggregator = BatchBarAggregator(instrument=instrument, bar_type=bar_type)
+        bars: list[Bar] = aggregator.aggregate(ts_event, prices, sizes)
 
         self._log.info(
             f"Inferred {len(bars)} {bar_type} bars aggregated from {len(binance_bars)} 1-MINUTE Binance bars",
@@ -800,71 +768,43 @@ class BinanceCommonDataClient(LiveMarketDataClient):
             bars = bars[:limit]
         return bars
 
-    def _aggregate_bar_to_trade_ticks(
+    def _binance_bars_to_trade_columns(
         self,
         instrument: Instrument,
-        aggregator: BarAggregator,
-        binance_bar: BinanceBar,
+        binance_bars: list[BinanceBar],
         quantize_value: Decimal,
-    ) -> None:
-        volume = binance_bar.volume.as_decimal()
-        size_part: Decimal = (volume / (4 * binance_bar.count)).quantize(
-            quantize_value,
-            rounding=decimal.ROUND_DOWN,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Each bar is split into `count` groups of open, high, low and close trades,
+        # with any volume remainder added to the final close trade
+        size_raws: list[int] = []
+        close_size_raws: list[int] = []
+        for binance_bar in binance_bars:
+            volume = binance_bar.volume.as_decimal()
+            size_part: Decimal = (volume / (4 * binance_bar.count)).quantize(
+                quantize_value,
+                rounding=decimal.ROUND_DOWN,
+            )
+            remainder: Decimal = volume - (size_part * 4 * binance_bar.count)
+            size_raws.append(Quantity(size_part, instrument.size_precision).raw)
+            close_size_raws.append(
+                Quantity(size_part + remainder, instrument.size_precision).raw,
+            )
+
+        counts = np.array([b.count for b in binance_bars], dtype=np.int64)
+        trade_counts = counts * 4
+        ts_event = np.repeat(
+            np.array([b.ts_event for b in binance_bars], dtype=np.uint64),
+            trade_counts,
         )
-        remainder: Decimal = volume - (size_part * 4 * binance_bar.count)
-
-        size = Quantity(size_part, instrument.size_precision)
-
-        for i in range(binance_bar.count):
-            open = TradeTick(
-                instrument_id=instrument.id,
-                price=binance_bar.open,
-                size=size,
-                aggressor_side=AggressorSide.NO_AGGRESSOR,
-                trade_id=TradeId("NULL"),  # N/A
-                ts_event=binance_bar.ts_event,
-                ts_init=binance_bar.ts_event,
-            )
+        ohlc = np.array(
+            [[b.open.raw, b.high.raw, b.low.raw, b.close.raw] for b in binance_bars],
+            dtype=np.int64,
+        ).reshape(-1, 4)
+        prices = np.repeat(ohlc, counts, axis=0).ravel()
+        sizes = np.repeat(np.array(size_raws, dtype=np.uint64), trade_counts)
+        sizes[np.cumsum(trade_counts) - 1] = close_size_raws
 
-            high = TradeTick(
-                instrument_id=instrument.id,
-                price=binance_bar.high,
-                size=size,
-                aggressor_side=AggressorSide.NO_AGGRESSOR,
-                trade_id=TradeId("NULL"),  # N/A
-                ts_event=binance_bar.ts_event,
-                ts_init=binance_bar.ts_event,
-            )
-
-            low = TradeTick(
-                instrument_id=instrument.id,
-                price=binance_bar.low,
-                size=size,
-                aggressor_side=AggressorSide.NO_AGGRESSOR,
-                trade_id=TradeId("NULL"),  # N/A
-                ts_event=binance_bar.ts_event,
-                ts_init=binance_bar.ts_event,
-            )
-
-            close_size = size
-            if i == binance_bar.count - 1:
-                close_size = Quantity(size_part + remainder, instrument.size_precision)
-
-            close = TradeTick(
-                instrument_id=instrument.id,
-                price=binance_bar.close,
-                size=close_size,
-                aggressor_side=AggressorSide.NO_AGGRESSOR,
-                trade_id=TradeId("NULL"),  # N/A
-                ts_event=binance_bar.ts_event,
-                ts_init=binance_bar.ts_event,
-            )
-
-            aggregator.handle_trade_tick(open)
-            aggregator.handle_trade_tick(high)
-            aggregator.handle_trade_tick(low)
-            aggregator.handle_trade_tick(close)
+        return ts_event, prices, sizes
 
     async def _aggregate_internal_from_agg_trade_ticks(
         self,
@@ -890,34 +830,12 @@ class BinanceCommonDataClient(LiveMarketDataClient):
             limit=limit,
         )
 
-        bars: list[Bar] = []
-        if bar_type.spec.aggregation == BarAggregation.TICK:
-            aggregator = TickBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        elif bar_type.spec.aggregation == BarAggregation.VOLUME:
-            aggregator = VolumeBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        elif bar_type.spec.aggregation == BarAggregation.VALUE:
-            aggregator = ValueBarAggregator(
-                instrument=instrument,
-                bar_type=bar_type,
-                handler=bars.append,
-            )
-        else:
-            raise RuntimeError(  # pragma: no cover (design-time error)
-                f"Cannot start aggregator: "  # pragma: no cover (design-time error)
-                f"BarAggregation.{bar_type.spec.aggregation_string_c()} "  # pragma: no cover (design-time error)
-                f"not supported in open-source",  # pragma: no cover (design-time error)
-            )
-
-        for tick in ticks:
-            aggregator.handle_trade_tick(tick)
+        aggregator = BatchBarAggregator(instrument=instrument, bar_type=bar_type)
+        bars: list[Bar] = aggregator.aggregate(
+            ts_event=np.fromiter((t.ts_event for t in ticks), dtype=np.uint64, count=len(ticks)),
+            prices=np.fromiter((t.price.raw for t in ticks), dtype=np.int64, count=len(ticks)),
+            sizes=np.fromiter((t.size.raw for t in ticks), dtype=np.uint64, count=len(ticks)),
+        )
 
         self._log.info(
             f"Inferred {len(bars)} {bar_type} bars aggregated from {len(ticks)} trade ticks",
@@ -43,8 +43,12 @@ class PortfolioAnalyzer:
         self._account_balances_starting: dict[Currency, Money] = {}
         self._account_balances: dict[Currency, Money] = {}
         self._positions: list[Position] = []
-        self._realized_pnls: dict[Currency, pd.Series] = {}
-        self._returns: pd.Series = pd.Series(dtype=float64)
+
+        # Raw data is accumulated in dicts, with the series built once when queried
+        self._realized_pnls_raw: dict[Currency, dict[str, float]] = {}
+        self._returns_raw: dict[datetime, float] = {}
+        self._realized_pnls: dict[Currency, pd.Series] | None = {}
+        self._returns: pd.Series | None = pd.Series(dtype=float64)
 
     def register_statistic(self, statistic: PortfolioStatistic) -> None:
         """
@@ -81,6 +85,8 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = {}
         self._account_balances = {}
+        self._realized_pnls_raw = {}
+        self._returns_raw = {}
         self._realized_pnls = {}
         self._returns = pd.Series(dtype=float64)
 
@@ -123,8 +129,23 @@ class PortfolioAnalyzer:
         pd.Series
 
         """
+        if self._returns is None:
+            if self._returns_raw:
+                self._returns = pd.Series(self._returns_raw, dtype=float64).sort_index()
+            else:
+                self._returns = pd.Series(dtype=float64)
+
         return self._returns
 
+    def _get_realized_pnls(self) -> dict[Currency, pd.Series]:
+        if self._realized_pnls is None:
+            self._realized_pnls = {
+                currency: pd.Series(realized_pnls, dtype=float64)
+                for currency, realized_pnls in self._realized_pnls_raw.items()
+            }
+
+        return self._realized_pnls
+
     def calculate_statistics(self, account: Account, positions: list[Position]) -> None:
         """
         Calculate performance metrics from the given data.
@@ -139,11 +160,12 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances_total()
+        self._realized_pnls_raw = {}
+        self._returns_raw = {}
         self._realized_pnls = {}
         self._returns = pd.Series(dtype=float64)
 
         self.add_positions(positions)
-        self._returns.sort_index()
 
     def add_positions(self, positions: list[Position]) -> None:
         """
@@ -173,9 +195,12 @@ class PortfolioAnalyzer:
 
         """
         currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series(dtype=float64))
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        realized_pnls = self._realized_pnls_raw.get(currency)
+        if realized_pnls is None:
+            realized_pnls = {}
+            self._realized_pnls_raw[currency] = realized_pnls
+        realized_pnls[position_id.value] = realized_pnl.as_double()
+        self._realized_pnls = None  # Rebuild when next queried
 
     def add_return(self, timestamp: datetime, value: float) -> None:
         """
@@ -189,9 +214,8 @@ class PortfolioAnalyzer:
             The return value to add.
 
         """
-        if timestamp not in self._returns:
-            self._returns.loc[timestamp] = 0.0
-        self._returns.loc[timestamp] += float(value)
+        self._returns_raw[timestamp] = self._returns_raw.get(timestamp, 0.0) + float(value)
+        self._returns = None  # Rebuild when next queried
 
     def realized_pnls(self, currency: Currency | None = None) -> pd.Series | None:
         """
@@ -214,14 +238,15 @@ class PortfolioAnalyzer:
             If `currency` is ``None`` when analyzing multi-currency portfolios.
 
         """
-        if not self._realized_pnls:
+        realized_pnls = self._get_realized_pnls()
+        if not realized_pnls:
             return None
         if currency is None:
             if len(self._account_balances) > 1:
                 raise ValueError("`currency` was `None` for multi-currency portfolio")
             currency = next(iter(self._account_balances.keys()))
 
-        return self._realized_pnls.get(currency)
+        return realized_pnls.get(currency)
 
     def total_pnl(
         self,
@@ -384,9 +409,11 @@ class PortfolioAnalyzer:
         dict[str, Any]
 
         """
+        stats = list(self._statistics.values())
+        values = PortfolioStatistic.calculate_batch_from_returns(stats, self.returns())
+
         output = {}
-        for name, stat in self._statistics.items():
-            value = stat.calculate_from_returns(self._returns)
+        for name, value in zip(self._statistics, values):
             if value is None:
                 continue  # Not implemented
             if not isinstance(value, int | float | str | bool):
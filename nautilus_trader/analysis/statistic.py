@@ -16,6 +16,7 @@
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.model.orders import Order
@@ -79,6 +80,26 @@ class PortfolioStatistic:
         """
         # Override in implementation
 
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        """
+        Calculate the statistic value from the given returns downsampled to daily bins.
+
+        Statistics which only depend on the daily returns should override this method
+        so they can share a single downsampled series when calculated as a batch.
+
+        Parameters
+        ----------
+        daily_returns : pd.Series
+            The daily returns to use for the calculation.
+
+        Returns
+        -------
+        Any or ``None``
+            A JSON serializable primitive.
+
+        """
+        # Override in implementation
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         """
         Calculate the statistic value from the given raw realized PnLs.
@@ -130,6 +151,54 @@ class PortfolioStatistic:
         """
         # Override in implementation
 
+    @staticmethod
+    def calculate_batch_from_returns(
+        statistics: list["PortfolioStatistic"],
+        returns: pd.Series,
+    ) -> list[Any | None]:
+        """
+        Calculate the values for the given statistics from the given raw returns.
+
+        The returns are validated and downsampled to daily bins once, and then shared
+        between all statistics which implement `calculate_from_daily_returns`.
+
+        Parameters
+        ----------
+        statistics : list[PortfolioStatistic]
+            The statistics to calculate.
+        returns : pd.Series
+            The returns to use for the calculation.
+
+        Returns
+        -------
+        list[Any or ``None``]
+            The values in the same order as the given statistics.
+
+        """
+        daily_returns: pd.Series | None = None
+        valid: bool | None = None
+        values: list[Any | None] = []
+        for stat in statistics:
+            if not stat._uses_daily_returns():
+                values.append(stat.calculate_from_returns(returns))
+                continue
+            if valid is None:
+                valid = stat._check_valid_returns(returns)
+                if valid:
+                    daily_returns = stat._downsample_to_daily_bins(returns)
+            if valid:
+                values.append(stat.calculate_from_daily_returns(daily_returns))
+            else:
+                values.append(np.nan)
+
+        return values
+
+    def _uses_daily_returns(self) -> bool:
+        return (
+            type(self).calculate_from_daily_returns
+            is not PortfolioStatistic.calculate_from_daily_returns
+        )
+
     def _check_valid_returns(self, returns: pd.Series) -> bool:
         if returns is None or returns.empty or returns.isna().all():
             return False
@@ -46,6 +46,7 @@ class ReturnsVolatility(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
 
-        return returns.std() * np.sqrt(self.period)
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        return daily_returns.std() * np.sqrt(self.period)
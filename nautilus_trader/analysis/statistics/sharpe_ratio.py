@@ -46,9 +46,10 @@ class SharpeRatio(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
 
-        divisor = returns.std(ddof=1)
-        res = returns.mean() / divisor
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        divisor = daily_returns.std(ddof=1)
+        res = daily_returns.mean() / divisor
 
         return res * np.sqrt(self.period)
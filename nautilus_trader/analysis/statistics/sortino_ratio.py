@@ -46,12 +46,13 @@ class SortinoRatio(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
 
-        downside = np.sqrt((returns[returns < 0] ** 2).sum() / len(returns))
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        downside = np.sqrt((daily_returns[daily_returns < 0] ** 2).sum() / len(daily_returns))
         if downside == 0:
             return np.nan
 
-        res = returns.mean() / downside
+        res = daily_returns.mean() / downside
 
         return res * np.sqrt(self.period)
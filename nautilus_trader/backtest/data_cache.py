@@ -0,0 +1,267 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pyarrow as pa
+
+from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.inspect import is_nautilus_class
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+class BacktestDataCache:
+    """
+    Provides a cache of the data loaded for backtest data configs.
+
+    Runs which reference the same data (such as a parameter sweep) can then reuse it
+    without re-reading and re-decoding it from the catalog. Entries are keyed on the
+    normalized catalog query of the data config, and the least recently used entries
+    are evicted once the total estimated size exceeds `max_size_bytes`.
+
+    If a `path` is given then Nautilus data is also exported there as an Arrow IPC file
+    per entry, which other processes (such as `BacktestNode` workers) memory map and
+    decode on a cache miss in place of querying the catalog.
+
+    Parameters
+    ----------
+    max_size_bytes : int, optional
+        The maximum total estimated size of the cached data held in memory.
+        If ``None`` then the size is unbounded.
+    path : str, optional
+        The local directory for the shared Arrow IPC files.
+
+    Raises
+    ------
+    ValueError
+        If `max_size_bytes` is negative (< 0).
+
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int | None = None,
+        path: str | None = None,
+    ) -> None:
+        if max_size_bytes is not None:
+            PyCondition.not_negative_int(max_size_bytes, "max_size_bytes")
+
+        self.max_size_bytes = max_size_bytes
+        self.path = path
+
+        self._entries: OrderedDict[str, tuple[list[Data], int]] = OrderedDict()
+        self._size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Return the total estimated size of the data held in memory.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._size_bytes
+
+    @staticmethod
+    def key(config: BacktestDataConfig) -> str:
+        """
+        Return the cache key for the given data config.
+
+        The key is the normalized catalog query, so configs which differ only in
+        fields not affecting the loaded data (such as `client_id`) share an entry.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data config for the key.
+
+        Returns
+        -------
+        str
+
+        """
+        data_type = config.data_type
+        query = config.query
+        filter_expr = query["filter_expr"]
+        normalized = {
+            "catalog_path": config.catalog_path,
+            "catalog_fs_protocol": config.catalog_fs_protocol,
+            "catalog_fs_storage_options": config.catalog_fs_storage_options,
+            "data_cls": f"{data_type.__module__}:{data_type.__qualname__}",
+            "instrument_id": str(config.instrument_id) if config.instrument_id else None,
+            "start": config.start_time_nanos,
+            "end": config.end_time_nanos,
+            "filter_expr": str(filter_expr) if filter_expr is not None else None,
+            "metadata": config.metadata,
+        }
+        return json.dumps(normalized, sort_keys=True, default=str)
+
+    def get(self, key: str, data_cls: type) -> list[Data] | None:
+        """
+        Return the cached data for the given key (if found).
+
+        Parameters
+        ----------
+        key : str
+            The cache key for the data.
+        data_cls : type
+            The data type for decoding a shared Arrow IPC file.
+
+        Returns
+        -------
+        list[Data] or ``None``
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        file_path = self._file_path(key)
+        if file_path is None or not file_path.exists():
+            return None
+
+        with pa.memory_map(str(file_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+            data = ParquetDataCatalog._handle_table_nautilus(table, data_cls=data_cls)
+
+        self._add(key, data)
+        return data
+
+    def put(self, key: str, data: list[Data], data_cls: type) -> None:
+        """
+        Add the given data to the cache.
+
+        If the cache has a `path` then Nautilus data is also exported as a shared
+        Arrow IPC file (if not already exported).
+
+        Parameters
+        ----------
+        key : str
+            The cache key for the data.
+        data : list[Data]
+            The data to cache.
+        data_cls : type
+            The data type for the data.
+
+        """
+        self.export(key, data, data_cls)
+        self._add(key, data)
+
+    def export(self, key: str, data: list[Data], data_cls: type) -> bool:
+        """
+        Export the given data as a shared Arrow IPC file, without holding it in memory.
+
+        Parameters
+        ----------
+        key : str
+            The cache key for the data.
+        data : list[Data]
+            The data to export.
+        data_cls : type
+            The data type for the data.
+
+        Returns
+        -------
+        bool
+            True if the shared file exists for the key, else False (no `path`, no data,
+            or data which cannot be serialized to Arrow).
+
+        """
+        file_path = self._file_path(key)
+        if file_path is None:
+            return False
+        if file_path.exists():
+            return True
+        if not data or not is_nautilus_class(data_cls):
+            return False
+
+        try:
+            table = ArrowSerializer.serialize_batch(data, data_cls=data_cls)
+        except (RuntimeError, TypeError):
+            return False  # No Arrow encoding for the type, keep in memory only
+
+        # Write to a temporary file first so readers never see a partial file
+        temp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(temp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        temp_path.replace(file_path)
+        return True
+
+    def discard(self, key: str) -> None:
+        """
+        Remove the in-memory entry for the given key (if found).
+
+        Parameters
+        ----------
+        key : str
+            The cache key to remove.
+
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """
+        Clear all in-memory entries from the cache.
+        """
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def _add(self, key: str, data: list[Data]) -> None:
+        self.discard(key)
+
+        size = self._estimate_size(data)
+        if self.max_size_bytes is not None and size > self.max_size_bytes:
+            return  # Would evict everything and still not fit
+
+        self._entries[key] = (data, size)
+        self._size_bytes += size
+
+        # Evict least recently used entries
+        while self.max_size_bytes is not None and self._size_bytes > self.max_size_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+
+    def _file_path(self, key: str) -> Path | None:
+        if self.path is None:
+            return None
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return Path(self.path) / f"{digest}.arrow"
+
+    @staticmethod
+    def _estimate_size(data: list[Data]) -> int:
+        # Data objects are fixed size per type, so sample the first
+        if not data:
+            return sys.getsizeof(data)
+        return sys.getsizeof(data) + len(data) * sys.getsizeof(data[0])
@@ -17,18 +17,19 @@ from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
-from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.identifiers cimport InstrumentId
 
 
 cdef class BacktestEngine:
     cdef object _config
-    cdef Clock _clock
+    cdef TestClock _clock
     cdef Logger _log
     cdef TimeEventAccumulatorAPI _accumulator
 
@@ -43,12 +44,30 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict[Venue, SimulatedExchange] _venues
+    cdef dict[InstrumentId, SimulatedExchange] _instrument_exchanges
+    cdef dict[type, int] _data_dispatch
     cdef list[Data] _data
+    cdef list[list[Data]] _data_runs
+    cdef uint64_t[::1] _data_ts_init
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
 
+    cdef list[TestClock] _clocks
+    cdef dict[TestClock, int] _clock_indices
+    cdef list _clock_deadlines
+    cdef list _deadline_heap
+    cdef list[TestClock] _timers_changed
+    cdef uint64_t _clocks_version
+
+    cdef void _merge_data_runs(self)
     cdef Data _next(self)
+    cdef int _dispatch_code(self, Data data)
+    cdef SimulatedExchange _exchange_for(self, InstrumentId instrument_id)
+    cdef void _process_exchanges(self, uint64_t ts_now)
+    cdef void _sync_clocks(self)
+    cdef void _update_deadline(self, int index)
+    cdef void _update_changed_deadlines(self)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -13,9 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 import pickle
 from decimal import Decimal
 
+import cython
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.accounting.error import AccountError
@@ -29,12 +32,15 @@ from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.data.config import DataEngineConfig
 from nautilus_trader.execution.config import ExecEngineConfig
 from nautilus_trader.model import NAUTILUS_PYO3_DATA_TYPES
+from nautilus_trader.persistence.stream import DataStreamReader
+from nautilus_trader.persistence.stream import write_data_stream
 from nautilus_trader.risk.config import RiskEngineConfig
 from nautilus_trader.system.kernel import NautilusKernel
 from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -54,6 +60,7 @@ from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.component cimport TimeEventHandler
 from nautilus_trader.common.component cimport get_component_clocks
+from nautilus_trader.common.component cimport get_component_clocks_version
 from nautilus_trader.common.component cimport log_level_from_str
 from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
@@ -97,6 +104,16 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef enum _DataDispatch:
+    _DISPATCH_NONE = 0
+    _DISPATCH_ORDER_BOOK_DELTA = 1
+    _DISPATCH_ORDER_BOOK_DELTAS = 2
+    _DISPATCH_QUOTE_TICK = 3
+    _DISPATCH_TRADE_TICK = 4
+    _DISPATCH_BAR = 5
+    _DISPATCH_INSTRUMENT_STATUS = 6
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -129,11 +146,23 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
+        self._instrument_exchanges: dict[InstrumentId, SimulatedExchange] = {}
+        self._data_dispatch: dict[type, int] = {}
         self._data: list[Data] = []
+        self._data_runs: list[list[Data]] = []
+        self._data_ts_init = None  # Built lazily from the merged stream
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
 
+        # Component clocks (sharing the kernel clocks time) and their next timer deadlines
+        self._clocks = None
+        self._clock_indices = {}
+        self._clock_deadlines = []
+        self._deadline_heap = []  # (deadline_ns, clock index) with stale entries skipped
+        self._timers_changed = []  # Clocks with timers set or cancelled since last advance
+        self._clocks_version = 0
+
         # Timing
         self._run_started: datetime | None = None
         self._run_finished: datetime | None = None
@@ -143,6 +172,7 @@ cdef class BacktestEngine:
         # Build core system kernel
         self._kernel = NautilusKernel(name=type(self).__name__, config=config)
         self._instance_id = self._kernel.instance_id
+        self._clock = self._kernel.clock
         self._log = Logger(type(self).__name__)
 
         self._data_engine: DataEngine = self._kernel.data_engine
@@ -331,6 +361,7 @@ cdef class BacktestEngine:
         list[Data]
 
         """
+        self._merge_data_runs()
         return self._data.copy()
 
     @property
@@ -658,10 +689,17 @@ cdef class BacktestEngine:
                     data_added_str = f"{type(first.data).__name__} "
 
         # Add data
-        self._data.extend(data)
+        self._data_ts_init = None
 
         if sort:
-            self._data = sorted(self._data, key=lambda x: x.ts_init)
+            # Hold the batch as its own sorted run, merged lazily with the rest of the stream
+            if _is_sorted_by_ts_init(data):
+                self._data_runs.append(list(data))
+            else:
+                self._data_runs.append(sorted(data, key=lambda x: x.ts_init))
+        else:
+            self._merge_data_runs()
+            self._data.extend(data)
 
         self._log.info(
             f"Added {len(data):,} {data_added_str} element{'' if len(data) == 1 else 's'}",
@@ -676,6 +714,7 @@ cdef class BacktestEngine:
         bytes
 
         """
+        self._merge_data_runs()
         return pickle.dumps(self._data)
 
     def load_pickled_data(self, bytes data) -> None:
@@ -697,12 +736,74 @@ cdef class BacktestEngine:
         Condition.not_none(data, "data")
 
         self._data = pickle.loads(data)
+        self._data_runs.clear()
+        self._data_ts_init = None
 
         self._log.info(
             f"Loaded {len(self._data):,} data "
             f"element{'' if len(data) == 1 else 's'} from pickle",
         )
 
+    def dump_data_ipc(self, str path) -> None:
+        """
+        Write the internal data stream to the given directory as Arrow IPC files.
+
+        The data is written as one file per data type and instrument (or bar type),
+        together with the global ordering of the stream, for reloading with
+        `.load_data_ipc()` (or in chunks with a `DataStreamReader`).
+
+        Parameters
+        ----------
+        path : str
+            The local directory to write to (created if it does not exist).
+
+        Raises
+        ------
+        ValueError
+            If the engine has no data.
+        TypeError
+            If the data contains a type which cannot be serialized to Arrow.
+
+        """
+        Condition.not_none(path, "path")
+
+        self._merge_data_runs()
+        write_data_stream(path, self._data)
+
+    def load_data_ipc(self, str path, int chunk_size = 1_000_000) -> None:
+        """
+        Load the data stream written by `.dump_data_ipc()` from the given directory
+        directly into the internal data stream (replacing any existing data).
+
+        The Arrow IPC files are memory mapped and decoded in chunks, so only the
+        decoded data is held in memory.
+
+        Parameters
+        ----------
+        path : str
+            The local directory the data stream was written to.
+        chunk_size : int, default 1_000_000
+            The maximum number of data elements to decode at a time.
+
+        Warnings
+        --------
+        This low-level direct access method makes the following assumptions:
+         - The data was written from a call to `.dump_data_ipc()` (so is already sorted).
+         - All required instruments have been added to the engine.
+
+        """
+        Condition.not_none(path, "path")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        self._data = DataStreamReader(path).read_all(chunk_size)
+        self._data_runs.clear()
+        self._data_ts_init = None
+
+        self._log.info(
+            f"Loaded {len(self._data):,} data "
+            f"element{'' if len(self._data) == 1 else 's'} from Arrow IPC",
+        )
+
     def add_actor(self, actor: Actor) -> None:
         """
         Add the given actor to the backtest engine.
@@ -826,6 +927,9 @@ cdef class BacktestEngine:
         self._run_config_id = None
         self._run_id = None
 
+        # Rebuild component clock deadlines on the next run
+        self._clocks = None
+
         # Reset timing
         self._iteration = 0
         self._index = 0
@@ -844,6 +948,8 @@ cdef class BacktestEngine:
 
         """
         self._data.clear()
+        self._data_runs.clear()
+        self._data_ts_init = None
         self._data_len = 0
         self._index = 0
 
@@ -1001,6 +1107,9 @@ cdef class BacktestEngine:
         end: datetime | str | int | None = None,
         run_config_id: str | None = None,
     ):
+        # Merge all added data into a single stream sorted by `ts_init`
+        self._merge_data_runs()
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
         # Time range check and set
@@ -1021,10 +1130,9 @@ cdef class BacktestEngine:
         Condition.true(start_ns < end_ns, "start was >= end")
         Condition.not_empty(self._data, "data")
 
-        # Set clocks
-        cdef TestClock clock
-        for clock in get_component_clocks(self._instance_id):
-            clock.set_time(start_ns)
+        # Set clocks (all component clocks share the kernel clocks time)
+        self._sync_clocks()
+        self._clock.set_time(start_ns)
 
         cdef SimulatedExchange exchange
         if self._iteration == 0:
@@ -1061,15 +1169,16 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
+        if self._data_ts_init is None:
+            self._data_ts_init = np.fromiter(
+                (x.ts_init for x in self._data),
+                dtype=np.uint64,
+                count=len(self._data),
+            )
 
-        # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        # Set starting index and stream length to the slice within [start, end]
+        self._index = _bisect_left(self._data_ts_init, start_ns)
+        self._data_len = _bisect_right(self._data_ts_init, end_ns)
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
@@ -1078,41 +1187,39 @@ cdef class BacktestEngine:
         cdef Data data = self._next()
         cdef CVec raw_handlers
         cdef SimulatedExchange venue
+        cdef int dispatch
         try:
             while data is not None:
-                if data.ts_init > end_ns:
-                    # End of backtest
-                    break
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through venue
-                if isinstance(data, OrderBookDelta):
-                    venue = self._venues[data.instrument_id.venue]
+                dispatch = self._dispatch_code(data)
+                if dispatch == _DISPATCH_ORDER_BOOK_DELTA:
+                    venue = self._exchange_for(data.instrument_id)
                     venue.process_order_book_delta(data)
-                elif isinstance(data, OrderBookDeltas):
-                    venue = self._venues[data.instrument_id.venue]
+                elif dispatch == _DISPATCH_ORDER_BOOK_DELTAS:
+                    venue = self._exchange_for(data.instrument_id)
                     venue.process_order_book_deltas(data)
-                elif isinstance(data, QuoteTick):
-                    venue = self._venues[data.instrument_id.venue]
+                elif dispatch == _DISPATCH_QUOTE_TICK:
+                    venue = self._exchange_for(data.instrument_id)
                     venue.process_quote_tick(data)
-                elif isinstance(data, TradeTick):
-                    venue = self._venues[data.instrument_id.venue]
+                elif dispatch == _DISPATCH_TRADE_TICK:
+                    venue = self._exchange_for(data.instrument_id)
                     venue.process_trade_tick(data)
-                elif isinstance(data, Bar):
-                    venue = self._venues[data.bar_type.instrument_id.venue]
+                elif dispatch == _DISPATCH_BAR:
+                    venue = self._exchange_for(data.bar_type.instrument_id)
                     venue.process_bar(data)
-                elif isinstance(data, InstrumentStatus):
-                    venue = self._venues[data.instrument_id.venue]
+                elif dispatch == _DISPATCH_INSTRUMENT_STATUS:
+                    venue = self._exchange_for(data.instrument_id)
                     venue.process_instrument_status(data)
 
                 self._data_engine.process(data)
 
                 # Process all exchange messages
-                for exchange in self._venues.values():
-                    exchange.process(data.ts_init)
+                self._process_exchanges(data.ts_init)
 
                 last_ns = data.ts_init
                 data = self._next()
@@ -1150,23 +1257,153 @@ cdef class BacktestEngine:
             )
             vec_time_event_handlers_drop(raw_handlers)
 
+    cdef void _merge_data_runs(self):
+        if not self._data_runs:
+            return
+
+        cdef list[list[Data]] runs = self._data_runs
+        if self._data:
+            if not _is_sorted_by_ts_init(self._data):
+                # Data was previously added without sorting
+                self._data.sort(key=lambda x: x.ts_init)
+            runs.insert(0, self._data)
+
+        if len(runs) == 1:
+            self._data = runs[0]
+        else:
+            # K-way merge of the sorted runs (stable, earlier runs first for equal `ts_init`)
+            self._data = list(heapq.merge(*runs, key=lambda x: x.ts_init))
+
+        self._data_runs = []
+
     cdef Data _next(self):
         cdef uint64_t cursor = self._index
         self._index += 1
         if cursor < self._data_len:
             return self._data[cursor]
 
-    cdef CVec _advance_time(self, uint64_t ts_now):
-        cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
+    cdef int _dispatch_code(self, Data data):
+        cdef type data_type = type(data)
+        cdef object code = self._data_dispatch.get(data_type)
+        if code is not None:
+            return code
+
+        # Resolve and cache the dispatch code for this data type
+        if isinstance(data, OrderBookDelta):
+            code = _DISPATCH_ORDER_BOOK_DELTA
+        elif isinstance(data, OrderBookDeltas):
+            code = _DISPATCH_ORDER_BOOK_DELTAS
+        elif isinstance(data, QuoteTick):
+            code = _DISPATCH_QUOTE_TICK
+        elif isinstance(data, TradeTick):
+            code = _DISPATCH_TRADE_TICK
+        elif isinstance(data, Bar):
+            code = _DISPATCH_BAR
+        elif isinstance(data, InstrumentStatus):
+            code = _DISPATCH_INSTRUMENT_STATUS
+        else:
+            code = _DISPATCH_NONE
+
+        self._data_dispatch[data_type] = code
+        return code
+
+    cdef SimulatedExchange _exchange_for(self, InstrumentId instrument_id):
+        cdef SimulatedExchange exchange = self._instrument_exchanges.get(instrument_id)
+        if exchange is None:
+            exchange = self._venues[instrument_id.venue]
+            self._instrument_exchanges[instrument_id] = exchange
+        return exchange
+
+    cdef void _process_exchanges(self, uint64_t ts_now):
+        # All exchanges share the kernel clock, idle exchanges only need the time set
+        self._clock.set_time(ts_now)
+
+        cdef SimulatedExchange exchange
+        for exchange in self._venues.values():
+            if not exchange.is_idle(ts_now):
+                exchange.process(ts_now)
+
+    cdef void _sync_clocks(self):
+        cdef uint64_t version = get_component_clocks_version()
+        if self._clocks is not None and version == self._clocks_version:
+            return  # No clocks registered or deregistered
+
+        self._clocks_version = version
+        self._clocks = get_component_clocks(self._instance_id)
+        self._clock_indices = {}
+        self._clock_deadlines = [None] * len(self._clocks)
+        self._deadline_heap = []
+        self._timers_changed.clear()
+
+        cdef int i
+        cdef TestClock clock
+        for i, clock in enumerate(self._clocks):
+            if clock is not self._clock:
+                clock.share_time(self._clock)
+            clock._timers_changed = self._timers_changed
+            self._clock_indices[clock] = i
+            self._update_deadline(i)
+
+    cdef void _update_deadline(self, int index):
+        cdef TestClock clock = self._clocks[index]
+        cdef uint64_t deadline = clock.next_deadline_ns()
+        if deadline == self._clock_deadlines[index]:
+            return  # Already in heap
+
+        self._clock_deadlines[index] = deadline
+        if deadline == UINT64_MAX:
+            return  # No active timers
+
+        heapq.heappush(self._deadline_heap, (deadline, index))
+        if len(self._deadline_heap) > 2 * len(self._clocks):
+            # Drop stale entries (from timers reset or cancelled before firing)
+            self._deadline_heap[:] = [
+                (next_time_ns, i)
+                for i, next_time_ns in enumerate(self._clock_deadlines)
+                if next_time_ns is not None and next_time_ns != UINT64_MAX
+            ]
+            heapq.heapify(self._deadline_heap)
+
+    cdef void _update_changed_deadlines(self):
+        if not self._timers_changed:
+            return
 
         cdef TestClock clock
-        for clock in clocks:
+        cdef object index
+        for clock in self._timers_changed:
+            index = self._clock_indices.get(clock)
+            if index is not None:
+                self._update_deadline(index)
+
+        self._timers_changed.clear()
+
+    cdef CVec _advance_time(self, uint64_t ts_now):
+        self._sync_clocks()
+        self._update_changed_deadlines()
+
+        # Only clocks with a timer due by `ts_now` need advancing
+        cdef list heap = self._deadline_heap
+        cdef set due = set()
+        cdef uint64_t deadline
+        cdef int index
+        while heap and heap[0][0] <= ts_now:
+            deadline, index = heapq.heappop(heap)
+            if self._clock_deadlines[index] == deadline:
+                due.add(index)
+
+        # Advance in registration order (for a deterministic event order)
+        cdef list[int] due_indices = sorted(due)
+        cdef TestClock clock
+        for index in due_indices:
+            clock = self._clocks[index]
             time_event_accumulator_advance_clock(
                 &self._accumulator,
                 &clock._mem,
                 ts_now,
                 False,
             )
+            self._clock_deadlines[index] = None  # Popped from heap
+            self._update_deadline(index)
 
         cdef CVec raw_handlers = time_event_accumulator_drain(&self._accumulator)
 
@@ -1179,8 +1416,8 @@ cdef class BacktestEngine:
 
         # Set all clocks to now
         set_logging_clock_static_time(ts_now)
-        for clock in clocks:
-            clock.set_time(ts_now)
+        self._sync_clocks()
+        self._clock.set_time(ts_now)
 
         # Return all remaining events to be handled (at `ts_now`)
         return raw_handlers
@@ -1198,10 +1435,8 @@ cdef class BacktestEngine:
             uint64_t ts_last_init = 0
             TimeEventHandler_t raw_handler
             TimeEvent event
-            TestClock clock
             PyObject *raw_callback
             object callback
-            SimulatedExchange exchange
         for i in range(raw_handler_vec.len):
             raw_handler = <TimeEventHandler_t>raw_handlers[i]
             ts_event_init = raw_handler.event.ts_init
@@ -1210,8 +1445,8 @@ cdef class BacktestEngine:
 
             # Set all clocks to event timestamp
             set_logging_clock_static_time(ts_event_init)
-            for clock in get_component_clocks(self._instance_id):
-                clock.set_time(ts_event_init)
+            self._sync_clocks()
+            self._clock.set_time(ts_event_init)
 
             event = TimeEvent.from_mem_c(raw_handler.event)
 
@@ -1223,8 +1458,7 @@ cdef class BacktestEngine:
             if ts_event_init != ts_last_init:
                 # Process exchange messages
                 ts_last_init = ts_event_init
-                for exchange in self._venues.values():
-                    exchange.process(ts_event_init)
+                self._process_exchanges(ts_event_init)
 
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
@@ -1401,3 +1635,45 @@ cdef class BacktestEngine:
                 clock=self._kernel.clock,
             )
             self._kernel.data_engine.register_client(client)
+
+
+cdef bint _is_sorted_by_ts_init(list data):
+    cdef uint64_t last_ns = 0
+    cdef uint64_t ts_init
+    cdef Data item
+    for item in data:
+        ts_init = item.ts_init
+        if ts_init < last_ns:
+            return False
+        last_ns = ts_init
+    return True
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef uint64_t _bisect_left(const uint64_t[::1] values, uint64_t target) noexcept nogil:
+    cdef uint64_t lo = 0
+    cdef uint64_t hi = values.shape[0]
+    cdef uint64_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef uint64_t _bisect_right(const uint64_t[::1] values, uint64_t target) noexcept nogil:
+    cdef uint64_t lo = 0
+    cdef uint64_t hi = values.shape[0]
+    cdef uint64_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if target < values[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
@@ -138,6 +138,7 @@ cdef class SimulatedExchange:
     cpdef void process_trade_tick(self, TradeTick tick)
     cpdef void process_bar(self, Bar bar)
     cpdef void process_instrument_status(self, InstrumentStatus data)
+    cdef bint is_idle(self, uint64_t ts_now)
     cpdef void process(self, uint64_t ts_now)
     cpdef void reset(self)
 
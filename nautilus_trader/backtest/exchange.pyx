@@ -808,6 +808,14 @@ cdef class SimulatedExchange:
 
         matching_engine.process_status(data.action)
 
+    cdef bint is_idle(self, uint64_t ts_now):
+        # If processing the exchange to `ts_now` would have no effect other than setting the clock
+        if self.modules or self._message_queue:
+            return False
+        if self._inflight_queue and self._inflight_queue[0][0][0] <= ts_now:
+            return False
+        return True
+
     cpdef void process(self, uint64_t ts_now):
         """
         Process the exchange to the given time.
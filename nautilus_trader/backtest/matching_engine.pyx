@@ -1295,7 +1295,15 @@ cdef class OrderMatchingEngine:
 
         self._core.iterate(timestamp_ns)
 
-        cdef list orders = self._core.get_orders()
+        # Move market back to targets
+        if self._has_targets:
+            self._core.set_bid_raw(self._target_bid)
+            self._core.set_ask_raw(self._target_ask)
+            self._core.set_last_raw(self._target_last)
+            self._has_targets = False
+
+        # Only orders with an expire time or trailing stop need managing
+        cdef list orders = self._core.get_orders_managed()
         cdef Order order
         for order in orders:
             if order.is_closed_c():
@@ -1314,13 +1322,6 @@ cdef class OrderMatchingEngine:
             if order.order_type == OrderType.TRAILING_STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_LIMIT:
                 self._update_trailing_stop_order(order)
 
-            # Move market back to targets
-            if self._has_targets:
-                self._core.set_bid_raw(self._target_bid)
-                self._core.set_ask_raw(self._target_ask)
-                self._core.set_last_raw(self._target_last)
-                self._has_targets = False
-
         # Reset any targets after iteration
         self._target_bid = 0
         self._target_ask = 0
@@ -2296,6 +2297,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex order in the matching core at any updated price
+        self._core.update_order(order)
+
     cdef void _generate_order_canceled(self, Order order, VenueOrderId venue_order_id):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -2328,6 +2332,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Reindex order in the matching core at its limit price
+        self._core.update_order(order)
+
     cdef void _generate_order_expired(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
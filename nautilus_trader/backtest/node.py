@@ -13,6 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
+import tempfile
+from collections import Counter
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
 from decimal import Decimal
 
 import pandas as pd
@@ -20,6 +28,7 @@ import pandas as pd
 from nautilus_trader.backtest.config import BacktestDataConfig
 from nautilus_trader.backtest.config import BacktestRunConfig
 from nautilus_trader.backtest.config import BacktestVenueConfig
+from nautilus_trader.backtest.data_cache import BacktestDataCache
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.results import BacktestResult
@@ -42,6 +51,7 @@ from nautilus_trader.model.enums import book_type_from_str
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
@@ -56,6 +66,11 @@ class BacktestNode:
     ----------
     configs : list[BacktestRunConfig]
         The backtest run configurations.
+    data_cache_size_bytes : int, optional
+        The maximum estimated size of the loaded data held in memory for reuse by
+        runs with the same data configs. If ``None`` then the size is unbounded.
+        Worker processes hold no loaded data between runs, and only read the data
+        shared by several runs from the files exported by this node.
 
     Raises
     ------
@@ -63,10 +78,16 @@ class BacktestNode:
         If `configs` is ``None`` or empty.
     ValueError
         If `configs` contains a type other than `BacktestRunConfig`.
+    ValueError
+        If `data_cache_size_bytes` is negative (< 0).
 
     """
 
-    def __init__(self, configs: list[BacktestRunConfig]):
+    def __init__(
+        self,
+        configs: list[BacktestRunConfig],
+        data_cache_size_bytes: int | None = None,
+    ):
         PyCondition.not_none(configs, "configs")
         PyCondition.not_empty(configs, "configs")
         PyCondition.true(
@@ -80,6 +101,13 @@ class BacktestNode:
         self._engines: dict[str, BacktestEngine] = {}
         self._log_guard: nautilus_pyo3.LogGuard | LogGuard | None = None
 
+        # Instruments loaded per catalog and instrument ID, shared read-only between runs
+        self._instruments: dict[tuple[str, str | None, str | None], list[Instrument]] = {}
+
+        # Data loaded for one-shot runs, shared read-only between runs with the same query
+        self._data_cache = BacktestDataCache(max_size_bytes=data_cache_size_bytes)
+        self._data_refs: Counter[str] | None = None  # Remaining runs per data cache key
+
     @property
     def configs(self) -> list[BacktestRunConfig]:
         """
@@ -132,20 +160,53 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> list[BacktestResult]:
+    def run(self, workers: int = 1) -> list[BacktestResult]:
         """
-        Run the backtest node which will synchronously execute the list of loaded
-        backtest run configs.
+        Run the backtest node which will execute the list of loaded backtest run
+        configs.
+
+        With a single worker the configs are run synchronously in this process. With
+        more than one worker the configs are sharded across a pool of worker processes,
+        each of which builds its own engines, and only the results are returned.
 
         Any exceptions raised from a backtest will be printed to stdout and
-        the next backtest run will commence (if any).
+        the next backtest run will commence (if any). If a worker process crashes then
+        the runs lost with its pool are rerun, each in its own worker process.
+
+        Parameters
+        ----------
+        workers : int, default 1
+            The maximum number of worker processes to run configs in.
 
         Returns
         -------
         list[BacktestResult]
-            The results of the backtest runs.
+            The results of the successful backtest runs (in the order of the configs).
+
+        Raises
+        ------
+        ValueError
+            If `workers` is not positive (> 0).
+
+        Warnings
+        --------
+        Worker processes are started with the 'spawn' method, so a script calling this
+        with multiple workers must guard its entry point with `if __name__ == "__main__":`.
+        Engines are not retained by the node for runs in worker processes.
 
         """
+        PyCondition.positive_int(workers, "workers")
+
+        self._data_refs = Counter(
+            BacktestDataCache.key(data_config)
+            for config in self._configs
+            if config.batch_size_bytes is None
+            for data_config in config.data
+        )
+
+        if workers > 1 and len(self._configs) > 1:
+            return self._run_parallel(workers)
+
         results: list[BacktestResult] = []
         for config in self._configs:
             try:
@@ -165,6 +226,84 @@ class BacktestNode:
 
         return results
 
+    def _run_parallel(self, workers: int) -> list[BacktestResult]:
+        total = len(self._configs)
+        results: list[BacktestResult | None] = [None] * total
+        finished: set[int] = set()
+
+        with tempfile.TemporaryDirectory(prefix="nautilus-backtest-data-") as data_cache_path:
+            self._export_shared_data(data_cache_path)
+
+            with ProcessPoolExecutor(
+                max_workers=min(workers, total),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = {
+                    executor.submit(_run_config_in_worker, config, data_cache_path): i
+                    for i, config in enumerate(self._configs)
+                }
+                broken = self._collect_results(futures, results, finished, retry_broken=True)
+
+            # A crashed worker process breaks the pool and fails all its unfinished runs
+            # (without identifying the crashed run), so rerun each of those in its own
+            # worker process to isolate the failure to the crashed run
+            if broken:
+                with ThreadPoolExecutor(max_workers=min(workers, len(broken))) as executor:
+                    futures = {
+                        executor.submit(_run_config_isolated, self._configs[i], data_cache_path): i
+                        for i in broken
+                    }
+                    self._collect_results(futures, results, finished, retry_broken=False)
+
+        return [result for result in results if result is not None]
+
+    def _collect_results(
+        self,
+        futures: dict[Future, int],
+        results: list[BacktestResult | None],
+        finished: set[int],
+        retry_broken: bool,
+    ) -> list[int]:
+        # Return the indexes of the configs with runs lost to a broken process pool
+        log = Logger(type(self).__name__)
+        broken: list[int] = []
+        for future in as_completed(futures):
+            i = futures[future]
+            config = self._configs[i]
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool as e:
+                if retry_broken:
+                    broken.append(i)
+                    continue
+                log.error(f"Error running backtest: {e}")
+                log.info(f"Config: {config}")
+            except Exception as e:
+                # A failed run does not halt the other backtests
+                log.error(f"Error running backtest: {e}")
+                log.info(f"Config: {config}")
+            finished.add(i)
+            log.info(f"Completed {len(finished)}/{len(self._configs)} backtest runs ({config.id})")
+
+        return broken
+
+    def _export_shared_data(self, path: str) -> None:
+        # Read data referenced by several runs once, then share with the workers
+        # as memory mapped Arrow IPC files (rather than every worker reading it)
+        assert self._data_refs is not None
+        cache = BacktestDataCache(path=path)
+        exported: set[str] = set()
+        for config in self._configs:
+            if config.batch_size_bytes is not None:
+                continue
+            for data_config in config.data:
+                key = BacktestDataCache.key(data_config)
+                if self._data_refs[key] < 2 or key in exported:
+                    continue
+                exported.add(key)
+                result = self.load_data_config(data_config)
+                cache.export(key, result.data, data_config.data_type)
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:  # noqa: C901
         venue_ids: list[Venue] = []
         for config in configs:
@@ -258,14 +397,52 @@ class BacktestNode:
         # Add instruments
         for config in data_configs:
             if is_nautilus_class(config.data_type):
-                catalog = self.load_catalog(config)
-                instruments = catalog.instruments(instrument_ids=config.instrument_id)
-                for instrument in instruments or []:
+                for instrument in self._load_instruments(config):
                     if instrument.id not in engine.cache.instrument_ids():
                         engine.add_instrument(instrument)
 
         return engine
 
+    def _load_instruments(self, config: BacktestDataConfig) -> list[Instrument]:
+        key = (
+            config.catalog_path,
+            config.catalog_fs_protocol,
+            str(config.instrument_id) if config.instrument_id else None,
+        )
+        instruments = self._instruments.get(key)
+        if instruments is None:
+            catalog = self.load_catalog(config)
+            instruments = catalog.instruments(instrument_ids=config.instrument_id) or []
+            self._instruments[key] = instruments
+        return instruments
+
+    def _load_data(self, config: BacktestDataConfig) -> CatalogDataResult:
+        key = BacktestDataCache.key(config)
+        data = self._data_cache.get(key, data_cls=config.data_type)
+        if data is None:
+            result = self.load_data_config(config)
+            if self._data_refs is not None and self._data_refs[key] > 1:
+                self._data_cache.put(key, result.data, data_cls=config.data_type)
+            return result
+
+        instruments = self._load_instruments(config) if config.instrument_id else None
+        return CatalogDataResult(
+            data_cls=config.data_type,
+            data=data,
+            instrument=instruments[0] if instruments else None,
+            client_id=ClientId(config.client_id) if config.client_id else None,
+        )
+
+    def _release_data(self, data_configs: list[BacktestDataConfig]) -> None:
+        if self._data_refs is None:
+            return  # Remaining runs unknown, rely on cache eviction
+
+        for config in data_configs:
+            key = BacktestDataCache.key(config)
+            self._data_refs[key] -= 1
+            if self._data_refs[key] <= 0:
+                self._data_cache.discard(key)
+
     def _load_engine_data(self, engine: BacktestEngine, result: CatalogDataResult) -> None:
         if is_nautilus_class(result.data_cls):
             engine.add_data(data=result.data)
@@ -370,7 +547,7 @@ class BacktestNode:
             engine.logger.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
-            result: CatalogDataResult = self.load_data_config(config)
+            result: CatalogDataResult = self._load_data(config)
             if config.instrument_id and result.instrument is None:
                 engine.logger.warning(
                     f"Requested instrument_id={result.instrument} from data_config not found in catalog",
@@ -388,6 +565,8 @@ class BacktestNode:
             t2 = pd.Timestamp.now()
             engine.logger.info(f"Engine load took {pd.Timedelta(t2 - t1)}s")
 
+        self._release_data(data_configs)
+
         engine.run(run_config_id=run_config_id)
         engine.dispose()
 
@@ -422,3 +601,41 @@ class BacktestNode:
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+        self._data_cache.clear()
+
+
+# Node for the runs in a worker process (reused so catalogs and instruments are shared)
+_worker_node: BacktestNode | None = None
+
+
+def _run_config_in_worker(config: BacktestRunConfig, data_cache_path: str) -> BacktestResult:
+    global _worker_node
+    if _worker_node is None:
+        # Remaining runs are unknown in a worker, so hold no data in memory and only
+        # read the shared data exported by the parent (never exporting from here)
+        _worker_node = BacktestNode(configs=[config], data_cache_size_bytes=0)
+        _worker_node._data_cache.path = data_cache_path
+
+    try:
+        return _worker_node._run(
+            run_config_id=config.id,
+            engine_config=config.engine,
+            venue_configs=config.venues,
+            data_configs=config.data,
+            batch_size_bytes=config.batch_size_bytes,
+        )
+    except Exception as e:
+        # Re-raise as a plain error which can always be returned to the parent
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+    finally:
+        _worker_node._engines.pop(config.id, None)
+
+
+def _run_config_isolated(config: BacktestRunConfig, data_cache_path: str) -> BacktestResult:
+    # Run the config in its own worker process, so a crash only fails this run
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        return executor.submit(_run_config_in_worker, config, data_cache_path).result()
@@ -61,6 +61,10 @@ cdef class Cache(CacheFacade):
 
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef dict _xrate_quotes
+    cdef dict _xrate_tables
+    cdef readonly dict _xrate_rates
+    cdef dict _xrate_dependents
     cdef dict _quote_ticks
     cdef dict _trade_ticks
     cdef dict _order_books
@@ -104,6 +108,8 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef dict _order_views
+    cdef dict _position_views
     cdef bint _drop_instruments_on_reset
 
     cdef readonly int tick_capacity
@@ -132,6 +138,8 @@ cdef class Cache(CacheFacade):
     cpdef void flush_db(self)
 
     cdef tuple _build_quote_table(self, Venue venue)
+    cdef tuple _get_xrate_quote(self, InstrumentId instrument_id)
+    cdef void _update_xrate_quote(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
@@ -140,6 +148,13 @@ cdef class Cache(CacheFacade):
     cdef set _build_position_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
     cdef list _get_positions_for_ids(self, set position_ids, PositionSide side)
+    cdef set _order_view_index(self, int kind)
+    cdef set _position_view_index(self, int kind)
+    cdef list _query_orders(self, int kind, Venue venue, InstrumentId instrument_id, StrategyId strategy_id, OrderSide side)
+    cdef list _query_positions(self, int kind, Venue venue, InstrumentId instrument_id, StrategyId strategy_id, PositionSide side)
+    cdef void _update_order_views(self, Order order)
+    cdef void _update_position_views(self, Position position)
+    cdef void _clear_views(self)
     cdef void _assign_position_id_to_contingencies(self, Order order)
     cpdef Money calculate_unrealized_pnl(self, Position position)
 
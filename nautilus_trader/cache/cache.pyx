@@ -17,8 +17,10 @@ import copy
 import pickle
 import time
 import uuid
+from bisect import bisect_left
 from collections import deque
 from decimal import Decimal
+from operator import attrgetter
 
 from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.core.rust.model import PriceType as PriceType_py
@@ -71,6 +73,17 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+# Query view kinds
+cdef int _VIEW_ALL = 0
+cdef int _VIEW_OPEN = 1
+cdef int _VIEW_CLOSED = 2
+cdef int _VIEW_EMULATED = 3
+cdef int _VIEW_INFLIGHT = 4
+
+_order_view_key = attrgetter("client_order_id")
+_position_view_key = attrgetter("id")
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -117,6 +130,10 @@ cdef class Cache(CacheFacade):
         # Caches
         self._general: dict[str, bytes] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
+        self._xrate_quotes: dict[Venue, dict[InstrumentId, tuple[float, float] | None]] = {}
+        self._xrate_tables: dict[Venue, tuple[dict[str, float], dict[str, float]]] = {}
+        self._xrate_rates: dict[Venue, dict[tuple, float]] = {}
+        self._xrate_dependents: dict[Venue, dict[str | None, set[tuple]]] = {}
         self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
         self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
         self._order_books: dict[InstrumentId, OrderBook] = {}
@@ -162,6 +179,11 @@ cdef class Cache(CacheFacade):
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
 
+        # Query views: (venue, instrument_id, strategy_id) -> {view key: sorted list}.
+        # The `None` view key holds the filter set for queries with multiple filters.
+        self._order_views: dict[tuple, dict] = {}
+        self._position_views: dict[tuple, dict] = {}
+
         self._log.info("READY")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -274,6 +296,8 @@ cdef class Cache(CacheFacade):
         else:
             self._orders = {}
 
+        self._clear_views()
+
         # Assign position IDs to contingent orders
         cdef Order order
         for order in self._orders.values():
@@ -335,6 +359,8 @@ cdef class Cache(CacheFacade):
         else:
             self._positions = {}
 
+        self._clear_views()
+
         cdef int count = len(self._positions)
         self._log.info(
             f"Cached {count} position{'' if count == 1 else 's'} from database",
@@ -718,6 +744,7 @@ cdef class Cache(CacheFacade):
         self._index_actors.clear()
         self._index_strategies.clear()
         self._index_exec_algorithms.clear()
+        self._clear_views()
 
         self._log.debug(f"Cleared index")
 
@@ -731,6 +758,10 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrate_quotes.clear()
+        self._xrate_tables.clear()
+        self._xrate_rates.clear()
+        self._xrate_dependents.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
         self._order_books.clear()
@@ -1152,6 +1183,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(instrument_id)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1200,6 +1234,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1238,6 +1277,9 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(instrument_id)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1318,6 +1360,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate_quote(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1356,6 +1403,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._update_xrate_quote(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}")
 
@@ -1544,6 +1592,8 @@ cdef class Cache(CacheFacade):
         else:
             self._index_orders_emulated.add(order.client_order_id)
 
+        self._update_order_views(order)
+
         self._log.debug(f"Added {order}")
 
         if position_id is not None:
@@ -1639,6 +1689,11 @@ cdef class Cache(CacheFacade):
         else:
             strategy_positions.add(position_id)
 
+        # Re-indexing an existing position under another strategy invalidates the views
+        cdef Position position = self._positions.get(position_id)
+        if position is not None and position.strategy_id != strategy_id:
+            self._position_views.clear()
+
         self._log.debug(
             f"Indexed {position_id!r}, "
             f"client_order_id={client_order_id}, "
@@ -1695,6 +1750,8 @@ cdef class Cache(CacheFacade):
         else:
             instrument_positions.add(position.id)
 
+        self._update_position_views(position)
+
         self._log.debug(f"Added Position(id={position.id.to_str()}, strategy_id={position.strategy_id.to_str()})")
 
         if self._database is None:
@@ -1855,6 +1912,8 @@ cdef class Cache(CacheFacade):
         else:
             self._index_orders_emulated.add(order.client_order_id)
 
+        self._update_order_views(order)
+
         if self._database is None:
             return
 
@@ -1896,6 +1955,8 @@ cdef class Cache(CacheFacade):
             self._index_positions_closed.add(position.id)
             self._index_positions_open.discard(position.id)
 
+        self._update_position_views(position)
+
         if self._database is None:
             return
 
@@ -1993,6 +2054,8 @@ cdef class Cache(CacheFacade):
         if strategy.id in self._index_strategy_positions:
             del self._index_strategy_positions[strategy.id]
 
+        self._clear_views()
+
         # Update database
         if self._database is not None:
             self._database.delete_strategy(strategy.id)
@@ -2419,48 +2482,143 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
+        # Rates are memoized per venue until a symbol they depend on is repriced
+        cdef dict rates = self._xrate_rates.get(venue)
+        if rates is None:
+            rates = {}
+            self._xrate_rates[venue] = rates
+
+        cdef tuple key = (from_currency.code, to_currency.code, price_type)
+        xrate = rates.get(key)
+        if xrate is not None:
+            return xrate
+
         cdef tuple quotes = self._build_quote_table(venue)
 
-        return self._xrate_calculator.get_rate(
+        xrate = self._xrate_calculator.get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
             bid_quotes=quotes[0],  # Bid
             ask_quotes=quotes[1],  # Ask
         )
+        rates[key] = xrate
+
+        # A direct (or inverse) symbol determines the rate on its own,
+        # otherwise the rate is triangulated and depends on every symbol
+        cdef str symbol = f"{from_currency.code}/{to_currency.code}"
+        if symbol not in quotes[0]:
+            symbol = f"{to_currency.code}/{from_currency.code}"
+            if symbol not in quotes[0]:
+                symbol = None
+
+        cdef dict dependents = self._xrate_dependents.get(venue)
+        if dependents is None:
+            dependents = {}
+            self._xrate_dependents[venue] = dependents
+        dependents.setdefault(symbol, set()).add(key)
+
+        return xrate
 
     cdef tuple _build_quote_table(self, Venue venue):
+        cdef tuple table = self._xrate_tables.get(venue)
+        if table is not None:
+            return table
+
+        cdef InstrumentId instrument_id
+        cdef dict venue_quotes = self._xrate_quotes.get(venue)
+        if venue_quotes is None:
+            # Initialize the venue quotes, which are then updated as data is added
+            venue_quotes = {}
+            for instrument_id in self._xrate_symbols:
+                if instrument_id.venue == venue:
+                    venue_quotes[instrument_id] = self._get_xrate_quote(instrument_id)
+            self._xrate_quotes[venue] = venue_quotes
+
         cdef dict bid_quotes = {}
         cdef dict ask_quotes = {}
+        cdef set symbols = set()
+        cdef set shared_symbols = set()
 
         cdef:
-            InstrumentId instrument_id
             str base_quote
+            tuple quote
+        for instrument_id, quote in venue_quotes.items():
+            base_quote = self._xrate_symbols[instrument_id]
+            if base_quote in symbols:
+                shared_symbols.add(base_quote)
+            symbols.add(base_quote)
+            if quote is None:
+                continue  # No prices for instrument_id
+            bid_quotes[base_quote] = quote[0]
+            ask_quotes[base_quote] = quote[1]
+
+        # Symbols priced by more than one instrument cannot be updated in place
+        table = (bid_quotes, ask_quotes, shared_symbols)
+        self._xrate_tables[venue] = table
+
+        return table
+
+    cdef tuple _get_xrate_quote(self, InstrumentId instrument_id):
+        cdef:
             Price bid_price
             Price ask_price
             Bar bid_bar
             Bar ask_bar
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
+        ticks = self._quote_ticks.get(instrument_id)
+        if ticks:
+            bid_price = ticks[0].bid_price
+            ask_price = ticks[0].ask_price
+        else:
+            # No quotes for instrument_id
+            bid_bar = self._bars_bid.get(instrument_id)
+            ask_bar = self._bars_ask.get(instrument_id)
+            if bid_bar is None or ask_bar is None:
+                return None  # No prices for instrument_id
+            bid_price = bid_bar.close
+            ask_price = ask_bar.close
+
+        return bid_price.as_f64_c(), ask_price.as_f64_c()
+
+    cdef void _update_xrate_quote(self, InstrumentId instrument_id):
+        cdef Venue venue = instrument_id.venue
+        cdef dict venue_quotes = self._xrate_quotes.get(venue)
+        if venue_quotes is None:
+            return  # Venue quotes not yet initialized
+
+        cdef tuple quote = self._get_xrate_quote(instrument_id)
+        if instrument_id in venue_quotes and venue_quotes[instrument_id] == quote:
+            return  # No change to prices
+
+        cdef tuple previous = venue_quotes.get(instrument_id)
+        venue_quotes[instrument_id] = quote
+
+        cdef tuple table = self._xrate_tables.get(venue)
+        if table is None:
+            return  # No quote table or memoized rates for the venue
+
+        cdef str symbol = self._xrate_symbols[instrument_id]
+        if previous is None or quote is None or symbol in table[2]:
+            # The set of priced symbols changed, invalidate the whole venue
+            self._xrate_tables.pop(venue, None)
+            self._xrate_rates.pop(venue, None)
+            self._xrate_dependents.pop(venue, None)
+            return
 
-            ticks = self._quote_ticks.get(instrument_id)
-            if ticks:
-                bid_price = ticks[0].bid_price
-                ask_price = ticks[0].ask_price
-            else:
-                # No quotes for instrument_id
-                bid_bar = self._bars_bid.get(instrument_id)
-                ask_bar = self._bars_ask.get(instrument_id)
-                if bid_bar is None or ask_bar is None:
-                    continue # No prices for instrument_id
-                bid_price = bid_bar.close
-                ask_price = ask_bar.close
+        # Reprice the symbol in place and evict only the rates depending on it
+        table[0][symbol] = quote[0]
+        table[1][symbol] = quote[1]
 
-            bid_quotes[base_quote] = bid_price.as_f64_c()
-            ask_quotes[base_quote] = ask_price.as_f64_c()
+        cdef dict rates = self._xrate_rates.get(venue)
+        cdef dict dependents = self._xrate_dependents.get(venue)
+        if rates is None or dependents is None:
+            return
 
-        return bid_quotes, ask_quotes
+        cdef tuple key
+        for key in dependents.pop(symbol, ()):
+            rates.pop(key, None)
+        for key in dependents.pop(None, ()):
+            rates.pop(key, None)
 
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
@@ -2684,6 +2842,18 @@ cdef class Cache(CacheFacade):
         InstrumentId instrument_id,
         StrategyId strategy_id,
     ):
+        cdef tuple key = None
+        cdef dict views = None
+        if (venue is not None) + (instrument_id is not None) + (strategy_id is not None) > 1:
+            # Intersections are cached with the views for the same filters
+            key = (venue, instrument_id, strategy_id)
+            views = self._order_views.get(key)
+            if views is None:
+                views = {}
+                self._order_views[key] = views
+            elif None in views:
+                return views[None]
+
         cdef set query = None
 
         # Build potential query set
@@ -2700,6 +2870,9 @@ cdef class Cache(CacheFacade):
             else:
                 query = query.intersection(self._index_strategy_orders.get(strategy_id, set()))
 
+        if views is not None:
+            views[None] = query
+
         return query
 
     cdef set _build_position_query_filter_set(
@@ -2708,6 +2881,18 @@ cdef class Cache(CacheFacade):
         InstrumentId instrument_id,
         StrategyId strategy_id,
     ):
+        cdef tuple key = None
+        cdef dict views = None
+        if (venue is not None) + (instrument_id is not None) + (strategy_id is not None) > 1:
+            # Intersections are cached with the views for the same filters
+            key = (venue, instrument_id, strategy_id)
+            views = self._position_views.get(key)
+            if views is None:
+                views = {}
+                self._position_views[key] = views
+            elif None in views:
+                return views[None]
+
         cdef set query = None
 
         # Build potential query set
@@ -2724,6 +2909,9 @@ cdef class Cache(CacheFacade):
             else:
                 query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
 
+        if views is not None:
+            views[None] = query
+
         return query
 
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side):
@@ -2761,6 +2949,189 @@ cdef class Cache(CacheFacade):
 
         return positions
 
+    cdef set _order_view_index(self, int kind):
+        if kind == _VIEW_OPEN:
+            return self._index_orders_open
+        elif kind == _VIEW_CLOSED:
+            return self._index_orders_closed
+        elif kind == _VIEW_EMULATED:
+            return self._index_orders_emulated
+        elif kind == _VIEW_INFLIGHT:
+            return self._index_orders_inflight
+        else:
+            return self._index_orders
+
+    cdef set _position_view_index(self, int kind):
+        if kind == _VIEW_OPEN:
+            return self._index_positions_open
+        elif kind == _VIEW_CLOSED:
+            return self._index_positions_closed
+        else:
+            return self._index_positions
+
+    cdef list _query_orders(
+        self,
+        int kind,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+        OrderSide side,
+    ):
+        cdef tuple key = (venue, instrument_id, strategy_id)
+        cdef dict views = self._order_views.get(key)
+        if views is None:
+            views = {}
+            self._order_views[key] = views
+
+        cdef tuple view_key = (kind, side)
+        cdef list view = views.get(view_key)
+        cdef set query
+        cdef set index
+        if view is None:
+            # Build the view once, it is then maintained as orders are added and updated
+            query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
+            index = self._order_view_index(kind)
+            view = self._get_orders_for_ids(index if query is None else index.intersection(query), side)
+            views[view_key] = view
+
+        return view.copy()
+
+    cdef list _query_positions(
+        self,
+        int kind,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+        PositionSide side,
+    ):
+        cdef tuple key = (venue, instrument_id, strategy_id)
+        cdef dict views = self._position_views.get(key)
+        if views is None:
+            views = {}
+            self._position_views[key] = views
+
+        cdef list view = views.get(kind)
+        cdef set query
+        cdef set index
+        if view is None:
+            # Build the view once, it is then maintained as positions are added and updated
+            query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
+            index = self._position_view_index(kind)
+            view = self._get_positions_for_ids(
+                index if query is None else index.intersection(query),
+                PositionSide.NO_POSITION_SIDE,
+            )
+            views[kind] = view
+
+        if side == PositionSide.NO_POSITION_SIDE:
+            return view.copy()
+
+        # Position side changes over the life of a position, so is filtered per query
+        cdef Position position
+        return [position for position in view if position.side == side]
+
+    cdef void _update_order_views(self, Order order):
+        if not self._order_views:
+            return
+
+        cdef ClientOrderId client_order_id = order.client_order_id
+        cdef Venue venue = order.instrument_id.venue
+        cdef InstrumentId instrument_id = order.instrument_id
+        cdef StrategyId strategy_id = order.strategy_id
+        cdef bint indexed = client_order_id in self._index_orders
+
+        cdef:
+            tuple key
+            dict views
+            bint member
+            bint found
+            Py_ssize_t i
+        for key in (
+            (None, None, None),
+            (venue, None, None),
+            (None, instrument_id, None),
+            (None, None, strategy_id),
+            (venue, instrument_id, None),
+            (venue, None, strategy_id),
+            (None, instrument_id, strategy_id),
+            (venue, instrument_id, strategy_id),
+        ):
+            views = self._order_views.get(key)
+            if views is None:
+                continue
+
+            for view_key, view in views.items():
+                if view_key is None:
+                    # Filter set
+                    if indexed:
+                        view.add(client_order_id)
+                    continue
+
+                member = client_order_id in self._order_view_index(view_key[0]) and (
+                    view_key[1] == OrderSide.NO_ORDER_SIDE or view_key[1] == order.side
+                )
+                i = bisect_left(view, client_order_id, key=_order_view_key)
+                found = i < len(view) and view[i].client_order_id == client_order_id
+                if member:
+                    if found:
+                        view[i] = order  # Order may have been replaced (transformed)
+                    else:
+                        view.insert(i, order)
+                elif found:
+                    del view[i]
+
+    cdef void _update_position_views(self, Position position):
+        if not self._position_views:
+            return
+
+        cdef PositionId position_id = position.id
+        cdef Venue venue = position.instrument_id.venue
+        cdef InstrumentId instrument_id = position.instrument_id
+        cdef StrategyId strategy_id = position.strategy_id
+        cdef bint indexed = position_id in self._index_positions
+
+        cdef:
+            tuple key
+            dict views
+            bint member
+            bint found
+            Py_ssize_t i
+        for key in (
+            (None, None, None),
+            (venue, None, None),
+            (None, instrument_id, None),
+            (None, None, strategy_id),
+            (venue, instrument_id, None),
+            (venue, None, strategy_id),
+            (None, instrument_id, strategy_id),
+            (venue, instrument_id, strategy_id),
+        ):
+            views = self._position_views.get(key)
+            if views is None:
+                continue
+
+            for view_key, view in views.items():
+                if view_key is None:
+                    # Filter set
+                    if indexed:
+                        view.add(position_id)
+                    continue
+
+                member = position_id in self._position_view_index(view_key)
+                i = bisect_left(view, position_id, key=_position_view_key)
+                found = i < len(view) and view[i].id == position_id
+                if member:
+                    if found:
+                        view[i] = position  # Position may have been replaced (reopened)
+                    else:
+                        view.insert(i, position)
+                elif found:
+                    del view[i]
+
+    cdef void _clear_views(self):
+        self._order_views.clear()
+        self._position_views.clear()
+
     cpdef set client_order_ids(
         self,
         Venue venue = None,
@@ -3140,8 +3511,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._query_orders(_VIEW_ALL, venue, instrument_id, strategy_id, side)
 
     cpdef list orders_open(
         self,
@@ -3171,8 +3541,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_open(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._query_orders(_VIEW_OPEN, venue, instrument_id, strategy_id, side)
 
     cpdef list orders_closed(
         self,
@@ -3202,8 +3571,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_closed(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._query_orders(_VIEW_CLOSED, venue, instrument_id, strategy_id, side)
 
     cpdef list orders_emulated(
         self,
@@ -3233,8 +3601,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_emulated(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._query_orders(_VIEW_EMULATED, venue, instrument_id, strategy_id, side)
 
     cpdef list orders_inflight(
         self,
@@ -3264,8 +3631,7 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_inflight(venue, instrument_id, strategy_id)
-        return self._get_orders_for_ids(client_order_ids, side)
+        return self._query_orders(_VIEW_INFLIGHT, venue, instrument_id, strategy_id, side)
 
     cpdef list orders_for_position(self, PositionId position_id):
         """
@@ -3896,8 +4262,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._query_positions(_VIEW_ALL, venue, instrument_id, strategy_id, side)
 
     cpdef list positions_open(
         self,
@@ -3927,8 +4292,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, side)
+        return self._query_positions(_VIEW_OPEN, venue, instrument_id, strategy_id, side)
 
     cpdef list positions_closed(
         self,
@@ -3955,8 +4319,7 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(venue, instrument_id, strategy_id)
-        return self._get_positions_for_ids(position_ids, PositionSide.NO_POSITION_SIDE)
+        return self._query_positions(_VIEW_CLOSED, venue, instrument_id, strategy_id, PositionSide.NO_POSITION_SIDE)
 
     cpdef bint position_exists(self, PositionId position_id):
         """
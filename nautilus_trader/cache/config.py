@@ -49,6 +49,12 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    checkpoint_interval : PositiveInt, optional
+        The number of persisted events between order and position state checkpoints,
+        which allow loading to replay only the events following the latest checkpoint.
+        Orders and positions restored from a checkpoint hold only their initial event
+        (or checkpoint fill for positions) plus the events from the checkpoint onward.
+        If ``None`` then no checkpoints are written.
 
     """
 
@@ -62,3 +68,4 @@ class CacheConfig(NautilusConfig, frozen=True):
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    checkpoint_interval: PositiveInt | None = None
@@ -14,9 +14,23 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     cdef Serializer _serializer
     cdef object _backing
+    cdef int _checkpoint_interval
+    cdef dict _order_event_offsets
+    cdef dict _position_event_counts
+
+    cdef Order _build_order(self, list result, list checkpoint)
+    cdef Position _build_position(self, list result, dict instruments, list checkpoint)
+    cdef dict _read_checkpoint(self, list result, list checkpoint)
+    cdef dict _order_state(self, Order order, int event_count)
+    cdef Order _restore_order(self, dict state)
+    cdef dict _position_state(self, Position position, int event_count)
+    cdef void _restore_position(self, Position position, dict state)
+    cdef void _checkpoint(self, str key, dict state)
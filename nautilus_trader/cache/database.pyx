@@ -30,7 +30,11 @@ from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.rust.common cimport LogColor
+from nautilus_trader.core.rust.model cimport LiquiditySide
+from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
+from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.core.rust.model cimport TriggerType
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.messages cimport SubmitOrder
@@ -50,6 +54,7 @@ from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport OrderListId
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport TradeId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.model.identifiers cimport VenueOrderId
 from nautilus_trader.model.instruments.base cimport Instrument
@@ -57,9 +62,17 @@ from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
 from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.limit cimport LimitOrder
+from nautilus_trader.model.orders.limit_if_touched cimport LimitIfTouchedOrder
 from nautilus_trader.model.orders.market cimport MarketOrder
+from nautilus_trader.model.orders.market_if_touched cimport MarketIfTouchedOrder
+from nautilus_trader.model.orders.market_to_limit cimport MarketToLimitOrder
+from nautilus_trader.model.orders.stop_limit cimport StopLimitOrder
+from nautilus_trader.model.orders.stop_market cimport StopMarketOrder
+from nautilus_trader.model.orders.trailing_stop_limit cimport TrailingStopLimitOrder
+from nautilus_trader.model.orders.trailing_stop_market cimport TrailingStopMarketOrder
 from nautilus_trader.model.orders.unpacker cimport OrderUnpacker
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
@@ -92,8 +105,12 @@ cdef str _INDEX_POSITIONS_CLOSED = "index:positions_closed"
 
 cdef str _SNAPSHOTS_ORDERS = "snapshots:orders"
 cdef str _SNAPSHOTS_POSITIONS = "snapshots:positions"
+cdef str _CHECKPOINTS_ORDERS = "checkpoints:orders"
+cdef str _CHECKPOINTS_POSITIONS = "checkpoints:positions"
 cdef str _HEARTBEAT = "health:heartbeat"
 
+cdef int _BULK_READ_BATCH_SIZE = 1000  # Keys per pipelined bulk read
+
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     """
@@ -153,8 +170,12 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         self._log.info(f"{config.flush_on_start=}", LogColor.BLUE)
         self._log.info(f"{config.use_trader_prefix=}", LogColor.BLUE)
         self._log.info(f"{config.use_instance_id=}", LogColor.BLUE)
+        self._log.info(f"{config.checkpoint_interval=}", LogColor.BLUE)
 
         self._serializer = serializer
+        self._checkpoint_interval = config.checkpoint_interval or 0
+        self._order_event_offsets: dict[ClientOrderId, int] = {}
+        self._position_event_counts: dict[PositionId, int] = {}
 
         self._backing = nautilus_pyo3.RedisCacheDatabase(
             trader_id=nautilus_pyo3.TraderId(trader_id.value),
@@ -358,6 +379,8 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         Load all orders from the database.
 
+        The order event lists are read in pipelined batches.
+
         Returns
         -------
         dict[ClientOrderId, Order]
@@ -369,16 +392,32 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not order_keys:
             return orders
 
+        cdef list client_order_ids = [
+            ClientOrderId(key.rsplit(':', maxsplit=1)[1]) for key in order_keys
+        ]
+
         cdef:
-            str key
+            int i
+            int j
+            list batch
+            list keys
+            list results
             ClientOrderId client_order_id
             Order order
-        for key in order_keys:
-            client_order_id = ClientOrderId(key.rsplit(':', maxsplit=1)[1])
-            order = self.load_order(client_order_id)
-
-            if order is not None:
-                orders[order.client_order_id] = order
+        for i in range(0, len(client_order_ids), _BULK_READ_BATCH_SIZE):
+            batch = client_order_ids[i:i + _BULK_READ_BATCH_SIZE]
+            keys = [f"{_ORDERS}:{client_order_id.to_str()}" for client_order_id in batch]
+            if self._checkpoint_interval:
+                keys += [f"{_CHECKPOINTS_ORDERS}:{client_order_id.to_str()}" for client_order_id in batch]
+            results = self._backing.read_bulk(keys)
+            for j in range(len(batch)):
+                order = self._build_order(
+                    results[j],
+                    results[len(batch) + j] if self._checkpoint_interval else None,
+                )
+
+                if order is not None:
+                    orders[order.client_order_id] = order
 
         return orders
 
@@ -386,6 +425,8 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         Load all positions from the database.
 
+        The position event lists are read in pipelined batches.
+
         Returns
         -------
         dict[PositionId, Position]
@@ -397,16 +438,36 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not position_keys:
             return positions
 
+        cdef list position_ids = [
+            PositionId(key.rsplit(':', maxsplit=1)[1]) for key in position_keys
+        ]
+
+        # Instruments are shared between positions, so only load each once
+        cdef dict instruments = {}
+
         cdef:
-            str key
+            int i
+            int j
+            list batch
+            list keys
+            list results
             PositionId position_id
             Position position
-        for key in position_keys:
-            position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
-
-            if position is not None:
-                positions[position.id] = position
+        for i in range(0, len(position_ids), _BULK_READ_BATCH_SIZE):
+            batch = position_ids[i:i + _BULK_READ_BATCH_SIZE]
+            keys = [f"{_POSITIONS}:{position_id.to_str()}" for position_id in batch]
+            if self._checkpoint_interval:
+                keys += [f"{_CHECKPOINTS_POSITIONS}:{position_id.to_str()}" for position_id in batch]
+            results = self._backing.read_bulk(keys)
+            for j in range(len(batch)):
+                position = self._build_position(
+                    results[j],
+                    instruments,
+                    results[len(batch) + j] if self._checkpoint_interval else None,
+                )
+
+                if position is not None:
+                    positions[position.id] = position
 
         return positions
 
@@ -581,17 +642,31 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef str key = f"{_ORDERS}:{client_order_id.to_str()}"
         cdef list result = self._backing.read(key)
 
-        # Check there is at least one event to pop
+        cdef list checkpoint = None
+        if self._checkpoint_interval:
+            checkpoint = self._backing.read(f"{_CHECKPOINTS_ORDERS}:{client_order_id.to_str()}")
+
+        return self._build_order(result, checkpoint)
+
+    cdef Order _build_order(self, list result, list checkpoint):
+        # Check there is at least one event
         if not result:
             return None
 
-        cdef OrderInitialized init = self._serializer.deserialize(result.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
+        cdef Order order = None
+        cdef int start = 1
+        cdef dict state = self._read_checkpoint(result, checkpoint)
+        if state is not None:
+            start = state["event_count"]
+            order = self._restore_order(state)
+        else:
+            order = OrderUnpacker.from_init_c(self._serializer.deserialize(result[0]))
 
-        cdef int event_count = 0
+        # Replay the events following the initial event (or checkpoint)
+        cdef int event_count = start - 1
         cdef bytes event_bytes
         cdef OrderEvent event
-        for event_bytes in result:
+        for event_bytes in result[start:]:
             event = self._serializer.deserialize(event_bytes)
 
             # Check event integrity
@@ -612,6 +687,12 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
                 order.apply(event)
             event_count += 1
 
+        # A restored order holds fewer events than were persisted
+        if state is not None:
+            self._order_event_offsets[order.client_order_id] = len(result) - order.event_count_c()
+        else:
+            self._order_event_offsets.pop(order.client_order_id, None)
+
         return order
 
     cpdef Position load_position(self, PositionId position_id):
@@ -633,12 +714,36 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef str key = f"{_POSITIONS}:{position_id.to_str()}"
         cdef list result = self._backing.read(key)
 
-        # Check there is at least one event to pop
+        cdef list checkpoint = None
+        if self._checkpoint_interval:
+            checkpoint = self._backing.read(f"{_CHECKPOINTS_POSITIONS}:{position_id.to_str()}")
+
+        return self._build_position(result, None, checkpoint)
+
+    cdef Position _build_position(self, list result, dict instruments, list checkpoint):
+        # Check there is at least one event
         if not result:
             return None
 
-        cdef OrderFilled initial_fill = self._serializer.deserialize(result.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
+        cdef int start = 1
+        cdef dict state = self._read_checkpoint(result, checkpoint)
+
+        cdef OrderFilled initial_fill
+        if state is not None:
+            start = state["event_count"]
+            initial_fill = state["last_event"]
+        else:
+            initial_fill = self._serializer.deserialize(result[0])
+
+        cdef Instrument instrument
+        if instruments is None:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+        elif initial_fill.instrument_id in instruments:
+            instrument = instruments[initial_fill.instrument_id]
+        else:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            instruments[initial_fill.instrument_id] = instrument
+
         if instrument is None:
             self._log.error(
                 f"Cannot load position: "
@@ -647,11 +752,13 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             return
 
         cdef Position position = Position(instrument, initial_fill)
+        if state is not None:
+            self._restore_position(position, state)
 
         cdef:
             bytes event_bytes
             OrderFilled fill
-        for event_bytes in result:
+        for event_bytes in result[start:]:
             event = self._serializer.deserialize(event_bytes)
 
             # Check event integrity
@@ -660,8 +767,197 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
             position.apply(event)
 
+        self._position_event_counts[position.id] = len(result)
+
         return position
 
+    cdef dict _read_checkpoint(self, list result, list checkpoint):
+        # Return the checkpoint state if it is consistent with the persisted
+        # events, otherwise `None` so that all events are replayed
+        if not checkpoint:
+            return None
+
+        cdef dict state = self._serializer.deserialize(checkpoint[0])
+        cdef int event_count = state["event_count"]
+        if event_count < 1 or event_count > len(result):
+            self._log.warning(
+                f"Checkpoint at event {event_count} does not match "
+                f"{len(result)} persisted events, replaying all events",
+            )
+            return None
+
+        last_event = self._serializer.deserialize(result[event_count - 1])
+        if last_event.id.to_str() != state["last_event_id"]:
+            self._log.warning(
+                f"Checkpoint event {state['last_event_id']} does not match "
+                f"persisted event {last_event.id}, replaying all events",
+            )
+            return None
+
+        state["last_event"] = last_event
+        return state
+
+    cdef dict _order_state(self, Order order, int event_count):
+        cdef OrderInitialized init = None
+        cdef OrderEvent event
+        for event in reversed(order._events):
+            if isinstance(event, OrderInitialized):
+                init = event  # Latest initialization (orders may be transformed)
+                break
+
+        cdef Price price = getattr(order, "price", None)
+        cdef Price trigger_price = getattr(order, "trigger_price", None)
+        cdef Price triggered_price = order.get_triggered_price_c()
+        return {
+            "event_count": event_count,
+            "last_event_id": order.last_event_c().id.to_str(),
+            "init": OrderInitialized.to_dict(init),
+            "status": order._fsm.state,
+            "previous_status": order._previous_status,
+            "strategy_id": order.strategy_id.to_str(),
+            "venue_order_id": order.venue_order_id.to_str() if order.venue_order_id is not None else None,
+            "venue_order_ids": [v.to_str() for v in order._venue_order_ids],
+            "position_id": order.position_id.to_str() if order.position_id is not None else None,
+            "account_id": order.account_id.to_str() if order.account_id is not None else None,
+            "last_trade_id": order.last_trade_id.to_str() if order.last_trade_id is not None else None,
+            "trade_ids": [t.to_str() for t in order._trade_ids],
+            "liquidity_side": order.liquidity_side,
+            "quantity": str(order.quantity),
+            "filled_qty": str(order.filled_qty),
+            "leaves_qty": str(order.leaves_qty),
+            "avg_px": order.avg_px,
+            "slippage": order.slippage,
+            "commissions": [str(c) for c in order._commissions.values()],
+            "emulation_trigger": order.emulation_trigger,
+            "price": str(price) if price is not None else None,
+            "trigger_price": str(trigger_price) if trigger_price is not None else None,
+            "triggered_price": str(triggered_price) if triggered_price is not None else None,
+            "is_triggered": getattr(order, "is_triggered", False),
+            "ts_triggered": getattr(order, "ts_triggered", 0),
+            "ts_last": order.ts_last,
+        }
+
+    cdef Order _restore_order(self, dict state):
+        cdef OrderInitialized init = OrderInitialized.from_dict(state["init"])
+        cdef Order order = OrderUnpacker.from_init_c(init)
+
+        cdef OrderEvent last_event = state["last_event"]
+        if last_event.id != init.id:
+            order._events.append(last_event)
+
+        order._fsm.state = state["status"]
+        order._previous_status = <OrderStatus>state["previous_status"]
+        order.strategy_id = StrategyId(state["strategy_id"])
+        order.venue_order_id = VenueOrderId(state["venue_order_id"]) if state["venue_order_id"] else None
+        order._venue_order_ids = [VenueOrderId(v) for v in state["venue_order_ids"]]
+        order.position_id = PositionId(state["position_id"]) if state["position_id"] else None
+        order.account_id = AccountId(state["account_id"]) if state["account_id"] else None
+        order.last_trade_id = TradeId(state["last_trade_id"]) if state["last_trade_id"] else None
+        order._trade_ids = [TradeId(t) for t in state["trade_ids"]]
+        order.liquidity_side = <LiquiditySide>state["liquidity_side"]
+        order.quantity = Quantity.from_str_c(state["quantity"])
+        order.filled_qty = Quantity.from_str_c(state["filled_qty"])
+        order.leaves_qty = Quantity.from_str_c(state["leaves_qty"])
+        order.avg_px = state["avg_px"]
+        order.slippage = state["slippage"]
+        order.emulation_trigger = <TriggerType>state["emulation_trigger"]
+        order.ts_last = state["ts_last"]
+
+        cdef Money commission
+        order._commissions = {}
+        for value in state["commissions"]:
+            commission = Money.from_str_c(value)
+            order._commissions[commission.currency] = commission
+
+        if state["triggered_price"] is not None:
+            order.set_triggered_price_c(Price.from_str_c(state["triggered_price"]))
+
+        # Restore the fields which can be updated for the specific order type
+        cdef Price price = Price.from_str_c(state["price"]) if state["price"] is not None else None
+        cdef Price trigger_price = Price.from_str_c(state["trigger_price"]) if state["trigger_price"] is not None else None
+        cdef bint is_triggered = state["is_triggered"]
+        cdef uint64_t ts_triggered = state["ts_triggered"]
+        if order.order_type == OrderType.LIMIT:
+            (<LimitOrder>order).price = price
+        elif order.order_type == OrderType.MARKET_TO_LIMIT:
+            (<MarketToLimitOrder>order).price = price
+        elif order.order_type == OrderType.STOP_MARKET:
+            (<StopMarketOrder>order).trigger_price = trigger_price
+        elif order.order_type == OrderType.MARKET_IF_TOUCHED:
+            (<MarketIfTouchedOrder>order).trigger_price = trigger_price
+        elif order.order_type == OrderType.TRAILING_STOP_MARKET:
+            (<TrailingStopMarketOrder>order).trigger_price = trigger_price
+        elif order.order_type == OrderType.STOP_LIMIT:
+            (<StopLimitOrder>order).price = price
+            (<StopLimitOrder>order).trigger_price = trigger_price
+            (<StopLimitOrder>order).is_triggered = is_triggered
+            (<StopLimitOrder>order).ts_triggered = ts_triggered
+        elif order.order_type == OrderType.LIMIT_IF_TOUCHED:
+            (<LimitIfTouchedOrder>order).price = price
+            (<LimitIfTouchedOrder>order).trigger_price = trigger_price
+            (<LimitIfTouchedOrder>order).is_triggered = is_triggered
+            (<LimitIfTouchedOrder>order).ts_triggered = ts_triggered
+        elif order.order_type == OrderType.TRAILING_STOP_LIMIT:
+            (<TrailingStopLimitOrder>order).price = price
+            (<TrailingStopLimitOrder>order).trigger_price = trigger_price
+            (<TrailingStopLimitOrder>order).is_triggered = is_triggered
+            (<TrailingStopLimitOrder>order).ts_triggered = ts_triggered
+
+        return order
+
+    cdef dict _position_state(self, Position position, int event_count):
+        return {
+            "event_count": event_count,
+            "last_event_id": position.last_event_c().id.to_str(),
+            "opening_order_id": position.opening_order_id.to_str(),
+            "closing_order_id": position.closing_order_id.to_str() if position.closing_order_id is not None else None,
+            "trade_ids": [t.to_str() for t in position._trade_ids],
+            "entry": position.entry,
+            "side": position.side,
+            "signed_qty": position.signed_qty,
+            "quantity": str(position.quantity),
+            "peak_qty": str(position.peak_qty),
+            "buy_qty": str(position._buy_qty),
+            "sell_qty": str(position._sell_qty),
+            "avg_px_open": position.avg_px_open,
+            "avg_px_close": position.avg_px_close,
+            "realized_return": position.realized_return,
+            "realized_pnl": str(position.realized_pnl) if position.realized_pnl is not None else None,
+            "commissions": [str(c) for c in position._commissions.values()],
+            "duration_ns": position.duration_ns,
+            "ts_init": position.ts_init,
+            "ts_opened": position.ts_opened,
+            "ts_last": position.ts_last,
+            "ts_closed": position.ts_closed,
+        }
+
+    cdef void _restore_position(self, Position position, dict state):
+        position.opening_order_id = ClientOrderId(state["opening_order_id"])
+        position.closing_order_id = ClientOrderId(state["closing_order_id"]) if state["closing_order_id"] else None
+        position._trade_ids = [TradeId(t) for t in state["trade_ids"]]
+        position.entry = <OrderSide>state["entry"]
+        position.side = <PositionSide>state["side"]
+        position.signed_qty = state["signed_qty"]
+        position.quantity = Quantity.from_str_c(state["quantity"])
+        position.peak_qty = Quantity.from_str_c(state["peak_qty"])
+        position._buy_qty = Quantity.from_str_c(state["buy_qty"])
+        position._sell_qty = Quantity.from_str_c(state["sell_qty"])
+        position.avg_px_open = state["avg_px_open"]
+        position.avg_px_close = state["avg_px_close"]
+        position.realized_return = state["realized_return"]
+        position.realized_pnl = Money.from_str_c(state["realized_pnl"]) if state["realized_pnl"] is not None else None
+        position.duration_ns = state["duration_ns"]
+        position.ts_init = state["ts_init"]
+        position.ts_opened = state["ts_opened"]
+        position.ts_last = state["ts_last"]
+        position.ts_closed = state["ts_closed"]
+
+        cdef Money commission
+        position._commissions = {}
+        for value in state["commissions"]:
+            commission = Money.from_str_c(value)
+            position._commissions[commission.currency] = commission
+
     cpdef dict load_actor(self, ComponentId component_id):
         """
         Load the state for the given actor.
@@ -897,6 +1193,8 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         self._backing.insert(_INDEX_POSITIONS, [position_id_bytes])
         self._backing.insert(_INDEX_POSITIONS_OPEN, [position_id_bytes])
 
+        self._position_event_counts[position.id] = self._position_event_counts.get(position.id, 0) + 1
+
         self._log.debug(f"Added {position}")
 
     cpdef void index_venue_order_id(self, ClientOrderId client_order_id, VenueOrderId venue_order_id):
@@ -1013,6 +1311,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef list payload = [self._serializer.serialize(order.last_event_c())]
         self._backing.update(key, payload)
 
+        # Each order event is persisted, so the event count is the length of its events list
+        # (plus the events omitted when the order was restored from a checkpoint)
+        cdef int event_count
+        if self._checkpoint_interval:
+            event_count = order.event_count_c() + self._order_event_offsets.get(order.client_order_id, 0)
+            if event_count % self._checkpoint_interval == 0:
+                self._checkpoint(
+                    f"{_CHECKPOINTS_ORDERS}:{client_order_id_str}",
+                    self._order_state(order, event_count),
+                )
+
         if order.venue_order_id is not None:
             # Assumes order_id does not change
             self.index_venue_order_id(order.client_order_id, order.venue_order_id)
@@ -1058,6 +1367,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef list payload = [self._serializer.serialize(position.last_event_c())]
         self._backing.update(key, payload)
 
+        # A position resets its events when reopened, so the events list length is tracked here
+        event_count = self._position_event_counts.get(position.id)
+        if event_count is not None:
+            event_count += 1
+            self._position_event_counts[position.id] = event_count
+            if self._checkpoint_interval and event_count % self._checkpoint_interval == 0:
+                self._checkpoint(
+                    f"{_CHECKPOINTS_POSITIONS}:{position_id_str}",
+                    self._position_state(position, event_count),
+                )
+
         if position.is_open_c():
             self._backing.insert(_INDEX_POSITIONS_OPEN, payload)
             self._backing.delete(_INDEX_POSITIONS_CLOSED, payload)
@@ -1067,6 +1387,14 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
         self._log.debug(f"Updated {position}")
 
+    cdef void _checkpoint(self, str key, dict state):
+        # Persist the state of the object after the `event_count` persisted events
+        cdef int event_count = state["event_count"]
+        cdef list payload = [self._serializer.serialize(state)]
+        self._backing.insert(key, payload)
+
+        self._log.debug(f"Added checkpoint {key} at event {event_count}")
+
     cpdef void snapshot_order_state(self, Order order):
         """
         Snapshot the state of the given `order`.
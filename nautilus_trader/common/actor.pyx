@@ -48,6 +48,11 @@ from nautilus_trader.common.component cimport LiveClock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport is_logging_initialized
+from nautilus_trader.common.topics cimport get_bars_topic
+from nautilus_trader.common.topics cimport get_book_deltas_topic
+from nautilus_trader.common.topics cimport get_instrument_status_topic
+from nautilus_trader.common.topics cimport get_quotes_topic
+from nautilus_trader.common.topics cimport get_trades_topic
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.message cimport Event
@@ -1203,9 +1208,7 @@ cdef class Actor(Component):
             self._pyo3_conversion_types.add(OrderBookDeltas)
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self.handle_order_book_deltas,
         )
 
@@ -1326,9 +1329,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -1359,9 +1360,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -1400,7 +1399,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
@@ -1436,7 +1435,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.status.{instrument_id.venue}.{instrument_id.symbol}",
+            topic=get_instrument_status_topic(instrument_id),
             handler=self.handle_instrument_status,
         )
 
@@ -1597,9 +1596,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self.handle_order_book_deltas,
         )
 
@@ -1676,9 +1673,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -1709,9 +1704,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -1742,7 +1735,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
@@ -1774,7 +1767,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.status.{instrument_id.venue}.{instrument_id.symbol}",
+            topic=get_instrument_status_topic(instrument_id),
             handler=self.handle_instrument_status,
         )
 
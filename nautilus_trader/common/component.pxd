@@ -83,13 +83,18 @@ cdef class Clock:
 cdef dict[UUID4, Clock] _COMPONENT_CLOCKS
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id)
+cdef uint64_t get_component_clocks_version()
 cpdef void register_component_clock(UUID4 instance_id, Clock clock)
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock)
 
 
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef list _timers_changed
 
+    cdef void _on_timers_changed(self)
+    cpdef void share_time(self, TestClock clock)
+    cpdef uint64_t next_deadline_ns(self)
     cpdef void set_time(self, uint64_t to_time_ns)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
@@ -251,6 +256,11 @@ cdef class MessageBus:
     cdef object _database
     cdef dict[Subscription, list[str]] _subscriptions
     cdef dict[str, Subscription[:]] _patterns
+    cdef dict[Subscription, int] _subscription_seq
+    cdef dict[str, list[Subscription]] _exact_subscriptions
+    cdef dict _wildcard_trie
+    cdef list[str] _topics
+    cdef uint64_t _next_seq
     cdef dict[str, object] _endpoints
     cdef dict[UUID4, object] _correlation_index
     cdef tuple[type] _publishable_types
@@ -297,6 +307,10 @@ cdef class MessageBus:
     cpdef void publish(self, str topic, msg, bint external_pub=*)
     cdef void publish_c(self, str topic, msg, bint external_pub=*)
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef list _matching_topics(self, str pattern)
+    cdef list _matching_subscriptions(self, str topic)
+    cdef void _index_subscription(self, Subscription sub)
+    cdef void _deindex_subscription(self, Subscription sub)
 
 
 cdef bint is_matching(str topic, str pattern)
@@ -18,6 +18,8 @@ import copy
 import socket
 import sys
 import traceback
+from bisect import bisect_left
+from bisect import insort
 from collections import deque
 from typing import Any
 from typing import Callable
@@ -95,11 +97,13 @@ from nautilus_trader.core.rust.common cimport test_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timers
 from nautilus_trader.core.rust.common cimport test_clock_drop
 from nautilus_trader.core.rust.common cimport test_clock_new
+from nautilus_trader.core.rust.common cimport test_clock_next_deadline_ns
 from nautilus_trader.core.rust.common cimport test_clock_next_time
 from nautilus_trader.core.rust.common cimport test_clock_register_default_handler
 from nautilus_trader.core.rust.common cimport test_clock_set_time
 from nautilus_trader.core.rust.common cimport test_clock_set_time_alert
 from nautilus_trader.core.rust.common cimport test_clock_set_timer
+from nautilus_trader.core.rust.common cimport test_clock_share_time
 from nautilus_trader.core.rust.common cimport test_clock_timer_count
 from nautilus_trader.core.rust.common cimport test_clock_timer_names
 from nautilus_trader.core.rust.common cimport test_clock_timestamp
@@ -495,6 +499,9 @@ cdef class Clock:
 # Global map of clocks per kernel instance used when running a `BacktestEngine`
 _COMPONENT_CLOCKS = {}
 
+# Incremented whenever any component clocks are registered or deregistered
+cdef uint64_t _component_clocks_version = 0
+
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     # Create a shallow copy of the clocks list, in case a new
@@ -502,6 +509,10 @@ cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     return _COMPONENT_CLOCKS[instance_id].copy()
 
 
+cdef uint64_t get_component_clocks_version():
+    return _component_clocks_version
+
+
 cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
     Condition.not_none(clock, "clock")
@@ -512,8 +523,10 @@ cpdef void register_component_clock(UUID4 instance_id, Clock clock):
         clocks = []
         _COMPONENT_CLOCKS[instance_id] = clocks
 
+    global _component_clocks_version
     if clock not in clocks:
         clocks.append(clock)
+        _component_clocks_version += 1
 
 
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
@@ -525,14 +538,18 @@ cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     if clocks is None:
         return
 
+    global _component_clocks_version
     if clock in clocks:
         clocks.remove(clock)
+        _component_clocks_version += 1
 
 
 cpdef void remove_instance_component_clocks(UUID4 instance_id):
     Condition.not_none(instance_id, "instance_id")
 
+    global _component_clocks_version
     _COMPONENT_CLOCKS.pop(instance_id, None)
+    _component_clocks_version += 1
 
 
 cdef class TestClock(Clock):
@@ -545,6 +562,7 @@ cdef class TestClock(Clock):
 
     def __init__(self):
         self._mem = test_clock_new()
+        self._timers_changed = None  # Notified of timer changes (if assigned)
 
     def __del__(self) -> None:
         if self._mem._0 != NULL:
@@ -587,6 +605,7 @@ cdef class TestClock(Clock):
             alert_time_ns,
             <PyObject *>callback,
         )
+        self._on_timers_changed()
 
     cpdef void set_timer_ns(
         self,
@@ -615,6 +634,7 @@ cdef class TestClock(Clock):
             stop_time_ns,
             <PyObject *>callback,
         )
+        self._on_timers_changed()
 
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
@@ -625,9 +645,45 @@ cdef class TestClock(Clock):
         Condition.is_in(name, self.timer_names, "name", "self.timer_names")
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
+        self._on_timers_changed()
 
     cpdef void cancel_timers(self):
         test_clock_cancel_timers(&self._mem)
+        self._on_timers_changed()
+
+    cdef void _on_timers_changed(self):
+        if self._timers_changed is not None:
+            self._timers_changed.append(self)
+
+    cpdef void share_time(self, TestClock clock):
+        """
+        Share the time of the given clock.
+
+        Setting the time of either clock (or any other clock sharing the time)
+        will then set the time for all of them.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to share the time of.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        test_clock_share_time(&self._mem, &clock._mem)
+
+    cpdef uint64_t next_deadline_ns(self):
+        """
+        Return the earliest next time of the clocks active timers.
+
+        Returns
+        -------
+        uint64_t
+            The UNIX timestamp (nanoseconds), or the maximum ``uint64_t`` value if
+            the clock has no active timers.
+
+        """
+        return test_clock_next_deadline_ns(&self._mem)
 
     cpdef void set_time(self, uint64_t to_time_ns):
         """
@@ -2050,6 +2106,11 @@ cdef class MessageBus:
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
+        self._subscription_seq: dict[Subscription, int] = {}
+        self._exact_subscriptions: dict[str, list[Subscription]] = {}
+        self._wildcard_trie: dict = {}
+        self._topics: list[str] = []  # Sorted topics held in `_patterns`
+        self._next_seq = 0
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
         self._publishable_types = tuple(_EXTERNAL_PUBLISHABLE_TYPES)
         if types_filter is not None:
@@ -2407,19 +2468,18 @@ cdef class MessageBus:
             return
 
         cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
 
         cdef str pattern
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
+        for pattern in self._matching_topics(topic):
+            subs = list(self._patterns[pattern])
+            subs.append(sub)
+            subs = sorted(subs, reverse=True)
+            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+            matches.append(pattern)
 
         self._subscriptions[sub] = sorted(matches)
+        self._index_subscription(sub)
 
         self._resolved = False
 
@@ -2465,6 +2525,7 @@ cdef class MessageBus:
             self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
         del self._subscriptions[sub]
+        self._deindex_subscription(sub)
 
         self._resolved = False
 
@@ -2527,15 +2588,14 @@ cdef class MessageBus:
         self.pub_count += 1
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        # Copy to handle subscription changes on iteration
-        for existing_sub in self._subscriptions.copy():
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
+        cdef list subs_list = self._matching_subscriptions(topic)
 
+        # Order by priority (highest first), then by subscription sequence
+        subs_list = sorted(subs_list, key=self._subscription_seq.__getitem__)
         subs_list = sorted(subs_list, reverse=True)
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
+        if topic not in self._patterns:
+            insort(self._topics, topic)
         self._patterns[topic] = subs_array
 
         cdef list matches
@@ -2547,35 +2607,162 @@ cdef class MessageBus:
 
         return subs_array
 
+    cdef list _matching_topics(self, str pattern):
+        # Return all known topics matching the given subscription pattern
+        cdef str prefix = _literal_prefix(pattern)
+        if len(prefix) == len(pattern):
+            # No wildcards
+            return [pattern] if pattern in self._patterns else []
+
+        cdef list matches = []
+        cdef Py_ssize_t i = bisect_left(self._topics, prefix)
+        cdef Py_ssize_t n = len(self._topics)
+        cdef str topic
+        while i < n:
+            topic = self._topics[i]
+            if not topic.startswith(prefix):
+                break  # No further topics can share the prefix
+            if is_matching(topic, pattern):
+                matches.append(topic)
+            i += 1
+
+        return matches
+
+    cdef list _matching_subscriptions(self, str topic):
+        # Return all subscriptions with a pattern matching the given topic
+        cdef list matches = list(self._exact_subscriptions.get(topic, []))
+
+        # Walk the wildcard patterns literal prefix trie along the topic
+        cdef dict node = self._wildcard_trie
+        cdef list candidates
+        cdef Subscription sub
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t n = len(topic)
+        while node is not None:
+            candidates = node.get(None)
+            if candidates is not None:
+                for sub in candidates:
+                    if is_matching(topic, sub.topic):
+                        matches.append(sub)
+            if i == n:
+                break
+            node = node.get(topic[i])
+            i += 1
+
+        return matches
+
+    cdef void _index_subscription(self, Subscription sub):
+        self._subscription_seq[sub] = self._next_seq
+        self._next_seq += 1
+
+        cdef str prefix = _literal_prefix(sub.topic)
+        cdef list subs
+        if len(prefix) == len(sub.topic):
+            subs = self._exact_subscriptions.get(sub.topic)
+            if subs is None:
+                subs = []
+                self._exact_subscriptions[sub.topic] = subs
+            subs.append(sub)
+            return
+
+        cdef dict node = self._wildcard_trie
+        cdef dict child
+        for char in prefix:
+            child = node.get(char)
+            if child is None:
+                child = {}
+                node[char] = child
+            node = child
+
+        subs = node.get(None)
+        if subs is None:
+            subs = []
+            node[None] = subs
+        subs.append(sub)
+
+    cdef void _deindex_subscription(self, Subscription sub):
+        self._subscription_seq.pop(sub, None)
+
+        cdef str prefix = _literal_prefix(sub.topic)
+        cdef list subs
+        if len(prefix) == len(sub.topic):
+            subs = self._exact_subscriptions.get(sub.topic)
+            if subs is not None:
+                subs.remove(sub)
+                if not subs:
+                    del self._exact_subscriptions[sub.topic]
+            return
+
+        # Walk down recording the path so empty nodes can be pruned
+        cdef list path = []
+        cdef dict node = self._wildcard_trie
+        for char in prefix:
+            path.append((node, char))
+            node = node.get(char)
+            if node is None:
+                return  # Not indexed
+
+        subs = node.get(None)
+        if subs is None:
+            return  # Not indexed
+        subs.remove(sub)
+        if subs:
+            return
+        del node[None]
+
+        cdef dict parent
+        while path and not node:
+            parent, char = path.pop()
+            del parent[char]
+            node = parent
+
+
+cdef inline str _literal_prefix(str pattern):
+    # Return the characters of the pattern prior to any wildcard
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    for i in range(len(pattern)):
+        c = pattern[i]
+        if c == "*" or c == "?":
+            return pattern[:i]
+    return pattern
+
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
-
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
-
-    # If both pattern and string are empty: match
-    t[0, 0] = True
-
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
-
-    # Build a matrix in a bottom-up manner
-    cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
-
-    return t[n, m]
+    # Iterative wildcard matching which backtracks to the last `*` on a mismatch
+    # (no allocations, linear for typical topic patterns)
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0  # Topic index
+    cdef Py_ssize_t j = 0  # Pattern index
+    cdef Py_ssize_t star = -1  # Pattern index of last `*`
+    cdef Py_ssize_t mark = 0  # Topic index when last `*` was reached
+    cdef Py_UCS4 c
+    while i < n:
+        if j < m:
+            c = pattern[j]
+            if c == "*":
+                star = j
+                mark = i
+                j += 1
+                continue
+            if c == "?" or c == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star == -1:
+            return False
+        # Let the last `*` consume one more character
+        j = star + 1
+        mark += 1
+        i = mark
+
+    while j < m and pattern[j] == "*":
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+# Topic strings are built once per instrument ID or bar type and then reused, so
+# that publishing and subscribing always pass the same string object to the
+# message bus (no per-message formatting, and its hash is computed only once).
+cdef dict[InstrumentId, str] _QUOTES_TOPICS = {}
+cdef dict[InstrumentId, str] _TRADES_TOPICS = {}
+cdef dict[BarType, str] _BARS_TOPICS = {}
+cdef dict[InstrumentId, str] _INSTRUMENT_STATUS_TOPICS = {}
+cdef dict[InstrumentId, str] _BOOK_DELTAS_TOPICS = {}
+cdef dict[InstrumentId, str] _BOOK_DEPTH_TOPICS = {}
+
+
+cpdef str get_quotes_topic(InstrumentId instrument_id):
+    """
+    Return the message bus topic for `QuoteTick` data of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _QUOTES_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+        _QUOTES_TOPICS[instrument_id] = topic
+    return topic
+
+
+cpdef str get_trades_topic(InstrumentId instrument_id):
+    """
+    Return the message bus topic for `TradeTick` data of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _TRADES_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+        _TRADES_TOPICS[instrument_id] = topic
+    return topic
+
+
+cpdef str get_bars_topic(BarType bar_type):
+    """
+    Return the message bus topic for `Bar` data of the given bar type.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _BARS_TOPICS.get(bar_type)
+    if topic is None:
+        topic = f"data.bars.{bar_type}"
+        _BARS_TOPICS[bar_type] = topic
+    return topic
+
+
+cpdef str get_instrument_status_topic(InstrumentId instrument_id):
+    """
+    Return the message bus topic for `InstrumentStatus` data of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _INSTRUMENT_STATUS_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = f"data.status.{instrument_id.venue}.{instrument_id.symbol}"
+        _INSTRUMENT_STATUS_TOPICS[instrument_id] = topic
+    return topic
+
+
+cpdef str get_book_deltas_topic(InstrumentId instrument_id):
+    """
+    Return the message bus topic for `OrderBookDeltas` data of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _BOOK_DELTAS_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        _BOOK_DELTAS_TOPICS[instrument_id] = topic
+    return topic
+
+
+cpdef str get_book_depth_topic(InstrumentId instrument_id):
+    """
+    Return the message bus topic for `OrderBookDepth10` data of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _BOOK_DEPTH_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
+        _BOOK_DEPTH_TOPICS[instrument_id] = topic
+    return topic
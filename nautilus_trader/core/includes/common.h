@@ -336,6 +336,13 @@ void test_clock_register_default_handler(struct TestClock_API *clock, PyObject *
 
 void test_clock_set_time(const struct TestClock_API *clock, uint64_t to_time_ns);
 
+void test_clock_share_time(struct TestClock_API *clock, const struct TestClock_API *source);
+
+/**
+ * Returns the earliest next time of the clocks active timers, or `u64::MAX` if none.
+ */
+uint64_t test_clock_next_deadline_ns(const struct TestClock_API *clock);
+
 double test_clock_timestamp(const struct TestClock_API *clock);
 
 uint64_t test_clock_timestamp_ms(const struct TestClock_API *clock);
@@ -2236,9 +2236,34 @@ void orderbook_apply_deltas(struct OrderBook_API *book, const struct OrderBookDe
 
 void orderbook_apply_depth(struct OrderBook_API *book, const struct OrderBookDepth10_t *depth);
 
-CVec orderbook_bids(struct OrderBook_API *book);
+/**
+ * Returns the top `depth` bid levels (all levels if `depth` is zero).
+ */
+CVec orderbook_bids(struct OrderBook_API *book, uintptr_t depth);
 
-CVec orderbook_asks(struct OrderBook_API *book);
+/**
+ * Returns the top `depth` ask levels (all levels if `depth` is zero).
+ */
+CVec orderbook_asks(struct OrderBook_API *book, uintptr_t depth);
+
+/**
+ * Writes the price, size and order count of the top `depth` levels for the given `side`
+ * into the given buffers, returning the number of levels written.
+ *
+ * # Safety
+ *
+ * Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+ *
+ * # Panics
+ *
+ * If `side` is not `Buy` or `Sell`.
+ */
+uintptr_t orderbook_levels_to_arrays(const struct OrderBook_API *book,
+                                     enum OrderSide side,
+                                     uintptr_t depth,
+                                     double *prices,
+                                     double *sizes,
+                                     uint64_t *counts);
 
 uint8_t orderbook_has_bid(struct OrderBook_API *book);
 
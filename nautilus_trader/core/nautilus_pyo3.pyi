@@ -9,6 +9,8 @@ from enum import Enum
 from os import PathLike
 from typing import Any, TypeAlias, Union
 
+import pyarrow as pa
+
 from nautilus_trader.core.data import Data
 
 # Python Interface typing:
@@ -2629,6 +2631,13 @@ class DataBackendSession:
         file_path: str,
         sql_query: str | None = None,
     ) -> None: ...
+    def add_record_batch_reader(
+        self,
+        data_type: NautilusDataType,
+        table_name: str,
+        reader: pa.RecordBatchReader,
+        sql_query: str | None = None,
+    ) -> None: ...
     def to_query_result(self) -> DataQueryResult: ...
 
 class QueryResult:
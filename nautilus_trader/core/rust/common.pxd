@@ -200,6 +200,11 @@ cdef extern from "../includes/common.h":
 
     void test_clock_set_time(const TestClock_API *clock, uint64_t to_time_ns);
 
+    void test_clock_share_time(TestClock_API *clock, const TestClock_API *source);
+
+    # Returns the earliest next time of the clocks active timers, or `u64::MAX` if none.
+    uint64_t test_clock_next_deadline_ns(const TestClock_API *clock);
+
     double test_clock_timestamp(const TestClock_API *clock);
 
     uint64_t test_clock_timestamp_ms(const TestClock_API *clock);
@@ -1530,9 +1530,28 @@ cdef extern from "../includes/model.h":
 
     void orderbook_apply_depth(OrderBook_API *book, const OrderBookDepth10_t *depth);
 
-    CVec orderbook_bids(OrderBook_API *book);
+    # Returns the top `depth` bid levels (all levels if `depth` is zero).
+    CVec orderbook_bids(OrderBook_API *book, uintptr_t depth);
 
-    CVec orderbook_asks(OrderBook_API *book);
+    # Returns the top `depth` ask levels (all levels if `depth` is zero).
+    CVec orderbook_asks(OrderBook_API *book, uintptr_t depth);
+
+    # Writes the price, size and order count of the top `depth` levels for the given `side`
+    # into the given buffers, returning the number of levels written.
+    #
+    # # Safety
+    #
+    # Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+    #
+    # # Panics
+    #
+    # If `side` is not `Buy` or `Sell`.
+    uintptr_t orderbook_levels_to_arrays(const OrderBook_API *book,
+                                         OrderSide side,
+                                         uintptr_t depth,
+                                         double *prices,
+                                         double *sizes,
+                                         uint64_t *counts);
 
     uint8_t orderbook_has_bid(OrderBook_API *book);
 
@@ -99,6 +99,7 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef bint _build_with_no_updates
     cdef bint _timestamp_on_close
     cdef bint _is_left_open
+    cdef TimeBarScheduler _scheduler
 
     cdef readonly timedelta interval
     """The aggregators time interval.\n\n:returns: `timedelta`"""
@@ -113,3 +114,13 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef uint64_t _get_interval_ns(self)
     cpdef void _set_build_timer(self)
     cpdef void _build_bar(self, TimeEvent event)
+
+
+cdef class TimeBarScheduler:
+    cdef Clock _clock
+    cdef dict _groups
+
+    cpdef str register(self, TimeBarAggregator aggregator)
+    cpdef void deregister(self, TimeBarAggregator aggregator)
+    cpdef void clear(self)
+    cpdef void _build_bars(self, TimeEvent event)
@@ -27,6 +27,8 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.rust.core cimport millis_to_nanos
 from nautilus_trader.core.rust.core cimport secs_to_nanos
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
 from nautilus_trader.model.data cimport BarType
@@ -468,7 +470,7 @@ cdef class ValueBarAggregator(BarAggregator):
             handler=handler,
         )
 
-        self._cum_value = Decimal(0)  # Cumulative value
+        self._cum_value = 0  # Cumulative raw value (scaled by 1e18)
 
     cpdef object get_cumulative_value(self):
         """
@@ -479,39 +481,53 @@ cdef class ValueBarAggregator(BarAggregator):
         Decimal
 
         """
-        return self._cum_value
+        return Decimal(self._cum_value).scaleb(-2 * FIXED_PRECISION)
 
     cdef void _apply_update(self, Price price, Quantity size, uint64_t ts_event):
-        size_update = size
+        cdef double size_update
+        cdef bint is_first = True
+
+        # Raw values are exact Python integers, as the product of a raw price and a raw
+        # size (each scaled by 1e9) can overflow 64 bits
+        raw_price = price._mem.raw
+        raw_value_update = raw_price * size._mem.raw
+        raw_scalar = int(FIXED_SCALAR)
+        raw_step = self.bar_type.spec.step * raw_scalar * raw_scalar
+
+        if raw_value_update <= 0:
+            # No size, or value at a zero or negative price which never reaches the step
+            if size._mem.raw != 0:
+                self._cum_value += raw_value_update
+                self._builder.update(price=price, size=size, ts_event=ts_event)
+            return
 
-        while size_update > 0:  # While there is value to apply
-            value_update = price * size_update  # Calculated value in quote currency
-            if self._cum_value + value_update < self.bar_type.spec.step:
+        raw_size_scale = raw_price * raw_scalar  # Raw value per unit of size
+        while raw_value_update > 0:  # While there is value to apply
+            if self._cum_value + raw_value_update < raw_step:
                 # Update and break
-                self._cum_value = self._cum_value + value_update
-                self._builder.update(
-                    price=price,
-                    size=Quantity(size_update, precision=size._mem.precision),
-                    ts_event=ts_event,
-                )
+                self._cum_value += raw_value_update
+                if not is_first:
+                    size_update = raw_value_update / raw_size_scale
+                    size = Quantity(size_update, precision=size._mem.precision)
+                self._builder.update(price=price, size=size, ts_event=ts_event)
                 break
 
-            value_diff: Decimal = self.bar_type.spec.step - self._cum_value
-            size_diff: Decimal = size_update * (value_diff / value_update)
+            raw_value_diff = raw_step - self._cum_value
+            size_update = raw_value_diff / raw_size_scale
             # Update builder to the step threshold
             self._builder.update(
                 price=price,
-                size=Quantity(size_diff, precision=size._mem.precision),
+                size=Quantity(size_update, precision=size._mem.precision),
                 ts_event=ts_event,
             )
 
             # Build a bar and reset builder and cumulative value
             self._build_now_and_send()
-            self._cum_value = Decimal(0)
+            self._cum_value = 0
 
-            # Decrement the update size
-            size_update -= size_diff
-            assert size_update >= 0
+            # Decrement the value update
+            raw_value_update -= raw_value_diff
+            is_first = False
 
 
 cdef class TimeBarAggregator(BarAggregator):
@@ -540,6 +556,9 @@ cdef class TimeBarAggregator(BarAggregator):
         Determines the type of interval used for time aggregation.
         - 'left-open': start time is excluded and end time is included (default).
         - 'right-open': start time is included and end time is excluded.
+    scheduler : TimeBarScheduler, optional
+        The scheduler for a build timer shared with other aggregators.
+        If ``None`` then the aggregator sets its own build timer.
 
     Raises
     ------
@@ -555,6 +574,7 @@ cdef class TimeBarAggregator(BarAggregator):
         bint build_with_no_updates = True,
         bint timestamp_on_close = True,
         str interval_type = "left-open",
+        TimeBarScheduler scheduler = None,
     ):
         super().__init__(
             instrument=instrument,
@@ -563,6 +583,7 @@ cdef class TimeBarAggregator(BarAggregator):
         )
 
         self._clock = clock
+        self._scheduler = scheduler
         self.interval = self._get_interval()
         self.interval_ns = self._get_interval_ns()
         self._timer_name = None
@@ -656,7 +677,10 @@ cdef class TimeBarAggregator(BarAggregator):
         """
         Stop the bar aggregator.
         """
-        self._clock.cancel_timer(str(self.bar_type))
+        if self._scheduler is not None:
+            self._scheduler.deregister(self)
+        else:
+            self._clock.cancel_timer(str(self.bar_type))
 
     cdef timedelta _get_interval(self):
         cdef BarAggregation aggregation = self.bar_type.spec.aggregation
@@ -699,6 +723,10 @@ cdef class TimeBarAggregator(BarAggregator):
             )
 
     cpdef void _set_build_timer(self):
+        if self._scheduler is not None:
+            self._timer_name = self._scheduler.register(self)
+            return
+
         self._timer_name = str(self.bar_type)
         self._clock.set_timer(
             name=self._timer_name,
@@ -750,3 +778,107 @@ cdef class TimeBarAggregator(BarAggregator):
 
         # On receiving this event, timer should now have a new `next_time_ns`
         self.next_close_ns = self._clock.next_time_ns(self._timer_name)
+
+
+cdef class TimeBarScheduler:
+    """
+    Provides shared build timers for time bar aggregators.
+
+    Aggregators with the same interval and alignment are grouped under a single
+    clock timer, which builds the bars for every aggregator in the group in one
+    pass each time it fires (rather than each aggregator setting its own timer).
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the scheduler.
+    """
+
+    def __init__(self, Clock clock not None):
+        self._clock = clock
+        self._groups = {}  # type: dict[str, dict[TimeBarAggregator, None]] (ordered sets)
+
+    cpdef str register(self, TimeBarAggregator aggregator):
+        """
+        Register the given aggregator with the shared timer for its interval and
+        alignment, setting the timer if not already running.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to register.
+
+        Returns
+        -------
+        str
+            The name of the shared timer.
+
+        """
+        cdef uint64_t start_time_ns = dt_to_unix_nanos(aggregator.get_start_time())
+        cdef uint64_t offset_ns = start_time_ns % aggregator.interval_ns
+        cdef str timer_name = f"TimeBarScheduler-{aggregator.interval_ns}-{offset_ns}"
+
+        cdef dict group = self._groups.get(timer_name)
+        if group is None:
+            group = {}
+            self._groups[timer_name] = group
+            self._clock.set_timer_ns(
+                name=timer_name,
+                interval_ns=aggregator.interval_ns,
+                start_time_ns=start_time_ns,
+                stop_time_ns=0,
+                callback=self._build_bars,
+            )
+            aggregator._log.debug(f"Started timer {timer_name}")
+
+        group[aggregator] = None
+        return timer_name
+
+    cpdef void deregister(self, TimeBarAggregator aggregator):
+        """
+        Deregister the given aggregator, canceling its shared timer if no other
+        aggregators remain registered with it.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to deregister.
+
+        """
+        cdef str timer_name = aggregator._timer_name
+        cdef dict group = self._groups.get(timer_name)
+        if group is None or group.pop(aggregator, True) is not None:
+            return  # Not registered
+
+        if not group:
+            del self._groups[timer_name]
+            if timer_name in self._clock.timer_names:
+                self._clock.cancel_timer(timer_name)
+
+    cpdef void clear(self):
+        """
+        Clear all registered aggregators and cancel the shared timers.
+        """
+        cdef list timer_names = self._clock.timer_names
+        cdef str timer_name
+        for timer_name in self._groups:
+            if timer_name in timer_names:
+                self._clock.cancel_timer(timer_name)
+
+        self._groups.clear()
+
+    cpdef void _build_bars(self, TimeEvent event):
+        cdef dict group = self._groups.get(event.name)
+        if group is None:
+            return  # Timer was canceled
+
+        # Iterate over a copy as bar handlers may stop aggregators
+        cdef TimeBarAggregator aggregator
+        for aggregator in list(group):
+            if aggregator not in group:
+                continue  # Stopped by an earlier bar handler
+            if event.ts_event <= aggregator._stored_open_ns:
+                # The timer was already due before the aggregator registered
+                aggregator.next_close_ns = self._clock.next_time_ns(event.name)
+                continue
+            aggregator._build_bar(event)
@@ -0,0 +1,502 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+import pyarrow as pa
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import bar_aggregation_to_str
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import FIXED_PRECISION
+from nautilus_trader.model.objects import FIXED_SCALAR
+
+
+# Above this total the exact running sums no longer fit in 64-bit integers
+_MAX_INT64_SUM = 2**62
+
+
+class _BarColumns(NamedTuple):
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    ts_event: np.ndarray
+    ts_init: np.ndarray
+
+
+class BatchBarAggregator:
+    """
+    Provides a means of aggregating bars from columnar tick data in vectorized passes.
+
+    The bars are identical to those sent by the equivalent streaming aggregator
+    (`TickBarAggregator`, `VolumeBarAggregator`, `ValueBarAggregator` or
+    `TimeBarAggregator`) when handed the same ticks, so they can be used to warm up
+    indicators or seed a live aggregator.
+
+    For time bars, the streaming aggregator is taken to start at the first tick
+    with its clock advancing with the ticks, so the bars which have closed by the
+    last tick are returned.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the aggregator.
+    bar_type : BarType
+        The bar type for the aggregator.
+    build_with_no_updates : bool, default True
+        If time bars are built for intervals with no ticks.
+    timestamp_on_close : bool, default True
+        If time bar `ts_event` is the bar close. If False then the bar open.
+    interval_type : str, default 'left-open'
+        The interval type for time bars, either 'left-open' or 'right-open'.
+
+    Raises
+    ------
+    ValueError
+        If `instrument.id` != `bar_type.instrument_id`.
+    ValueError
+        If `interval_type` is not a valid interval type.
+
+    """
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        bar_type: BarType,
+        build_with_no_updates: bool = True,
+        timestamp_on_close: bool = True,
+        interval_type: str = "left-open",
+    ) -> None:
+        PyCondition.equal(
+            instrument.id,
+            bar_type.instrument_id,
+            "instrument.id",
+            "bar_type.instrument_id",
+        )
+        PyCondition.is_in(interval_type, ("left-open", "right-open"), "interval_type", "types")
+
+        self.instrument = instrument
+        self.bar_type = bar_type
+        self.build_with_no_updates = build_with_no_updates
+        self.timestamp_on_close = timestamp_on_close
+        self.interval_type = interval_type
+
+    def aggregate(
+        self,
+        ts_event: np.ndarray | pa.Array,
+        prices: np.ndarray | pa.Array,
+        sizes: np.ndarray | pa.Array,
+        size_precision: int | None = None,
+    ) -> list[Bar]:
+        """
+        Return the bars aggregated from the given tick columns.
+
+        Parameters
+        ----------
+        ts_event : np.ndarray or pa.Array
+            The UNIX timestamps (nanoseconds) of the ticks, which must be sorted.
+        prices : np.ndarray or pa.Array
+            The raw fixed-point prices of the ticks.
+        sizes : np.ndarray or pa.Array
+            The raw fixed-point sizes of the ticks.
+        size_precision : int, optional
+            The precision of the tick sizes. If ``None`` then the instruments size precision.
+
+        Returns
+        -------
+        list[Bar]
+
+        Raises
+        ------
+        ValueError
+            If the columns are not of equal length, or `ts_event` is not sorted.
+
+        """
+        columns = self._aggregate(ts_event, prices, sizes, size_precision)
+        return Bar.from_raw_arrays_to_list(
+            self.bar_type,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            *columns,
+        )
+
+    def aggregate_to_arrow(
+        self,
+        ts_event: np.ndarray | pa.Array,
+        prices: np.ndarray | pa.Array,
+        sizes: np.ndarray | pa.Array,
+        size_precision: int | None = None,
+    ) -> pa.Table:
+        """
+        Return the bars aggregated from the given tick columns as an Arrow table.
+
+        The table has the same schema as the Arrow encoding of `Bar`, so can be
+        written to a data catalog or decoded into bars.
+
+        Parameters
+        ----------
+        ts_event : np.ndarray or pa.Array
+            The UNIX timestamps (nanoseconds) of the ticks, which must be sorted.
+        prices : np.ndarray or pa.Array
+            The raw fixed-point prices of the ticks.
+        sizes : np.ndarray or pa.Array
+            The raw fixed-point sizes of the ticks.
+        size_precision : int, optional
+            The precision of the tick sizes. If ``None`` then the instruments size precision.
+
+        Returns
+        -------
+        pa.Table
+
+        Raises
+        ------
+        ValueError
+            If the columns are not of equal length, or `ts_event` is not sorted.
+
+        """
+        columns = self._aggregate(ts_event, prices, sizes, size_precision)
+        metadata = {
+            "bar_type": str(self.bar_type),
+            "price_precision": str(self.instrument.price_precision),
+            "size_precision": str(self.instrument.size_precision),
+        }
+        return pa.table(columns._asdict()).replace_schema_metadata(metadata)
+
+    def _aggregate(
+        self,
+        ts_event: np.ndarray | pa.Array,
+        prices: np.ndarray | pa.Array,
+        sizes: np.ndarray | pa.Array,
+        size_precision: int | None,
+    ) -> _BarColumns:
+        ts = np.asarray(ts_event, dtype=np.uint64)
+        prices = np.asarray(prices, dtype=np.int64)
+        sizes = np.asarray(sizes, dtype=np.uint64)
+        PyCondition.equal(len(prices), len(ts), "len(prices)", "len(ts_event)")
+        PyCondition.equal(len(sizes), len(ts), "len(sizes)", "len(ts_event)")
+        if np.any(ts[1:] < ts[:-1]):
+            raise ValueError("`ts_event` must be sorted in ascending order")
+
+        if size_precision is None:
+            size_precision = self.instrument.size_precision
+        PyCondition.in_range_int(size_precision, 0, FIXED_PRECISION, "size_precision")
+
+        aggregation = self.bar_type.spec.aggregation
+        if self.bar_type.spec.is_time_aggregated():
+            columns = self._aggregate_time(ts, prices, sizes)
+        elif aggregation == BarAggregation.TICK:
+            columns = self._aggregate_tick(ts, prices, sizes)
+        elif aggregation == BarAggregation.VOLUME:
+            columns = self._aggregate_volume(ts, prices, sizes)
+        elif aggregation == BarAggregation.VALUE:
+            columns = self._aggregate_value(ts, prices, sizes, size_precision)
+        else:
+            raise ValueError(  # pragma: no cover (design-time error)
+                f"Cannot aggregate bars: "  # pragma: no cover (design-time error)
+                f"BarAggregation.{bar_aggregation_to_str(aggregation)} "  # pragma: no cover (design-time error)
+                f"not supported in open-source",  # pragma: no cover (design-time error)
+            )
+
+        # The builder converts the volume to the instruments size precision
+        volume = _round_raw(columns.volume, self.instrument.size_precision)
+        return columns._replace(volume=volume)
+
+    def _aggregate_tick(
+        self,
+        ts: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+    ) -> _BarColumns:
+        step = self.bar_type.spec.step
+        count = len(ts) // step
+        if count == 0:
+            return _empty_columns()
+
+        starts = np.arange(count) * step
+        ends = starts + step - 1
+        prices = prices[: count * step]
+        return _BarColumns(
+            open=prices[starts],
+            high=np.maximum.reduceat(prices, starts),
+            low=np.minimum.reduceat(prices, starts),
+            close=prices[ends],
+            volume=np.add.reduceat(sizes[: count * step], starts),
+            ts_event=ts[ends],
+            ts_init=ts[ends],
+        )
+
+    def _aggregate_volume(
+        self,
+        ts: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+    ) -> _BarColumns:
+        # Ticks with no size never update the builder
+        mask = sizes > 0
+        ts, prices, sizes = ts[mask], prices[mask], sizes[mask]
+
+        raw_step = self.bar_type.spec.step * int(FIXED_SCALAR)
+        cum_sizes = _cumsum_exact(sizes)
+        starts, closes = _threshold_spans(cum_sizes, raw_step)
+        if len(closes) == 0:
+            return _empty_columns()
+
+        # Every bar closes on exactly the step volume
+        volume = np.full(len(closes), raw_step, dtype=np.uint64)
+        return _span_columns(ts, prices, starts, closes, volume)
+
+    def _aggregate_value(
+        self,
+        ts: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        size_precision: int,
+    ) -> _BarColumns:
+        # Ticks with no size never update the builder
+        mask = sizes > 0
+        ts, prices, sizes = ts[mask], prices[mask], sizes[mask]
+        if np.any(prices < 0):
+            raise ValueError("Cannot aggregate value bars with negative prices")
+
+        # Values are exact in units of the smallest price and size increments
+        price_precision = self.instrument.price_precision
+        price_scalar = 10 ** (FIXED_PRECISION - price_precision)
+        size_scalar = 10 ** (FIXED_PRECISION - size_precision)
+        if np.any(prices % price_scalar) or np.any(sizes % np.uint64(size_scalar)):
+            raise ValueError(
+                f"Cannot aggregate value bars: raw prices and sizes must be at precisions "
+                f"{price_precision} and {size_precision}",
+            )
+
+        units_prices = prices // price_scalar
+        units_sizes = (sizes // np.uint64(size_scalar)).astype(np.int64)
+        if float(units_prices.max(initial=0)) * float(units_sizes.max(initial=0)) < _MAX_INT64_SUM:
+            values = units_prices * units_sizes
+        else:
+            values = units_prices.astype(object) * units_sizes.astype(object)
+
+        value_step = self.bar_type.spec.step * 10 ** (price_precision + size_precision)
+        cum_values = _cumsum_exact(values)
+        starts, closes = _threshold_spans(cum_values, value_step)
+        if len(closes) == 0:
+            return _empty_columns()
+
+        # Sizes split across bars are rounded per part, as in the streaming aggregator
+        cum_sizes = _cumsum_exact(sizes)
+        size_factor = 10**size_precision
+        volume = np.empty(len(closes), dtype=np.uint64)
+        prev_close = -1
+        for m, (start, close) in enumerate(zip(starts.tolist(), closes.tolist(), strict=True)):
+            threshold = m * value_step  # Cumulative value when the previous bar closed
+            if close == prev_close:
+                cum_value = 0  # Previous bar closed on the same tick
+            else:
+                cum_value = (int(cum_values[close - 1]) if close > 0 else 0) - threshold
+            value_diff = value_step - cum_value
+            raw_volume = _size_part(
+                value_diff / (int(units_prices[close]) * size_factor),
+                size_precision,
+            )
+
+            if start != close:
+                if start == prev_close:
+                    # Remainder of the tick which closed the previous bar
+                    remainder = int(cum_values[start]) - threshold
+                    raw_volume += _size_part(
+                        remainder / (int(units_prices[start]) * size_factor),
+                        size_precision,
+                    )
+                else:
+                    raw_volume += int(sizes[start])
+                # Ticks between the first and closing ticks
+                raw_volume += int(cum_sizes[close - 1]) - int(cum_sizes[start])
+
+            volume[m] = raw_volume
+            prev_close = close
+
+        return _span_columns(ts, prices, starts, closes, volume)
+
+    def _aggregate_time(
+        self,
+        ts: np.ndarray,
+        prices: np.ndarray,
+        sizes: np.ndarray,
+    ) -> _BarColumns:
+        if len(ts) == 0:
+            return _empty_columns()
+
+        start_ns, interval_ns = self._time_bar_start(int(ts[0]))
+        bar_count = (int(ts[-1]) - start_ns) // interval_ns  # Bars closed by the last tick
+        if bar_count == 0:
+            return _empty_columns()
+
+        # Index (from 1) of the bar each tick falls in, a tick at a close is in the closing bar
+        offsets = ts - np.uint64(start_ns)
+        bar_indices = np.maximum(
+            (offsets + np.uint64(interval_ns - 1)) // np.uint64(interval_ns),
+            1,
+        )
+        tick_count = int(np.searchsorted(bar_indices, np.uint64(bar_count), side="right"))
+        bar_indices = bar_indices[:tick_count].astype(np.int64)
+        prices = prices[:tick_count]
+        sizes = sizes[:tick_count]
+
+        firsts = np.flatnonzero(np.r_[True, bar_indices[1:] != bar_indices[:-1]])
+        lasts = np.r_[firsts[1:], tick_count] - 1
+        updated = bar_indices[firsts] - 1  # Positions of the bars with ticks
+
+        has_ticks = np.zeros(bar_count, dtype=bool)
+        has_ticks[updated] = True
+        closes = np.zeros(bar_count, dtype=np.int64)
+        closes[updated] = prices[lasts]
+
+        # Bars with no ticks are flat at the last close
+        last_updated = np.maximum.accumulate(np.where(has_ticks, np.arange(bar_count), 0))
+        last_close = closes[last_updated]
+        open_ = last_close.copy()
+        high = last_close.copy()
+        low = last_close.copy()
+        volume = np.zeros(bar_count, dtype=np.uint64)
+        open_[updated] = prices[firsts]
+        high[updated] = np.maximum.reduceat(prices, firsts)
+        low[updated] = np.minimum.reduceat(prices, firsts)
+        volume[updated] = np.add.reduceat(sizes, firsts)
+
+        close_times = start_ns + np.arange(1, bar_count + 1, dtype=np.uint64) * np.uint64(
+            interval_ns,
+        )
+        emitted = (
+            np.ones(bar_count, dtype=bool) if self.build_with_no_updates else has_ticks
+        )
+        close_times = close_times[emitted]
+
+        if self.interval_type == "left-open" and self.timestamp_on_close:
+            bar_ts_event = close_times
+        else:
+            # Each bar opens at the close of the previously built bar
+            bar_ts_event = np.r_[np.uint64(start_ns), close_times[:-1]].astype(np.uint64)
+
+        return _BarColumns(
+            open=open_[emitted],
+            high=high[emitted],
+            low=low[emitted],
+            close=last_close[emitted],
+            volume=volume[emitted],
+            ts_event=bar_ts_event,
+            ts_init=close_times,
+        )
+
+    def _time_bar_start(self, ts_first: int) -> tuple[int, int]:
+        # Use the streaming aggregators own alignment for a start at the first tick
+        clock = TestClock()
+        clock.set_time(ts_first)
+        aggregator = TimeBarAggregator(
+            instrument=self.instrument,
+            bar_type=self.bar_type,
+            handler=lambda bar: None,
+            clock=clock,
+        )
+        start_ns = dt_to_unix_nanos(aggregator.get_start_time())
+        interval_ns = aggregator.interval_ns
+
+        # Skip any intervals which closed before the first tick
+        start_ns += (ts_first - start_ns) // interval_ns * interval_ns
+        return start_ns, interval_ns
+
+
+def _empty_columns() -> _BarColumns:
+    prices = np.empty(0, dtype=np.int64)
+    values = np.empty(0, dtype=np.uint64)
+    return _BarColumns(prices, prices, prices, prices, values, values, values)
+
+
+def _cumsum_exact(values: np.ndarray) -> np.ndarray:
+    # Fall back to Python integers where the running sum would overflow
+    if float(values.sum(dtype=np.float64)) < _MAX_INT64_SUM:
+        return np.cumsum(values)
+    return np.cumsum(values.astype(object))
+
+
+def _threshold_spans(cumulative: np.ndarray, step: int) -> tuple[np.ndarray, np.ndarray]:
+    # Bar m closes on the first tick where the cumulative total reaches m * step, and
+    # opens on the tick which closed the previous bar if it had any remainder
+    if len(cumulative) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    count = int(cumulative[-1]) // step
+    if count == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if cumulative.dtype == object:
+        thresholds = np.array([m * step for m in range(1, count + 1)], dtype=object)
+    else:
+        thresholds = np.arange(1, count + 1, dtype=cumulative.dtype) * cumulative.dtype.type(step)
+    closes = np.searchsorted(cumulative, thresholds, side="left").astype(np.int64)
+
+    starts = np.zeros(count, dtype=np.int64)
+    if count > 1:
+        prev_closes = closes[:-1]
+        has_remainder = cumulative[prev_closes] > thresholds[:-1]
+        starts[1:] = np.where(has_remainder, prev_closes, prev_closes + 1)
+    return starts, closes
+
+
+def _span_columns(
+    ts: np.ndarray,
+    prices: np.ndarray,
+    starts: np.ndarray,
+    closes: np.ndarray,
+    volume: np.ndarray,
+) -> _BarColumns:
+    # Spans can share a tick, so reduce over interleaved [start, close + 1) bounds
+    bounds = np.empty(len(starts) * 2, dtype=np.int64)
+    bounds[0::2] = starts
+    bounds[1::2] = closes + 1
+    padded = np.r_[prices, prices[-1:]]  # The last bound may be one past the end
+    return _BarColumns(
+        open=prices[starts],
+        high=np.maximum.reduceat(padded, bounds)[0::2],
+        low=np.minimum.reduceat(padded, bounds)[0::2],
+        close=prices[closes],
+        volume=volume,
+        ts_event=ts[closes],
+        ts_init=ts[closes],
+    )
+
+
+def _size_part(size: float, precision: int) -> int:
+    # Matches the raw value of `Quantity(size, precision)`
+    scaled = size * float(10**precision)
+    rounded = math.floor(scaled)
+    if scaled - rounded >= 0.5:
+        rounded += 1  # Round half away from zero
+    return rounded * 10 ** (FIXED_PRECISION - precision)
+
+
+def _round_raw(raw: np.ndarray, precision: int) -> np.ndarray:
+    # Matches the raw value of `Quantity(float(quantity), precision)`
+    scaled = (raw.astype(np.float64) / FIXED_SCALAR) * float(10**precision)
+    rounded = np.floor(scaled)
+    rounded += scaled - rounded >= 0.5  # Round half away from zero
+    return rounded.astype(np.uint64) * np.uint64(10 ** (FIXED_PRECISION - precision))
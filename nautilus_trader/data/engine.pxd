@@ -17,6 +17,7 @@ from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
 from nautilus_trader.data.messages cimport DataCommand
@@ -53,6 +54,7 @@ cdef class DataEngine(Component):
     cdef readonly dict[Venue, DataClient] _routing_map
     cdef readonly dict _order_book_intervals
     cdef readonly dict[BarType, BarAggregator] _bar_aggregators
+    cdef readonly TimeBarScheduler _time_bar_scheduler
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
@@ -47,6 +47,12 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
+from nautilus_trader.common.topics cimport get_bars_topic
+from nautilus_trader.common.topics cimport get_book_deltas_topic
+from nautilus_trader.common.topics cimport get_book_depth_topic
+from nautilus_trader.common.topics cimport get_instrument_status_topic
+from nautilus_trader.common.topics cimport get_quotes_topic
+from nautilus_trader.common.topics cimport get_trades_topic
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
@@ -60,6 +66,7 @@ from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
 from nautilus_trader.data.aggregation cimport TickBarAggregator
 from nautilus_trader.data.aggregation cimport TimeBarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.aggregation cimport ValueBarAggregator
 from nautilus_trader.data.aggregation cimport VolumeBarAggregator
 from nautilus_trader.data.client cimport DataClient
@@ -134,6 +141,7 @@ cdef class DataEngine(Component):
         self._catalog: ParquetDataCatalog | None = None
         self._order_book_intervals: dict[(InstrumentId, int), list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
+        self._time_bar_scheduler = TimeBarScheduler(clock=self._clock)
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
@@ -533,6 +541,7 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._time_bar_scheduler.clear()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
@@ -866,7 +875,7 @@ cdef class DataEngine(Component):
                 )
 
         # Setup subscriptions
-        cdef str topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str topic = get_book_deltas_topic(instrument_id)
 
         if not self._msgbus.is_subscribed(
             topic=topic,
@@ -878,7 +887,7 @@ cdef class DataEngine(Component):
                 priority=10,
             )
 
-        topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
+        topic = get_book_depth_topic(instrument_id)
 
         if not only_deltas and not self._msgbus.is_subscribed(
             topic=topic,
@@ -1083,7 +1092,7 @@ cdef class DataEngine(Component):
             self._log.error("Cannot unsubscribe from synthetic instrument `OrderBookDelta` data")
             return
 
-        cdef str topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str topic = get_book_deltas_topic(instrument_id)
 
         cdef int num_subscribers = len(self._msgbus.subscriptions(pattern=topic))
         cdef bint is_internal_book_subscriber = self._msgbus.is_subscribed(
@@ -1117,8 +1126,8 @@ cdef class DataEngine(Component):
             return
 
         # Setup topics
-        cdef str deltas_topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
-        cdef str depth_topic = f"data.book.depth.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef str deltas_topic = get_book_deltas_topic(instrument_id)
+        cdef str depth_topic = get_book_depth_topic(instrument_id)
         cdef str snapshots_topic = f"data.book.snapshots.{instrument_id.venue}.{instrument_id.symbol}"
 
         # Check the deltas and the depth subscription
@@ -1157,11 +1166,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
-        if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
-        ):
+        if not self._msgbus.has_subscribers(get_quotes_topic(instrument_id)):
             if instrument_id in client.subscribed_quote_ticks():
                 client.unsubscribe_quote_ticks(instrument_id)
 
@@ -1173,11 +1178,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
-        if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
-        ):
+        if not self._msgbus.has_subscribers(get_trades_topic(instrument_id)):
             if instrument_id in client.subscribed_trade_ticks():
                 client.unsubscribe_trade_ticks(instrument_id)
 
@@ -1189,7 +1190,7 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(bar_type, "bar_type")
 
-        if self._msgbus.has_subscribers(f"data.bars.{bar_type}"):
+        if self._msgbus.has_subscribers(get_bars_topic(bar_type)):
             return
 
         if bar_type.is_internally_aggregated():
@@ -1440,9 +1441,7 @@ cdef class DataEngine(Component):
                     deltas=buffer_deltas
                 )
                 self._msgbus.publish_c(
-                    topic=f"data.book.deltas"
-                        f".{deltas.instrument_id.venue}"
-                        f".{deltas.instrument_id.symbol}",
+                    topic=get_book_deltas_topic(deltas.instrument_id),
                     msg=deltas,
                 )
                 buffer_deltas.clear()
@@ -1452,9 +1451,7 @@ cdef class DataEngine(Component):
                 deltas=[delta]
             )
             self._msgbus.publish_c(
-                 topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
+                 topic=get_book_deltas_topic(deltas.instrument_id),
                 msg=deltas,
             )
 
@@ -1480,25 +1477,19 @@ cdef class DataEngine(Component):
                         deltas=buffer_deltas,
                     )
                     self._msgbus.publish_c(
-                        topic=f"data.book.deltas"
-                            f".{deltas.instrument_id.venue}"
-                            f".{deltas.instrument_id.symbol}",
+                        topic=get_book_deltas_topic(deltas.instrument_id),
                         msg=deltas_to_publish,
                     )
                     buffer_deltas.clear()
         else:
             self._msgbus.publish_c(
-                topic=f"data.book.deltas"
-                    f".{deltas.instrument_id.venue}"
-                    f".{deltas.instrument_id.symbol}",
+                topic=get_book_deltas_topic(deltas.instrument_id),
                 msg=deltas,
             )
 
     cpdef void _handle_order_book_depth(self, OrderBookDepth10 depth):
         self._msgbus.publish_c(
-            topic=f"data.book.depth"
-                  f".{depth.instrument_id.venue}"
-                  f".{depth.instrument_id.symbol}",
+            topic=get_book_depth_topic(depth.instrument_id),
             msg=depth,
         )
 
@@ -1511,9 +1502,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_quote(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=get_quotes_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1526,9 +1515,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_trade(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=get_trades_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1569,10 +1556,10 @@ cdef class DataEngine(Component):
         if not bar.is_revision:
             self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar_type}", msg=bar)
+        self._msgbus.publish_c(topic=get_bars_topic(bar_type), msg=bar)
 
     cpdef void _handle_instrument_status(self, InstrumentStatus data):
-        self._msgbus.publish_c(topic=f"data.status.{data.instrument_id.venue}.{data.instrument_id.symbol}", msg=data)
+        self._msgbus.publish_c(topic=get_instrument_status_topic(data.instrument_id), msg=data)
 
     cpdef void _handle_close_price(self, InstrumentClose data):
         self._msgbus.publish_c(topic=f"data.venue.close_price.{data.instrument_id}", msg=data)
@@ -1700,6 +1687,7 @@ cdef class DataEngine(Component):
                 build_with_no_updates=self._time_bars_build_with_no_updates,
                 timestamp_on_close=self._time_bars_timestamp_on_close,
                 interval_type=self._time_bars_interval_type,
+                scheduler=self._time_bar_scheduler,
             )
         elif bar_type.spec.aggregation == BarAggregation.TICK:
             aggregator = TickBarAggregator(
@@ -1736,18 +1724,14 @@ cdef class DataEngine(Component):
         # Subscribe to required data
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1768,17 +1752,13 @@ cdef class DataEngine(Component):
         # Unsubscribe from update ticks
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
@@ -1836,9 +1816,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=get_quotes_topic(synthetic_instrument_id),
             msg=synthetic_quote,
         )
 
@@ -1885,8 +1863,6 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=get_trades_topic(synthetic_instrument_id),
             msg=synthetic_trade,
         )
@@ -505,13 +505,8 @@ cdef class OrderEmulator(Actor):
             )
             return
 
+        matching_core.update_order(order)
         matching_core.match_order(order)
-        if order.side == OrderSide.BUY:
-            matching_core.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            matching_core.sort_ask_orders()
-        else:
-            raise RuntimeError("invalid `OrderSide`")  # pragma: no cover (design-time error)
 
     cdef void _handle_cancel_order(self, CancelOrder command):
         cdef Order order = self.cache.order(command.client_order_id)
@@ -894,5 +889,6 @@ cdef class OrderEmulator(Actor):
         )
         order.apply(event)
         self.cache.update_order(order)
+        matching_core.update_order(order)
 
         self._manager.send_risk_event(event)
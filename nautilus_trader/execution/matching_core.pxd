@@ -25,6 +25,18 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class OrderPriceLevels:
+    cdef list _prices
+    cdef dict _levels
+
+    cdef void add(self, int64_t price_raw, Order order)
+    cdef void remove(self, int64_t price_raw, Order order)
+    cdef list orders(self, bint descending)
+    cdef list orders_at_or_above(self, int64_t price_raw)
+    cdef list orders_at_or_below(self, int64_t price_raw)
+    cdef void clear(self)
+
+
 cdef class MatchingCore:
     cdef InstrumentId _instrument_id
     cdef Price _price_increment
@@ -41,8 +53,15 @@ cdef class MatchingCore:
     cdef object _fill_limit_order
 
     cdef dict _orders
+    cdef dict _order_index
+    cdef uint64_t _order_sequence
+    cdef OrderPriceLevels _bid_limits
+    cdef OrderPriceLevels _bid_stops
+    cdef OrderPriceLevels _ask_limits
+    cdef OrderPriceLevels _ask_stops
     cdef list _orders_bid
     cdef list _orders_ask
+    cdef dict _orders_managed
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
@@ -51,19 +70,26 @@ cdef class MatchingCore:
     cpdef list get_orders(self)
     cpdef list get_orders_bid(self)
     cpdef list get_orders_ask(self)
+    cpdef list get_orders_managed(self)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
-    cdef void set_bid_raw(self, int64_t bid_raw)
-    cdef void set_ask_raw(self, int64_t ask_raw)
-    cdef void set_last_raw(self, int64_t last_raw)
+    cpdef void set_bid_raw(self, int64_t bid_raw)
+    cpdef void set_ask_raw(self, int64_t ask_raw)
+    cpdef void set_last_raw(self, int64_t last_raw)
 
     cpdef void reset(self)
     cpdef void add_order(self, Order order)
     cdef void _add_order(self, Order order)
+    cpdef void update_order(self, Order order)
     cdef void sort_bid_orders(self)
     cdef void sort_ask_orders(self)
     cpdef void delete_order(self, Order order)
+    cdef void _index_order(self, Order order, uint64_t sequence)
+    cdef void _unindex_order(self, Order order)
+    cdef void _reindex_order(self, Order order)
+    cdef list _sort_orders(self, list orders, bint descending)
+    cdef list _crossed_orders(self, tuple after, uint64_t last_sequence)
     cpdef void iterate(self, uint64_t timestamp_ns)
 
 # -- MATCHING -------------------------------------------------------------------------------------
@@ -81,3 +107,4 @@ cdef class MatchingCore:
 
 
 cdef int64_t order_sort_key(Order order)
+cdef bint is_stop_keyed(Order order)
@@ -13,8 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
+from operator import itemgetter
 from typing import Callable
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -27,6 +32,69 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class OrderPriceLevels:
+    """
+    Provides resting orders grouped into price levels.
+
+    Levels are kept sorted by raw price, with orders held in FIFO sequence
+    within each level.
+    """
+
+    def __init__(self):
+        self._prices: list[int] = []
+        self._levels: dict[int, list[Order]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(level) for level in self._levels.values())
+
+    cdef void add(self, int64_t price_raw, Order order):
+        cdef list level = self._levels.get(price_raw)
+        if level is None:
+            level = []
+            self._levels[price_raw] = level
+            insort(self._prices, price_raw)
+
+        level.append(order)
+
+    cdef void remove(self, int64_t price_raw, Order order):
+        cdef list level = self._levels.get(price_raw)
+        if level is None:
+            return
+
+        cdef uint64_t i
+        for i in range(len(level)):
+            if level[i] is order:
+                del level[i]
+                break
+
+        if not level:
+            del self._levels[price_raw]
+            del self._prices[bisect_left(self._prices, price_raw)]
+
+    cdef list orders(self, bint descending):
+        cdef list prices = self._prices[::-1] if descending else self._prices
+        cdef list orders = []
+        for price_raw in prices:
+            orders.extend(self._levels[price_raw])
+        return orders
+
+    cdef list orders_at_or_above(self, int64_t price_raw):
+        cdef list orders = []
+        for price in self._prices[bisect_left(self._prices, price_raw):]:
+            orders.extend(self._levels[price])
+        return orders
+
+    cdef list orders_at_or_below(self, int64_t price_raw):
+        cdef list orders = []
+        for price in self._prices[:bisect_right(self._prices, price_raw)]:
+            orders.extend(self._levels[price])
+        return orders
+
+    cdef void clear(self):
+        self._prices.clear()
+        self._levels.clear()
+
+
 cdef class MatchingCore:
     """
     Provides a generic order matching core.
@@ -72,8 +140,22 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._order_index: dict[ClientOrderId, tuple[OrderPriceLevels, int, Order, int]] = {}
+        self._order_sequence = 0
+
+        # Resting orders by match price (limit-like orders match when the market
+        # moves through the price, stop-like orders when it moves away)
+        self._bid_limits = OrderPriceLevels()  # Matched when ask <= price
+        self._bid_stops = OrderPriceLevels()  # Matched when ask >= price
+        self._ask_limits = OrderPriceLevels()  # Matched when bid >= price
+        self._ask_stops = OrderPriceLevels()  # Matched when bid <= price
+
+        # Sorted views of each side (rebuilt on demand after changes)
+        self._orders_bid: list[Order] | None = []
+        self._orders_ask: list[Order] | None = []
+
+        # Orders with an expire time or trailing stop (managed on each iteration)
+        self._orders_managed: dict[ClientOrderId, Order] = {}
 
     @property
     def instrument_id(self) -> InstrumentId:
@@ -167,32 +249,71 @@ cdef class MatchingCore:
         return client_order_id in self._orders
 
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        return self.get_orders_bid() + self.get_orders_ask()
 
     cpdef list get_orders_bid(self):
+        cdef list orders
+        if self._orders_bid is None:
+            orders = self._bid_limits.orders(descending=True) + self._bid_stops.orders(descending=True)
+            self._orders_bid = self._sort_orders(orders, descending=True)
         return self._orders_bid
 
     cpdef list get_orders_ask(self):
+        cdef list orders
+        if self._orders_ask is None:
+            orders = self._ask_limits.orders(descending=False) + self._ask_stops.orders(descending=False)
+            self._orders_ask = self._sort_orders(orders, descending=False)
         return self._orders_ask
 
+    cpdef list get_orders_managed(self):
+        """
+        Return the orders with an expire time or trailing stop, in the same sequence
+        as `get_orders`.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list orders_bid = []
+        cdef list orders_ask = []
+        cdef Order order
+        for order in self._orders_managed.values():
+            if order.side == OrderSide.BUY:
+                orders_bid.append(order)
+            else:
+                orders_ask.append(order)
+
+        return (
+            self._sort_orders(orders_bid, descending=True)
+            + self._sort_orders(orders_ask, descending=False)
+        )
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
-    cdef void set_bid_raw(self, int64_t bid_raw):
+    cpdef void set_bid_raw(self, int64_t bid_raw):
         self.is_bid_initialized = True
         self.bid_raw = bid_raw
 
-    cdef void set_ask_raw(self, int64_t ask_raw):
+    cpdef void set_ask_raw(self, int64_t ask_raw):
         self.is_ask_initialized = True
         self.ask_raw = ask_raw
 
-    cdef void set_last_raw(self, int64_t last_raw):
+    cpdef void set_last_raw(self, int64_t last_raw):
         self.is_last_initialized = True
         self.last_raw = last_raw
 
     cpdef void reset(self):
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._order_index.clear()
+        self._order_sequence = 0
+        self._bid_limits.clear()
+        self._bid_stops.clear()
+        self._ask_limits.clear()
+        self._ask_stops.clear()
+        self._orders_bid = []
+        self._orders_ask = []
+        self._orders_managed.clear()
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -207,44 +328,179 @@ cdef class MatchingCore:
         self._add_order(order)
 
     cdef void _add_order(self, Order order):
+        if order.side != OrderSide.BUY and order.side != OrderSide.SELL:
+            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+
+        # An order already held keeps its arrival sequence
+        cdef tuple entry = self._order_index.get(order.client_order_id)
+        cdef uint64_t sequence
+        if entry is not None:
+            sequence = entry[3]
+            self._unindex_order(order)
+        else:
+            self._order_sequence += 1
+            sequence = self._order_sequence
+
         # Index order
         self._orders[order.client_order_id] = order
+        self._index_order(order, sequence)
 
-        if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self.sort_ask_orders()
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        if (
+            order.expire_time_ns > 0
+            or order.order_type == OrderType.TRAILING_STOP_MARKET
+            or order.order_type == OrderType.TRAILING_STOP_LIMIT
+        ):
+            self._orders_managed[order.client_order_id] = order
+
+    cpdef void update_order(self, Order order):
+        """
+        Update the price index for the given order.
+
+        Must be called after an order held by the core has had its price, trigger
+        price or triggered state changed.
+
+        Parameters
+        ----------
+        order : Order
+            The order which was updated.
+
+        """
+        Condition.not_none(order, "order")
+
+        self._reindex_order(order)
 
     cdef void sort_bid_orders(self):
-        self._orders_bid.sort(key=order_sort_key, reverse=True)
+        cdef Order order
+        for order in list(self._orders.values()):
+            if order.side == OrderSide.BUY:
+                self._reindex_order(order)
 
     cdef void sort_ask_orders(self):
-        self._orders_ask.sort(key=order_sort_key)
+        cdef Order order
+        for order in list(self._orders.values()):
+            if order.side == OrderSide.SELL:
+                self._reindex_order(order)
 
     cpdef void delete_order(self, Order order):
         Condition.not_none(order, "order")
 
+        if order.side != OrderSide.BUY and order.side != OrderSide.SELL:
+            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+
         self._orders.pop(order.client_order_id, None)
+        self._orders_managed.pop(order.client_order_id, None)
+        self._unindex_order(order)
 
+    cdef void _index_order(self, Order order, uint64_t sequence):
+        cdef int64_t price_raw = order_sort_key(order)
+        cdef OrderPriceLevels levels
         if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
+            levels = self._bid_stops if is_stop_keyed(order) else self._bid_limits
+            self._orders_bid = None
         else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+            levels = self._ask_stops if is_stop_keyed(order) else self._ask_limits
+            self._orders_ask = None
+
+        levels.add(price_raw, order)
+        self._order_index[order.client_order_id] = (levels, price_raw, order, sequence)
+
+    cdef void _unindex_order(self, Order order):
+        cdef tuple entry = self._order_index.pop(order.client_order_id, None)
+        if entry is None:
+            return  # Not indexed
+
+        cdef OrderPriceLevels levels = entry[0]
+        levels.remove(entry[1], entry[2])
+        if order.side == OrderSide.BUY:
+            self._orders_bid = None
+        else:
+            self._orders_ask = None
+
+    cdef void _reindex_order(self, Order order):
+        cdef tuple entry = self._order_index.get(order.client_order_id)
+        if entry is None:
+            return  # Not held by the core
+
+        order = entry[2]  # The indexed instance
+
+        cdef OrderPriceLevels levels
+        if order.side == OrderSide.BUY:
+            levels = self._bid_stops if is_stop_keyed(order) else self._bid_limits
+        else:
+            levels = self._ask_stops if is_stop_keyed(order) else self._ask_limits
+
+        if entry[0] is levels and entry[1] == order_sort_key(order):
+            return  # Index unchanged
+
+        self._unindex_order(order)
+        self._index_order(order, entry[3])
+
+    cdef list _sort_orders(self, list orders, bint descending):
+        # Price priority, then arrival sequence across both limit-like and stop-like orders
+        cdef list keyed = []
+        cdef Order order
+        cdef tuple entry
+        for order in orders:
+            entry = self._order_index[order.client_order_id]
+            keyed.append((-entry[1] if descending else entry[1], entry[3], order))
+        keyed.sort(key=itemgetter(0, 1))
+        return [entry[2] for entry in keyed]
+
+    cdef list _crossed_orders(self, tuple after, uint64_t last_sequence):
+        # Return the orders with a match price crossed by the market as (position, order)
+        # in sequence, only those held up to `last_sequence` and positioned after `after`
+        cdef list orders = []
+        if self.is_ask_initialized:
+            orders += self._bid_limits.orders_at_or_above(self.ask_raw)
+            orders += self._bid_stops.orders_at_or_below(self.ask_raw)
+        if self.is_bid_initialized:
+            orders += self._ask_limits.orders_at_or_below(self.bid_raw)
+            orders += self._ask_stops.orders_at_or_above(self.bid_raw)
+
+        cdef list crossed = []
+        cdef Order order
+        cdef tuple entry
+        cdef tuple position
+        for order in orders:
+            entry = self._order_index[order.client_order_id]
+            if entry[3] > last_sequence:
+                continue  # Added since iteration started
+            if order.side == OrderSide.BUY:
+                position = (0, -entry[1], entry[3])
+            else:
+                position = (1, entry[1], entry[3])
+            if after is None or position > after:
+                crossed.append((position, order))
+
+        crossed.sort(key=itemgetter(0))
+        return crossed
 
     cpdef void iterate(self, uint64_t timestamp_ns):
+        # Only orders with a match price crossed by the market are visited, in the same
+        # sequence as all orders held. If matching an order moves the market, then the
+        # orders crossed at the new prices are collected again from that position.
+        cdef uint64_t last_sequence = self._order_sequence
+        cdef list crossed = self._crossed_orders(None, last_sequence)
+        cdef set visited = set()
+        cdef tuple market
+        cdef tuple position
         cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
+        cdef uint64_t i = 0
+        while i < len(crossed):
+            position, order = crossed[i]
+            i += 1
+            if order.client_order_id in visited:
+                continue  # Already matched this iteration (reindexed when triggered)
+            visited.add(order.client_order_id)
             if order.is_closed_c():
                 continue  # Orders state has changed since iteration started  # pragma: no cover
+
+            market = (self.bid_raw, self.ask_raw, self.is_bid_initialized, self.is_ask_initialized)
             self.match_order(order)
+            self._reindex_order(order)  # Order may have been triggered
+            if market != (self.bid_raw, self.ask_raw, self.is_bid_initialized, self.is_ask_initialized):
+                crossed = self._crossed_orders(position, last_sequence)
+                i = 0
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -456,3 +712,13 @@ cdef inline int64_t order_sort_key(Order order):
             f"invalid order type to sort in book, "
             f"was {order_type_to_str(order.order_type)}",
         )
+
+
+cdef inline bint is_stop_keyed(Order order):
+    # If the order is matched as a stop (market moving away from its key price)
+    if order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_MARKET:
+        return True
+    elif order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+        return not order.is_triggered
+    else:
+        return False
@@ -41,6 +41,9 @@ from nautilus_trader.indicators.ta_lib.common import output_suffix_map
 from nautilus_trader.indicators.ta_lib.common import taf_params_re
 from nautilus_trader.indicators.ta_lib.common import talib_indicator_manager_input_dtypes
 from nautilus_trader.indicators.ta_lib.common import talib_indicator_manager_input_names
+from nautilus_trader.indicators.ta_lib.streaming import InputRingBuffer
+from nautilus_trader.indicators.ta_lib.streaming import StreamingFunction
+from nautilus_trader.indicators.ta_lib.streaming import create_streaming_function
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 
@@ -240,6 +243,13 @@ class TALibIndicatorManager(Indicator):
     ValueError
         If `period` is not positive (> 0).
 
+    Notes
+    -----
+    Indicators with an incremental form (SMA, EMA, RSI, ATR, TRANGE and MACD) are
+    updated in O(1) per bar, and their values match TA-Lib run over the complete bar
+    history. All other indicators are recalculated over the lookback window of inputs
+    held in a ring buffer.
+
     """
 
     def __init__(
@@ -273,8 +283,10 @@ class TALibIndicatorManager(Indicator):
         # Initialize on `set_indicators`
         self._stable_period: int | None = None
         self._output_dtypes: list | None = None
-        self._input_deque: deque[np.ndarray] | None = None
+        self._input_buffer: InputRingBuffer | None = None
         self._indicators: set | None = None
+        self._streaming: dict[TAFunctionWrapper, StreamingFunction] = {}
+        self._recalculated: list[TAFunctionWrapper] = []
         self.output_names: tuple | None = None
 
         # Initialize with empty indicators (acts as OHLCV placeholder in case no indicators are set)
@@ -286,7 +298,7 @@ class TALibIndicatorManager(Indicator):
 
         This method takes a tuple of TAFunctionWrapper objects, logs the action, and ensures
         that each element in the tuple is an instance of TAFunctionWrapper. It then updates
-        the indicators, output names, stable period, input deque, and output data types
+        the indicators, output names, stable period, input buffer, and output data types
         for the current instance based on the provided indicators.
 
         Parameters
@@ -302,7 +314,8 @@ class TALibIndicatorManager(Indicator):
         - Calculates the maximum lookback period across all indicators.
         - Initializes the output names based on the indicators.
         - Updates the stable period based on the maximum lookback and the instance's period.
-        - Initializes the input deque with a length equal to the stable period.
+        - Initializes the input ring buffer with a capacity one more than the maximum lookback.
+        - Creates incremental forms for the indicators which support them.
         - Sets the output data types, with special handling for the 'ts_event' column.
 
         This method also logs the setting and registration of indicators at the debug and
@@ -325,9 +338,18 @@ class TALibIndicatorManager(Indicator):
             lookback = max(lookback, indicator.fn.lookback)
 
         self._stable_period = lookback + self._period
-        self._input_deque = deque(maxlen=lookback + 1)
+        self._input_buffer = InputRingBuffer(capacity=lookback + 1)
         self.output_names = tuple(output_names)
 
+        self._streaming = {}
+        self._recalculated = []
+        for indicator in self._indicators:
+            streaming = self._create_streaming_function(indicator)
+            if streaming is None:
+                self._recalculated.append(indicator)
+            else:
+                self._streaming[indicator] = streaming
+
         # Initialize the output dtypes
         self._output_dtypes = [
             (col, np.dtype("uint64") if col in ["ts_event", "ts_init"] else np.dtype("float64"))
@@ -339,6 +361,19 @@ class TALibIndicatorManager(Indicator):
     def __repr__(self) -> str:
         return f"{self.name}[{self._bar_type}]"
 
+    @staticmethod
+    def _create_streaming_function(indicator: TAFunctionWrapper) -> StreamingFunction | None:
+        if talib.get_compatibility() != 0:
+            return None  # Incremental forms follow the default compatibility mode only
+        if talib.get_unstable_period("EMA" if indicator.name == "MACD" else indicator.name):
+            return None
+
+        return create_streaming_function(
+            name=indicator.name,
+            parameters=dict(indicator.fn.parameters),
+            input_names=dict(indicator.fn.input_names),
+        )
+
     @staticmethod
     def input_names() -> list:
         return list(talib_indicator_manager_input_names)
@@ -364,9 +399,9 @@ class TALibIndicatorManager(Indicator):
         Update the output deque with calculated technical analysis indicators.
 
         This private method computes and updates the output values for technical
-        analysis indicators based on the latest data in the input deque. It initializes
+        analysis indicators based on the latest data in the input buffer. It initializes
         a combined output array with base values (e.g., 'open', 'high', 'low', 'close',
-        'volume', 'ts_event') from the most recent input deque entry. Each indicator's
+        'volume', 'ts_event') from the most recent input buffer entry. Each indicator's
         output is calculated and used to update the combined output array. The updated
         data is either appended to or replaces the latest entry in the output deque,
         depending on the value of the 'append' argument.
@@ -379,9 +414,10 @@ class TALibIndicatorManager(Indicator):
 
         The method performs the following steps:
         - Initializes a combined output array with base values from the latest input
-          deque entry.
-        - Iterates through each indicator, calculates its output, and updates the
-          combined output array.
+          buffer entry.
+        - Updates each indicator with an incremental form from the latest entry.
+        - Recalculates every other indicator over zero-copy views of the input buffer.
+        - Updates the combined output array with each indicator's latest output.
         - Appends the combined output to the output deque or replaces its most recent
           entry based on the 'append' flag.
         - Resets the internal output array for reconstruction during the next access.
@@ -392,23 +428,23 @@ class TALibIndicatorManager(Indicator):
         """
         self._log.debug("Calculating outputs.")
 
-        if self._input_deque is None:
+        if self._input_buffer is None:
             return
 
         combined_output = np.zeros(1, dtype=self._output_dtypes)
-        combined_output["ts_event"] = self._input_deque[-1]["ts_event"].item()
-        combined_output["ts_init"] = self._input_deque[-1]["ts_init"].item()
-        combined_output["open"] = self._input_deque[-1]["open"].item()
-        combined_output["high"] = self._input_deque[-1]["high"].item()
-        combined_output["low"] = self._input_deque[-1]["low"].item()
-        combined_output["close"] = self._input_deque[-1]["close"].item()
-        combined_output["volume"] = self._input_deque[-1]["volume"].item()
-
-        input_array = np.concatenate(self._input_deque)
-        assert self._indicators  # Type checking
-        for indicator in self._indicators:
+        for name in talib_indicator_manager_input_names:
+            combined_output[name] = self._input_buffer.last(name)
+
+        for indicator, streaming in self._streaming.items():
+            self._log.debug(f"Updating {indicator.name} outputs.")
+            results = streaming.update(self._input_buffer, append=append)
+            for output_name, result in zip(indicator.output_names, results, strict=True):
+                combined_output[output_name] = result
+
+        # Zero-copy views shared by all recalculated indicators
+        inputs_dict = self._input_buffer.columns() if self._recalculated else {}
+        for indicator in self._recalculated:
             self._log.debug(f"Calculating {indicator.name} outputs.")
-            inputs_dict = {name: input_array[name] for name in input_array.dtype.names}
             indicator.fn.set_input_arrays(inputs_dict)
             results = indicator.fn.run()
 
@@ -709,26 +745,21 @@ class TALibIndicatorManager(Indicator):
             self._log.warning(f"Skipping zero close bar: {bar!r}")
             return
 
-        bar_data = np.array(
-            [
-                (
-                    bar.ts_event,
-                    bar.ts_init,
-                    bar.open.as_double(),
-                    bar.high.as_double(),
-                    bar.low.as_double(),
-                    bar.close.as_double(),
-                    bar.volume.as_double(),
-                ),
-            ],
-            dtype=self.input_dtypes(),
+        bar_data = (
+            bar.ts_event,
+            bar.ts_init,
+            bar.open.as_double(),
+            bar.high.as_double(),
+            bar.low.as_double(),
+            bar.close.as_double(),
+            bar.volume.as_double(),
         )
 
         if bar.ts_event == self._last_ts_event:
-            self._input_deque[-1] = bar_data
+            self._input_buffer.update_last(bar_data)
             self._update_ta_outputs(append=False)
         elif bar.ts_event > self._last_ts_event:
-            self._input_deque.append(bar_data)
+            self._input_buffer.append(bar_data)
             self._increment_count()
             self._update_ta_outputs()
         else:
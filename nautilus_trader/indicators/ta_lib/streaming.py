@@ -0,0 +1,472 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.indicators.ta_lib.common import talib_indicator_manager_input_dtypes
+
+
+NAN = float("nan")
+
+
+class InputRingBuffer:
+    """
+    Provides a fixed capacity ring buffer for the TA-Lib indicator manager inputs.
+
+    Each input is held in its own column, and every row is written twice (at its ring
+    position and again one capacity further along). This keeps the most recent
+    `capacity` rows contiguous, so column windows are returned as zero-copy views.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of rows to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, capacity: int) -> None:
+        PyCondition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.count = 0
+        self._columns: dict[str, np.ndarray] = {
+            name: np.zeros(capacity * 2, dtype=dtype)
+            for name, dtype in talib_indicator_manager_input_dtypes
+        }
+        self._names = tuple(self._columns)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, values: tuple) -> None:
+        """
+        Append the given row of input values.
+
+        Parameters
+        ----------
+        values : tuple
+            The values in the order of `talib_indicator_manager_input_dtypes`.
+
+        """
+        self.count += 1
+        self._write(values)
+
+    def update_last(self, values: tuple) -> None:
+        """
+        Replace the most recent row with the given input values.
+
+        Parameters
+        ----------
+        values : tuple
+            The values in the order of `talib_indicator_manager_input_dtypes`.
+
+        """
+        if self.count == 0:
+            self.count = 1
+        self._write(values)
+
+    def _write(self, values: tuple) -> None:
+        pos = (self.count - 1) % self.capacity
+        for name, value in zip(self._names, values, strict=True):
+            column = self._columns[name]
+            column[pos] = value
+            column[pos + self.capacity] = value
+
+    def last(self, name: str) -> Any:
+        """
+        Return the most recent value for the given input.
+
+        Parameters
+        ----------
+        name : str
+            The input name.
+
+        Returns
+        -------
+        Any
+
+        """
+        return self._columns[name][(self.count - 1) % self.capacity].item()
+
+    def ago(self, name: str, index: int) -> float:
+        """
+        Return the value for the given input `index` rows before the most recent row.
+
+        Parameters
+        ----------
+        name : str
+            The input name.
+        index : int
+            The number of rows back (0 is the most recent). Must be less than the
+            number of rows held.
+
+        Returns
+        -------
+        float
+
+        """
+        return self._columns[name][(self.count - 1 - index) % self.capacity].item()
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a view of the held values for the given input in time order.
+
+        The view is only valid until the next write, and must not be modified.
+
+        Parameters
+        ----------
+        name : str
+            The input name.
+
+        Returns
+        -------
+        np.ndarray
+
+        """
+        end = (self.count - 1) % self.capacity + self.capacity + 1
+        return self._columns[name][end - len(self) : end]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Return views of the held values for all inputs in time order.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+
+        """
+        return {name: self.column(name) for name in self._names}
+
+
+class StreamingFunction:
+    """
+    The base class for incremental forms of TA-Lib functions.
+
+    Each update is calculated in O(1) from the state after the previous bar, which is
+    retained so the most recent bar can be replaced (`append=False`) without having to
+    replay history.
+
+    The outputs match running the TA-Lib function over the complete input history
+    (with the default compatibility mode and no unstable period), with ``NaN`` values
+    returned during the lookback.
+
+    """
+
+    def __init__(self, state: tuple, output_count: int = 1) -> None:
+        self._state = state
+        self._prev_state = state
+        self._empty = (NAN,) * output_count
+
+    def update(self, inputs: InputRingBuffer, append: bool = True) -> tuple[float, ...]:
+        """
+        Update the function with the most recent row of the given inputs.
+
+        Parameters
+        ----------
+        inputs : InputRingBuffer
+            The inputs, with the most recent bar already written.
+        append : bool, default True
+            If the most recent row is a new bar (True), or replaces the bar
+            previously updated (False).
+
+        Returns
+        -------
+        tuple[float, ...]
+            The output values for the most recent bar.
+
+        """
+        if append:
+            self._prev_state = self._state
+        self._state, outputs = self._step(self._prev_state, inputs)
+        return outputs
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        raise NotImplementedError("method `_step` must be implemented in the subclass")
+
+
+class StreamingSMA(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `SMA` function.
+    """
+
+    def __init__(self, period: int, price: str = "close") -> None:
+        super().__init__(state=(0, 0.0))
+        self.period = period
+        self.price = price
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count, total = state
+        count += 1
+        total += inputs.last(self.price)
+        if count < self.period:
+            return (count, total), self._empty
+
+        value = total / self.period
+        total -= inputs.ago(self.price, self.period - 1)
+        return (count, total), (value,)
+
+
+class StreamingEMA(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `EMA` function.
+    """
+
+    def __init__(self, period: int, price: str = "close") -> None:
+        super().__init__(state=(0, 0.0))
+        self.period = period
+        self.price = price
+        self.alpha = 2.0 / (period + 1)
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count, value = state
+        count += 1
+        price = inputs.last(self.price)
+        if count < self.period:
+            return (count, value + price), self._empty  # Seed sum
+        elif count == self.period:
+            value = (value + price) / self.period
+        else:
+            value = ((price - value) * self.alpha) + value
+        return (count, value), (value,)
+
+
+class StreamingRSI(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `RSI` function.
+    """
+
+    def __init__(self, period: int, price: str = "close") -> None:
+        super().__init__(state=(0, 0.0, 0.0, 0.0))
+        self.period = period
+        self.price = price
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count, prev_price, gain, loss = state
+        count += 1
+        price = inputs.last(self.price)
+        if count == 1:
+            return (count, price, gain, loss), self._empty
+
+        change = price - prev_price
+        if count <= self.period:
+            # Seed sums
+            if change < 0:
+                loss -= change
+            else:
+                gain += change
+            return (count, price, gain, loss), self._empty
+        elif count == self.period + 1:
+            if change < 0:
+                loss -= change
+            else:
+                gain += change
+            loss /= self.period
+            gain /= self.period
+        else:
+            loss *= self.period - 1
+            gain *= self.period - 1
+            if change < 0:
+                loss -= change
+            else:
+                gain += change
+            loss /= self.period
+            gain /= self.period
+
+        total = gain + loss
+        value = 100.0 * (gain / total) if not _is_zero(total) else 0.0
+        return (count, price, gain, loss), (value,)
+
+
+class StreamingTRANGE(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `TRANGE` function.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(state=(0,))
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count = state[0] + 1
+        if count == 1:
+            return (count,), self._empty
+        return (count,), (_true_range(inputs),)
+
+
+class StreamingATR(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `ATR` function.
+    """
+
+    def __init__(self, period: int) -> None:
+        super().__init__(state=(0, 0.0))
+        self.period = period
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count, value = state
+        count += 1
+        if count == 1:
+            return (count, value), self._empty
+
+        true_range = _true_range(inputs)
+        if count <= self.period:
+            return (count, value + true_range), self._empty  # Seed sum
+        elif count == self.period + 1:
+            value = (value + true_range) / self.period
+        else:
+            value *= self.period - 1
+            value += true_range
+            value /= self.period
+        return (count, value), (value,)
+
+
+class StreamingMACD(StreamingFunction):
+    """
+    Provides an incremental form of the TA-Lib `MACD` function.
+
+    As with TA-Lib, both the fast and slow EMAs are seeded on the bar where the slow
+    EMA becomes available.
+
+    """
+
+    def __init__(
+        self,
+        fast_period: int,
+        slow_period: int,
+        signal_period: int,
+        price: str = "close",
+    ) -> None:
+        super().__init__(state=(0, 0.0, 0.0, 0.0), output_count=3)
+        if slow_period < fast_period:
+            fast_period, slow_period = slow_period, fast_period
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.price = price
+        self.fast_alpha = 2.0 / (fast_period + 1)
+        self.slow_alpha = 2.0 / (slow_period + 1)
+        self.signal_alpha = 2.0 / (signal_period + 1)
+
+    def _step(self, state: tuple, inputs: InputRingBuffer) -> tuple[tuple, tuple[float, ...]]:
+        count, fast, slow, signal = state
+        count += 1
+        price = inputs.last(self.price)
+        if count < self.slow_period:
+            # Seed sums
+            slow += price
+            if count > self.slow_period - self.fast_period:
+                fast += price
+            return (count, fast, slow, signal), self._empty
+        elif count == self.slow_period:
+            slow = (slow + price) / self.slow_period
+            fast = (fast + price) / self.fast_period
+        else:
+            slow = ((price - slow) * self.slow_alpha) + slow
+            fast = ((price - fast) * self.fast_alpha) + fast
+
+        macd = fast - slow
+        signal_count = count - self.slow_period + 1
+        if signal_count < self.signal_period:
+            return (count, fast, slow, signal + macd), self._empty  # Seed sum
+        elif signal_count == self.signal_period:
+            signal = (signal + macd) / self.signal_period
+        else:
+            signal = ((macd - signal) * self.signal_alpha) + signal
+        return (count, fast, slow, signal), (macd, signal, macd - signal)
+
+
+def _is_zero(value: float) -> bool:
+    # Matches the TA-Lib `TA_IS_ZERO` tolerance
+    return -0.00000001 < value < 0.00000001
+
+
+def _true_range(inputs: InputRingBuffer) -> float:
+    high = inputs.last("high")
+    low = inputs.last("low")
+    prev_close = inputs.ago("close", 1)
+    greatest = high - low
+    value = abs(prev_close - high)
+    if value > greatest:
+        greatest = value
+    value = abs(prev_close - low)
+    if value > greatest:
+        greatest = value
+    return greatest
+
+
+def create_streaming_function(
+    name: str,
+    parameters: dict[str, Any],
+    input_names: dict[str, Any],
+) -> StreamingFunction | None:
+    """
+    Create an incremental form of the given TA-Lib function, if one is available.
+
+    Parameters
+    ----------
+    name : str
+        The TA-Lib function name.
+    parameters : dict[str, Any]
+        The TA-Lib function parameters.
+    input_names : dict[str, Any]
+        The TA-Lib function input names.
+
+    Returns
+    -------
+    StreamingFunction or ``None``
+        ``None`` if there is no incremental form of the function, or its inputs
+        are not the defaults.
+
+    """
+    price = input_names.get("price")
+    if name in ("SMA", "EMA", "RSI", "MACD") and price is None:
+        return None
+    if name in ("ATR", "TRANGE") and list(input_names.get("prices", ())) != [
+        "high",
+        "low",
+        "close",
+    ]:
+        return None
+
+    if name == "SMA":
+        return StreamingSMA(parameters["timeperiod"], price)
+    elif name == "EMA":
+        return StreamingEMA(parameters["timeperiod"], price)
+    elif name == "RSI":
+        return StreamingRSI(parameters["timeperiod"], price)
+    elif name == "ATR":
+        if parameters["timeperiod"] <= 1:
+            return StreamingTRANGE()
+        return StreamingATR(parameters["timeperiod"])
+    elif name == "TRANGE":
+        return StreamingTRANGE()
+    elif name == "MACD":
+        return StreamingMACD(
+            parameters["fastperiod"],
+            parameters["slowperiod"],
+            parameters["signalperiod"],
+            price,
+        )
+    else:
+        return None
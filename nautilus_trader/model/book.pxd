@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
@@ -35,6 +36,10 @@ from nautilus_trader.model.orders.base cimport Order
 cdef class OrderBook(Data):
     cdef OrderBook_API _mem
     cdef BookType _book_type
+    cdef list _bids_cache
+    cdef list _asks_cache
+    cdef int _bids_cache_depth
+    cdef int _asks_cache_depth
 
     cpdef void reset(self)
     cpdef void add(self, BookOrder order, uint64_t ts_event, uint8_t flags=*, uint64_t sequence=*)
@@ -49,8 +54,10 @@ cdef class OrderBook(Data):
     cpdef void apply(self, Data data)
     cpdef void check_integrity(self)
 
-    cpdef list bids(self)
-    cpdef list asks(self)
+    cpdef list bids(self, int depth=*)
+    cpdef list asks(self, int depth=*)
+    cpdef tuple bids_to_numpy(self, int depth)
+    cpdef tuple asks_to_numpy(self, int depth)
     cpdef best_bid_price(self)
     cpdef best_ask_price(self)
     cpdef best_bid_size(self)
@@ -64,6 +71,11 @@ cdef class OrderBook(Data):
     cpdef void update_trade_tick(self, TradeTick tick)
     cpdef str pprint(self, int num_levels=*)
 
+    cdef list _levels(self, OrderSide side, int depth)
+    cdef tuple _levels_to_numpy(self, OrderSide side, int depth)
+    cdef void _invalidate_levels(self, OrderSide side, int64_t price_raw, bint by_price)
+    cdef void _clear_levels(self)
+
 
 cdef class Level:
     cdef Level_API _mem
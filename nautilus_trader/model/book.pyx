@@ -16,6 +16,7 @@
 import pickle
 from operator import itemgetter
 
+import numpy as np
 import pandas as pd
 
 from libc.stdint cimport INT64_MAX
@@ -65,6 +66,7 @@ from nautilus_trader.core.rust.model cimport orderbook_get_quantity_for_price
 from nautilus_trader.core.rust.model cimport orderbook_has_ask
 from nautilus_trader.core.rust.model cimport orderbook_has_bid
 from nautilus_trader.core.rust.model cimport orderbook_instrument_id
+from nautilus_trader.core.rust.model cimport orderbook_levels_to_arrays
 from nautilus_trader.core.rust.model cimport orderbook_midpoint
 from nautilus_trader.core.rust.model cimport orderbook_new
 from nautilus_trader.core.rust.model cimport orderbook_pprint_to_cstr
@@ -96,6 +98,9 @@ from nautilus_trader.model.objects cimport Quantity
 cdef class OrderBook(Data):
     """
     Provides an order book which can handle L1/L2/L3 granularity data.
+
+    The levels returned from `bids()` and `asks()` are cached per side, and the cache is
+    only invalidated by updates which could touch the cached levels.
     """
 
     def __init__(
@@ -136,6 +141,7 @@ cdef class OrderBook(Data):
             instrument_id._mem,
             state[1],
         )
+        self._clear_levels()
         cdef int64_t ts_last = state[2]
         cdef int64_t sequence = state[3]
         cdef list orders = pickle.loads(state[4])
@@ -233,6 +239,7 @@ cdef class OrderBook(Data):
         Reset the order book (clear all stateful values).
         """
         orderbook_reset(&self._mem)
+        self._clear_levels()
 
     cpdef void add(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -261,6 +268,7 @@ cdef class OrderBook(Data):
             raise RuntimeError("Invalid book operation: cannot add order for L1_MBP book")
 
         orderbook_add(&self._mem, order._mem, flags, sequence, ts_event)
+        self._invalidate_levels(order._mem.side, order._mem.price.raw, by_price=True)
 
     cpdef void update(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -281,6 +289,11 @@ cdef class OrderBook(Data):
         Condition.not_none(order, "order")
 
         orderbook_update(&self._mem, order._mem, flags, sequence, ts_event)
+        self._invalidate_levels(
+            order._mem.side,
+            order._mem.price.raw,
+            by_price=self._book_type == BookType.L2_MBP,
+        )
 
     cpdef void delete(self, BookOrder order, uint64_t ts_event, uint8_t flags=0, uint64_t sequence=0):
         """
@@ -301,24 +314,32 @@ cdef class OrderBook(Data):
         Condition.not_none(order, "order")
 
         orderbook_delete(&self._mem, order._mem, flags, sequence, ts_event)
+        self._invalidate_levels(
+            order._mem.side,
+            order._mem.price.raw,
+            by_price=self._book_type == BookType.L2_MBP,
+        )
 
     cpdef void clear(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the entire order book.
         """
         orderbook_clear(&self._mem, sequence, ts_event)
+        self._clear_levels()
 
     cpdef void clear_bids(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the bids from the order book.
         """
         orderbook_clear_bids(&self._mem, sequence, ts_event)
+        self._bids_cache = None
 
     cpdef void clear_asks(self, uint64_t ts_event, uint64_t sequence=0):
         """
         Clear the asks from the order book.
         """
         orderbook_clear_asks(&self._mem, sequence, ts_event)
+        self._asks_cache = None
 
     cpdef void apply_delta(self, OrderBookDelta delta):
         """
@@ -339,6 +360,19 @@ cdef class OrderBook(Data):
 
         orderbook_apply_delta(&self._mem, &delta._mem)
 
+        if delta._mem.action == BookAction.CLEAR:
+            self._clear_levels()
+            return
+
+        self._invalidate_levels(
+            delta._mem.order.side,
+            delta._mem.order.price.raw,
+            by_price=(
+                self._book_type == BookType.L2_MBP
+                or (self._book_type == BookType.L3_MBO and delta._mem.action == BookAction.ADD)
+            ),
+        )
+
     cpdef void apply_deltas(self, OrderBookDeltas deltas):
         """
         Apply the bulk deltas to the order book.
@@ -352,6 +386,7 @@ cdef class OrderBook(Data):
         Condition.not_none(deltas, "deltas")
 
         orderbook_apply_deltas(&self._mem, &deltas._mem)
+        self._clear_levels()
 
     cpdef void apply_depth(self, OrderBookDepth10 depth):
         """
@@ -366,6 +401,7 @@ cdef class OrderBook(Data):
         Condition.not_none(depth, "depth")
 
         orderbook_apply_depth(&self._mem, &depth._mem)
+        self._clear_levels()
 
     cpdef void apply(self, Data data):
         """
@@ -402,41 +438,121 @@ cdef class OrderBook(Data):
         if not orderbook_check_integrity(&self._mem):
             raise RuntimeError(f"Integrity error: orders in cross [{self.best_bid_price()} {self.best_ask_price()}]")
 
-    cpdef list bids(self):
+    cpdef list bids(self, int depth=0):
         """
         Return the bid levels for the order book.
 
+        Parameters
+        ----------
+        depth : int, default 0
+            The maximum number of levels to return. If zero then returns all levels.
+
         Returns
         -------
         list[Level]
             Sorted in descending order of price.
 
+        Raises
+        ------
+        ValueError
+            If `depth` is negative.
+
         """
-        cdef CVec raw_levels_vec = orderbook_bids(&self._mem)
-        cdef Level_API* raw_levels = <Level_API*>raw_levels_vec.ptr
+        return self._levels(OrderSide.BUY, depth)
 
-        cdef list levels = []
+    cpdef list asks(self, int depth=0):
+        """
+        Return the ask levels for the order book.
 
-        cdef:
-            uint64_t i
-        for i in range(raw_levels_vec.len):
-            levels.append(Level.from_mem_c(raw_levels[i]))
+        Parameters
+        ----------
+        depth : int, default 0
+            The maximum number of levels to return. If zero then returns all levels.
 
-        vec_levels_drop(raw_levels_vec)
+        Returns
+        -------
+        list[Level]
+            Sorted in ascending order of price.
 
-        return levels
+        Raises
+        ------
+        ValueError
+            If `depth` is negative.
 
-    cpdef list asks(self):
         """
-        Return the bid levels for the order book.
+        return self._levels(OrderSide.SELL, depth)
+
+    cpdef tuple bids_to_numpy(self, int depth):
+        """
+        Return the top bid levels as NumPy arrays.
+
+        The arrays are filled directly from the book, without creating `Level` objects.
+
+        Parameters
+        ----------
+        depth : int
+            The maximum number of levels to return.
 
         Returns
         -------
-        list[Level]
-            Sorted in ascending order of price.
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The prices (float64), sizes (float64) and order counts (uint64) for each level,
+            sorted in descending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        return self._levels_to_numpy(OrderSide.BUY, depth)
 
+    cpdef tuple asks_to_numpy(self, int depth):
         """
-        cdef CVec raw_levels_vec = orderbook_asks(&self._mem)
+        Return the top ask levels as NumPy arrays.
+
+        The arrays are filled directly from the book, without creating `Level` objects.
+
+        Parameters
+        ----------
+        depth : int
+            The maximum number of levels to return.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The prices (float64), sizes (float64) and order counts (uint64) for each level,
+            sorted in ascending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        return self._levels_to_numpy(OrderSide.SELL, depth)
+
+    cdef list _levels(self, OrderSide side, int depth):
+        Condition.not_negative_int(depth, "depth")
+
+        cdef list cache = self._asks_cache
+        cdef int cache_depth = self._asks_cache_depth
+        if side == OrderSide.BUY:
+            cache = self._bids_cache
+            cache_depth = self._bids_cache_depth
+
+        if cache is not None and (
+            cache_depth == 0  # Cached all levels
+            or len(cache) < cache_depth  # Cached all levels
+            or 0 < depth <= cache_depth
+        ):
+            return cache[:depth] if depth > 0 else cache[:]
+
+        cdef CVec raw_levels_vec
+        if side == OrderSide.BUY:
+            raw_levels_vec = orderbook_bids(&self._mem, depth)
+        else:
+            raw_levels_vec = orderbook_asks(&self._mem, depth)
         cdef Level_API* raw_levels = <Level_API*>raw_levels_vec.ptr
 
         cdef list levels = []
@@ -448,7 +564,61 @@ cdef class OrderBook(Data):
 
         vec_levels_drop(raw_levels_vec)
 
-        return levels
+        if side == OrderSide.BUY:
+            self._bids_cache = levels
+            self._bids_cache_depth = depth
+        else:
+            self._asks_cache = levels
+            self._asks_cache_depth = depth
+
+        return levels[:]
+
+    cdef tuple _levels_to_numpy(self, OrderSide side, int depth):
+        Condition.positive_int(depth, "depth")
+
+        prices = np.empty(depth, dtype=np.float64)
+        sizes = np.empty(depth, dtype=np.float64)
+        counts = np.empty(depth, dtype=np.uint64)
+
+        cdef double[::1] prices_view = prices
+        cdef double[::1] sizes_view = sizes
+        cdef uint64_t[::1] counts_view = counts
+
+        cdef uint64_t count = orderbook_levels_to_arrays(
+            &self._mem,
+            side,
+            depth,
+            &prices_view[0],
+            &sizes_view[0],
+            &counts_view[0],
+        )
+
+        return prices[:count], sizes[:count], counts[:count]
+
+    cdef void _invalidate_levels(self, OrderSide side, int64_t price_raw, bint by_price):
+        # When `by_price` the update only touched the level at `price_raw`, so a cached
+        # view which is bounded by a better price than this level is still valid
+        cdef Level bound
+        if side == OrderSide.BUY:
+            if self._bids_cache is None:
+                return
+            if by_price and 0 < self._bids_cache_depth == len(self._bids_cache):
+                bound = self._bids_cache[-1]
+                if price_raw < level_price(&bound._mem).raw:
+                    return
+            self._bids_cache = None
+        elif side == OrderSide.SELL:
+            if self._asks_cache is None:
+                return
+            if by_price and 0 < self._asks_cache_depth == len(self._asks_cache):
+                bound = self._asks_cache[-1]
+                if price_raw > level_price(&bound._mem).raw:
+                    return
+            self._asks_cache = None
+
+    cdef void _clear_levels(self):
+        self._bids_cache = None
+        self._asks_cache = None
 
     cpdef best_bid_price(self):
         """
@@ -664,6 +834,7 @@ cdef class OrderBook(Data):
             )
 
         orderbook_update_quote_tick(&self._mem, &tick._mem)
+        self._clear_levels()
 
     cpdef void update_trade_tick(self, TradeTick tick):
         """
@@ -689,6 +860,7 @@ cdef class OrderBook(Data):
             )
 
         orderbook_update_trade_tick(&self._mem, &tick._mem)
+        self._clear_levels()
 
     cpdef str pprint(self, int num_levels=3):
         """
@@ -16,9 +16,11 @@
 from __future__ import annotations
 
 import itertools
+import json
 import os
 import pathlib
 import platform
+import warnings
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
@@ -30,6 +32,7 @@ from typing import Any, NamedTuple
 import fsspec
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from fsspec.implementations.local import make_path_posix
@@ -74,6 +77,8 @@ class FeatherFile(NamedTuple):
 
 _NAUTILUS_PATH = "NAUTILUS_PATH"
 _DEFAULT_FS_PROTOCOL = "file"
+_MANIFEST_FILENAME = "_manifest.json"
+_MANIFEST_VERSION = 2
 
 
 class ParquetDataCatalog(BaseDataCatalog):
@@ -115,6 +120,15 @@ class ParquetDataCatalog(BaseDataCatalog):
     For further details about `fsspec` and its filesystem protocols, see
     https://filesystem-spec.readthedocs.io/en/latest/.
 
+    Each instrument ID (or bar type) directory holds a `_manifest.json` index which records
+    every file written with `write_chunk` (with its `ts_init` range, row count and schema),
+    files written directly under a data class directory are indexed in that directory.
+    Queries only read the indexes (and list the directories) for the requested instrument
+    IDs or bar types, and prune files by time range without opening them. Directories
+    without an index are globbed as before. If the files listed in a directory differ from
+    its index (added or removed other than by writing through the catalog), a warning is
+    issued and the directory is globbed, call `rebuild_manifest` to reindex.
+
     """
 
     def __init__(
@@ -244,14 +258,26 @@ class ParquetDataCatalog(BaseDataCatalog):
         path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
         kw = dict(**self.dataset_kwargs, **kwargs)
 
+        entries: dict[str, dict[str, Any]] = {}
         if "partitioning" not in kw:
-            self._fast_write(
+            file_path = self._fast_write(
                 table=table,
                 path=path,
                 fs=self.fs,
                 basename_template=basename_template,
             )
+            entries[file_path] = self._manifest_entry_from_table(file_path, table)
         else:
+            user_file_visitor = kw.pop("file_visitor", None)
+
+            def file_visitor(written_file: Any) -> None:
+                entries[written_file.path] = self._manifest_entry_from_metadata(
+                    written_file.path,
+                    written_file.metadata,
+                )
+                if user_file_visitor is not None:
+                    user_file_visitor(written_file)
+
             # Write parquet file
             pds.write_dataset(
                 data=table,
@@ -261,25 +287,304 @@ class ParquetDataCatalog(BaseDataCatalog):
                 filesystem=self.fs,
                 min_rows_per_group=self.min_rows_per_group,
                 max_rows_per_group=self.max_rows_per_group,
-                **self.dataset_kwargs,
-                **kwargs,
+                file_visitor=file_visitor,
+                **kw,
             )
 
+        self._update_manifest(data_cls, entries)
+
     def _fast_write(
         self,
         table: pa.Table,
         path: str,
         fs: fsspec.AbstractFileSystem,
         basename_template: str,
-    ) -> None:
+    ) -> str:
         name = basename_template.format(i=0)
         fs.mkdirs(path, exist_ok=True)
+        file_path = f"{path}/{name}.parquet"
         pq.write_table(
             table,
-            where=f"{path}/{name}.parquet",
+            where=file_path,
             filesystem=fs,
             row_group_size=self.max_rows_per_group,
         )
+        return file_path
+
+    # -- MANIFEST ---------------------------------------------------------------------------------
+
+    def _class_path(self, data_cls: type) -> str:
+        return f"{self.path}/data/{class_to_filename(data_cls)}"
+
+    def _manifest_path(self, data_cls: type, identifier: str | None = None) -> str:
+        if identifier is None:
+            return f"{self._class_path(data_cls)}/{_MANIFEST_FILENAME}"
+        return f"{self._class_path(data_cls)}/{identifier}/{_MANIFEST_FILENAME}"
+
+    def _manifest_key(self, file_path: str) -> str:
+        # Keys are relative to the catalog root so the catalog can be relocated
+        prefix = self.path.rstrip("/") + "/"
+        return file_path[len(prefix) :] if file_path.startswith(prefix) else file_path
+
+    def _manifest_identifier(self, file_path: str) -> str | None:
+        # The identifier is the instrument ID (or bar type) directory, if any
+        parts = self._manifest_key(file_path).split("/")
+        return parts[2] if len(parts) > 3 else None
+
+    def _manifest_entry(
+        self,
+        file_path: str,
+        ts_init_min: int | None,
+        ts_init_max: int | None,
+        num_rows: int,
+        schema: pa.Schema,
+    ) -> dict[str, Any]:
+        return {
+            "identifier": self._manifest_identifier(file_path),
+            "ts_init_min": ts_init_min,
+            "ts_init_max": ts_init_max,
+            "num_rows": num_rows,
+            "schema": {field.name: str(field.type) for field in schema},
+        }
+
+    def _manifest_entry_from_table(self, file_path: str, table: pa.Table) -> dict[str, Any]:
+        ts_init_min = ts_init_max = None
+        if "ts_init" in table.column_names and table.num_rows:
+            min_max = pc.min_max(table["ts_init"])
+            ts_init_min = min_max["min"].as_py()
+            ts_init_max = min_max["max"].as_py()
+
+        return self._manifest_entry(
+            file_path,
+            ts_init_min=ts_init_min,
+            ts_init_max=ts_init_max,
+            num_rows=table.num_rows,
+            schema=table.schema,
+        )
+
+    def _manifest_entry_from_metadata(
+        self,
+        file_path: str,
+        metadata: pq.FileMetaData,
+    ) -> dict[str, Any]:
+        schema = metadata.schema.to_arrow_schema()
+        ts_init_min = ts_init_max = None
+        if "ts_init" in schema.names and metadata.num_rows:
+            column_index = schema.get_field_index("ts_init")
+            for i in range(metadata.num_row_groups):
+                stats = metadata.row_group(i).column(column_index).statistics
+                if stats is None or not stats.has_min_max:
+                    # No statistics, so the range is unknown and the file is never pruned
+                    ts_init_min = ts_init_max = None
+                    break
+                ts_init_min = stats.min if ts_init_min is None else min(ts_init_min, stats.min)
+                ts_init_max = stats.max if ts_init_max is None else max(ts_init_max, stats.max)
+
+        return self._manifest_entry(
+            file_path,
+            ts_init_min=ts_init_min,
+            ts_init_max=ts_init_max,
+            num_rows=metadata.num_rows,
+            schema=schema,
+        )
+
+    def _read_manifest(
+        self,
+        data_cls: type,
+        identifier: str | None = None,
+    ) -> dict[str, dict[str, Any]] | None:
+        manifest_path = self._manifest_path(data_cls, identifier)
+        try:
+            with self.fs.open(manifest_path, "r") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return None
+
+        return manifest["files"]
+
+    def _write_manifest(
+        self,
+        data_cls: type,
+        identifier: str | None,
+        files: dict[str, dict[str, Any]],
+    ) -> None:
+        manifest = {"version": _MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+        with self.fs.open(self._manifest_path(data_cls, identifier), "w") as f:
+            json.dump(manifest, f)
+
+    def _update_manifest(self, data_cls: type, entries: dict[str, dict[str, Any]]) -> None:
+        # Only the manifests for the identifiers written to are read and rewritten
+        identifier_entries: dict[str | None, dict[str, dict[str, Any]]] = defaultdict(dict)
+        for file_path, entry in entries.items():
+            identifier_entries[entry["identifier"]][self._manifest_key(file_path)] = entry
+
+        for identifier, updates in identifier_entries.items():
+            files = self._read_manifest(data_cls, identifier)
+            if files is None:
+                # Index any files written before the manifest existed
+                files = self._scan_manifest_files(data_cls, identifier)
+            files.update(updates)
+            self._write_manifest(data_cls, identifier, files)
+
+    def _list_class_path(self, data_cls: type) -> tuple[list[str], list[str]]:
+        # Return the identifier directory names, and data files, directly under the class path
+        try:
+            infos = self.fs.ls(self._class_path(data_cls), detail=True)
+        except FileNotFoundError:
+            return [], []
+
+        identifiers: list[str] = []
+        file_paths: list[str] = []
+        for info in infos:
+            name = info["name"].rstrip("/")
+            basename = name.rsplit("/", 1)[-1]
+            if basename.startswith(("_", ".")):
+                continue  # Ignored as for datasets (includes the manifest)
+            if info["type"] == "directory":
+                identifiers.append(basename)
+            else:
+                file_paths.append(name)
+
+        return sorted(identifiers), file_paths
+
+    def _list_data_files(self, data_cls: type, identifier: str | None = None) -> list[str]:
+        if identifier is None:
+            return self._list_class_path(data_cls)[1]
+
+        try:
+            file_paths = self.fs.find(f"{self._class_path(data_cls)}/{identifier}")
+        except FileNotFoundError:
+            return []
+
+        return [
+            file_path
+            for file_path in file_paths
+            # Ignored as for datasets (includes the manifest)
+            if not file_path.rsplit("/", 1)[-1].startswith(("_", "."))
+        ]
+
+    def _scan_manifest_files(
+        self,
+        data_cls: type,
+        identifier: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        files: dict[str, dict[str, Any]] = {}
+        for file_path in self._list_data_files(data_cls, identifier):
+            with self.fs.open(file_path, "rb") as f:
+                metadata = pq.read_metadata(f)
+            files[self._manifest_key(file_path)] = self._manifest_entry_from_metadata(
+                file_path,
+                metadata,
+            )
+
+        return files
+
+    def rebuild_manifest(self, data_cls: type) -> None:
+        """
+        Rebuild the manifest indexes for the given data class from the files on disk.
+
+        Only the Parquet footers are read. This should be called if files for the
+        data class are added or removed other than by writing through the catalog.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data class to reindex.
+
+        """
+        if not self.fs.exists(self._class_path(data_cls)):
+            return
+
+        identifiers, _ = self._list_class_path(data_cls)
+        for identifier in [None, *identifiers]:
+            self._write_manifest(
+                data_cls,
+                identifier,
+                self._scan_manifest_files(data_cls, identifier),
+            )
+
+    def _query_identifiers(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | str | None = None,
+        bar_types: list[str] | str | None = None,
+    ) -> list[str] | None:
+        # Return the identifier directories the query can match, or ``None`` for all
+        if bar_types:
+            if not isinstance(bar_types, list):
+                bar_types = [bar_types]
+            return [urisafe_instrument_id(x) for x in bar_types]
+        elif instrument_ids:
+            if not isinstance(instrument_ids, list):
+                instrument_ids = [instrument_ids]
+            if data_cls == Bar:
+                # Bar type directories are prefixed with the instrument ID
+                prefixes = tuple(urisafe_instrument_id(x) + "-" for x in instrument_ids)
+                identifiers, _ = self._list_class_path(data_cls)
+                return [x for x in identifiers if x.startswith(prefixes)]
+            return [urisafe_instrument_id(x) for x in instrument_ids]
+
+        return None
+
+    def _query_files(
+        self,
+        data_cls: type,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        identifiers: list[str] | None = None,
+    ) -> list[tuple[str, dict[str, Any]]] | None:
+        """
+        Return the files (and their manifest entries) for the given data class and
+        identifiers (or all if ``None``) whose `ts_init` range overlaps the given time
+        range, or ``None`` if a manifest is missing or does not match the files in its
+        directory.
+        """
+        identifier_files: list[tuple[str | None, list[str]]] = []
+        if identifiers is None:
+            all_identifiers, root_files = self._list_class_path(data_cls)
+            identifier_files.append((None, root_files))
+            identifiers = all_identifiers
+
+        # Only the requested identifier directories are listed (without opening files),
+        # to detect files added or removed other than by writing through the catalog
+        for identifier in identifiers:
+            identifier_files.append((identifier, self._list_data_files(data_cls, identifier)))
+
+        start_ns = pd.Timestamp(start).value if start is not None else None
+        end_ns = pd.Timestamp(end).value if end is not None else None
+
+        matched: list[tuple[str, dict[str, Any]]] = []
+        for identifier, file_paths in identifier_files:
+            listed = {self._manifest_key(file_path) for file_path in file_paths}
+            files = self._read_manifest(data_cls, identifier) if listed else {}
+            if files is None:
+                return None  # Files written before the manifest existed
+
+            if listed != files.keys():
+                name = data_cls.__name__ if identifier is None else f"{identifier} {data_cls.__name__}"
+                warnings.warn(
+                    f"Manifest for {name} does not match the files in the catalog "
+                    f"({len(listed - files.keys())} unindexed, "
+                    f"{len(files.keys() - listed)} missing), querying all files "
+                    "(call `rebuild_manifest` to reindex)",
+                    stacklevel=2,
+                )
+                return None
+
+            for key, entry in files.items():
+                ts_init_min = entry["ts_init_min"]
+                ts_init_max = entry["ts_init_max"]
+                if start_ns is not None and ts_init_max is not None and ts_init_max < start_ns:
+                    continue
+                if end_ns is not None and ts_init_min is not None and ts_init_min > end_ns:
+                    continue
+                matched.append((f"{self.path}/{key}", entry))
+
+        matched.sort(key=lambda x: x[0])
+        return matched
 
     def write_data(
         self,
@@ -367,7 +672,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         where: str | None = None,
         **kwargs: Any,
     ) -> list[Data | CustomData]:
-        if self.fs_protocol == "file" and data_cls in (
+        if data_cls in (
             OrderBookDelta,
             OrderBookDepth10,
             QuoteTick,
@@ -413,7 +718,14 @@ class ParquetDataCatalog(BaseDataCatalog):
         session: DataBackendSession | None = None,
         **kwargs: Any,
     ) -> DataBackendSession:
-        assert self.fs_protocol == "file", "Only file:// protocol is supported for Rust queries"
+        """
+        Return a Rust backend session with queries added for the given data.
+
+        Local files are read directly by the session. Files on any other `fsspec`
+        filesystem are read with `pyarrow` and streamed to the session as Arrow record
+        batches, which are then queried, merged and decoded in the same way.
+
+        """
         data_type: NautilusDataType = ParquetDataCatalog._nautilus_data_cls_to_data_type(data_cls)
 
         if session is None:
@@ -422,13 +734,22 @@ class ParquetDataCatalog(BaseDataCatalog):
             raise ValueError("`session` was `None` when a value was expected")
 
         file_prefix = class_to_filename(data_cls)
-        glob_path = f"{self.path}/data/{file_prefix}/**/*"
-        dirs: list[str] = self.fs.glob(glob_path)
+        files = self._query_files(
+            data_cls,
+            start=start,
+            end=end,
+            identifiers=self._query_identifiers(data_cls, instrument_ids, bar_types),
+        )
+        if files is not None:
+            dirs = [path for path, _ in files]
+        else:
+            glob_path = f"{self.path}/data/{file_prefix}/**/*"
+            dirs = [p for p in self.fs.glob(glob_path) if not p.endswith(_MANIFEST_FILENAME)]
+            assert all(self.fs.exists(path) for path in dirs)
         if self.show_query_paths:
             print(dirs)
 
         for idx, path in enumerate(dirs):
-            assert self.fs.exists(path)
             # Parse the parent directory which *should* be the instrument ID,
             # this prevents us matching all instrument ID substrings.
             dir = path.split("/")[-2]
@@ -457,10 +778,59 @@ class ParquetDataCatalog(BaseDataCatalog):
                 where=where,
             )
 
-            session.add_file(data_type, table, str(path), query)
+            if self.fs_protocol == "file":
+                session.add_file(data_type, table, str(path), query)
+            else:
+                reader = self._record_batch_reader(str(path), start=start, end=end)
+                session.add_record_batch_reader(data_type, table, reader, query)
 
         return session
 
+    def _record_batch_reader(
+        self,
+        path: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> pa.RecordBatchReader:
+        # Read lazily through the filesystem, skipping row groups outside the time range
+        with self.fs.open(path, "rb") as f:
+            parquet_file = pq.ParquetFile(f)
+            schema = parquet_file.schema_arrow
+            row_groups = self._row_groups_in_range(parquet_file.metadata, start=start, end=end)
+
+        def iter_batches() -> Generator[pa.RecordBatch, None, None]:
+            # The file is reopened on first read and closed once the reader is exhausted
+            # (or released)
+            with self.fs.open(path, "rb") as f:
+                yield from pq.ParquetFile(f).iter_batches(row_groups=row_groups)
+
+        return pa.RecordBatchReader.from_batches(schema, iter_batches())
+
+    @staticmethod
+    def _row_groups_in_range(
+        metadata: pq.FileMetaData,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[int]:
+        start_ns = pd.Timestamp(start).value if start is not None else None
+        end_ns = pd.Timestamp(end).value if end is not None else None
+        schema = metadata.schema.to_arrow_schema()
+        if "ts_init" not in schema.names or (start_ns is None and end_ns is None):
+            return list(range(metadata.num_row_groups))
+
+        column_index = schema.get_field_index("ts_init")
+        row_groups: list[int] = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            if stats is not None and stats.has_min_max:
+                if start_ns is not None and stats.max < start_ns:
+                    continue
+                if end_ns is not None and stats.min > end_ns:
+                    continue
+            row_groups.append(i)
+
+        return row_groups
+
     def query_rust(
         self,
         data_cls: type,
@@ -506,6 +876,12 @@ class ParquetDataCatalog(BaseDataCatalog):
             return []
         table = self._load_pyarrow_table(
             path=dataset_path,
+            files=self._query_files(
+                data_cls,
+                start=start,
+                end=end,
+                identifiers=self._query_identifiers(data_cls, instrument_ids, bar_types),
+            ),
             filter_expr=filter_expr,
             instrument_ids=instrument_ids,
             bar_types=bar_types,
@@ -525,6 +901,7 @@ class ParquetDataCatalog(BaseDataCatalog):
     def _load_pyarrow_table(
         self,
         path: str,
+        files: list[tuple[str, dict[str, Any]]] | None = None,
         filter_expr: str | None = None,
         instrument_ids: list[str] | None = None,
         bar_types: list[str] | None = None,
@@ -532,27 +909,33 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
     ) -> pds.Dataset | None:
-        # Original dataset
-        dataset = pds.dataset(path, filesystem=self.fs)
+        # Candidate files from the manifest (already pruned by time range), else discovered
+        if files is not None:
+            file_paths = [file_path for file_path, _ in files]
+        else:
+            file_paths = pds.dataset(path, filesystem=self.fs).files
 
         # Instrument id filters (not stored in table, need to filter based on files)
         if instrument_ids is not None:
             if not isinstance(instrument_ids, list):
                 instrument_ids = [instrument_ids]
-            valid_files = [
+            file_paths = [
                 fn
-                for fn in dataset.files
+                for fn in file_paths
                 if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
             ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
 
         if bar_types is not None:
             if not isinstance(bar_types, list):
                 bar_types = [bar_types]
-            valid_files = [
-                fn for fn in dataset.files if any(x.replace("/", "") in fn for x in bar_types)
+            file_paths = [
+                fn for fn in file_paths if any(x.replace("/", "") in fn for x in bar_types)
             ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+
+        if files is not None and not file_paths:
+            return pa.table({})  # All files pruned
+
+        dataset = pds.dataset(file_paths, filesystem=self.fs)
 
         filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
         if start is not None:
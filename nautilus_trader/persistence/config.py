@@ -18,6 +18,7 @@ from __future__ import annotations
 import fsspec
 
 from nautilus_trader.common.config import NautilusConfig
+from nautilus_trader.common.config import PositiveInt
 
 
 class StreamingConfig(NautilusConfig, frozen=True):
@@ -39,6 +40,17 @@ class StreamingConfig(NautilusConfig, frozen=True):
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : PositiveInt, default 1000
+        The maximum number of objects to buffer per table before writing them
+        as a single record batch.
+    use_writer_thread : bool, default False
+        If objects should be serialized and written on a dedicated writer thread,
+        rather than on the thread publishing them on the message bus.
+    qsize : PositiveInt, default 100_000
+        The maximum number of objects held on the writer thread queue.
+    backpressure : str, default 'block'
+        The behavior when the writer thread queue is full, either 'block'
+        (wait for space), 'drop_oldest' or 'drop_newest'.
 
     """
 
@@ -48,6 +60,10 @@ class StreamingConfig(NautilusConfig, frozen=True):
     flush_interval_ms: int | None = None
     replace_existing: bool = False
     include_types: list[type] | None = None
+    batch_size: PositiveInt = 1000
+    use_writer_thread: bool = False
+    qsize: PositiveInt = 100_000
+    backpressure: str = "block"
 
     @property
     def fs(self):
@@ -0,0 +1,292 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from nautilus_trader.common.config import resolve_path
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+_ORDER_FILENAME = "_order.arrow"
+_STREAMS_METADATA_KEY = b"nautilus_streams"
+
+
+def _stream_key(obj: Data) -> tuple[type, str | None, str | None]:
+    metadata = None
+    if isinstance(obj, CustomData):
+        metadata = json.dumps(obj.data_type.metadata, sort_keys=True)
+        obj = obj.data
+    if hasattr(obj, "bar_type"):
+        return type(obj), str(obj.bar_type), metadata
+    elif hasattr(obj, "instrument_id"):
+        return type(obj), obj.instrument_id.value, metadata
+    return type(obj), None, metadata
+
+
+def _group_positions(stream_ids: np.ndarray) -> list[tuple[int, np.ndarray]]:
+    # Group the positions of each stream ID (in order) with a single stable sort
+    order = np.argsort(stream_ids, kind="stable")
+    unique_ids, starts, counts = np.unique(
+        stream_ids[order],
+        return_index=True,
+        return_counts=True,
+    )
+    return [
+        (stream_id, order[start : start + count])
+        for stream_id, start, count in zip(
+            unique_ids.tolist(),
+            starts.tolist(),
+            counts.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def write_data_stream(path: str, data: list[Data]) -> None:
+    """
+    Write the given data stream to the given directory as Arrow IPC files.
+
+    The data is written as one file per data type and instrument (or bar type),
+    together with the global ordering of the stream, so it can be reloaded with
+    a `DataStreamReader`.
+
+    Parameters
+    ----------
+    path : str
+        The local directory to write to (created if it does not exist).
+    data : list[Data]
+        The data stream to write (should be sorted by `ts_init`).
+
+    Raises
+    ------
+    ValueError
+        If `data` is empty.
+    ValueError
+        If `data` contains more than 65,535 data streams (the stream IDs are stored as uint16).
+    TypeError
+        If `data` contains a type which cannot be serialized to Arrow.
+
+    """
+    PyCondition.not_empty(data, "data")
+
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    keys: dict[tuple[type, str | None, str | None], int] = {}
+    stream_data: list[list[Data]] = []
+    stream_ids = np.empty(len(data), dtype=np.uint16)
+    for i, obj in enumerate(data):
+        key = _stream_key(obj)
+        stream_id = keys.get(key)
+        if stream_id is None:
+            stream_id = len(keys)
+            if stream_id > np.iinfo(np.uint16).max:
+                raise ValueError(f"Too many data streams to write, was {stream_id + 1}")
+            keys[key] = stream_id
+            stream_data.append([])
+        stream_ids[i] = stream_id
+        stream_data[stream_id].append(obj)
+
+    streams: list[dict[str, Any]] = []
+    stream_positions: dict[int, np.ndarray] = {}
+    row_counts: np.ndarray | None = None
+    for (data_cls, identifier, metadata), stream_id in keys.items():
+        objs = stream_data[stream_id]
+        if metadata is not None:
+            objs = [obj.data for obj in objs]  # Unwrap custom data
+        elif data_cls is OrderBookDeltas:
+            # Containers are flattened, so record the rows each element spans
+            if row_counts is None:
+                row_counts = np.ones(len(data), dtype=np.uint32)
+                stream_positions = dict(_group_positions(stream_ids))
+            row_counts[stream_positions[stream_id]] = [len(obj.deltas) for obj in objs]
+
+        table = ArrowSerializer.serialize_batch(objs, data_cls=data_cls)
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+
+        with pa.OSFile(str(directory / f"{stream_id}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        streams.append(
+            {
+                "cls": f"{data_cls.__module__}:{data_cls.__qualname__}",
+                "identifier": identifier,
+                "metadata": json.loads(metadata) if metadata is not None else None,
+                "custom": metadata is not None,
+            },
+        )
+
+    columns = {"stream": pa.array(stream_ids)}
+    if row_counts is not None:
+        columns["rows"] = pa.array(row_counts)
+    order = pa.table(columns).replace_schema_metadata(
+        {_STREAMS_METADATA_KEY: json.dumps(streams).encode()},
+    )
+    with pa.OSFile(str(directory / _ORDER_FILENAME), "wb") as sink:
+        with pa.ipc.new_file(sink, order.schema) as writer:
+            writer.write_table(order)
+
+
+class DataStreamReader:
+    """
+    Provides a reader for a data stream written by `write_data_stream`.
+
+    All files are memory mapped, and the data is only decoded as each chunk
+    of the stream is read, so the Arrow data is never copied into memory.
+
+    Parameters
+    ----------
+    path : str
+        The local directory the data stream was written to.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+
+        order = self._read_table(self._path / _ORDER_FILENAME)
+        self._streams: list[dict[str, Any]] = json.loads(
+            order.schema.metadata[_STREAMS_METADATA_KEY],
+        )
+        self._stream_ids: np.ndarray = self._to_numpy(order, "stream")
+        self._row_counts: np.ndarray | None = (
+            self._to_numpy(order, "rows") if "rows" in order.column_names else None
+        )
+        self._tables: dict[int, pa.Table] = {}
+
+    def __len__(self) -> int:
+        return len(self._stream_ids)
+
+    def iter_chunks(self, chunk_size: int = 1_000_000) -> Generator[list[Data], None, None]:
+        """
+        Return a generator of the data stream in chunks, in the original order.
+
+        Parameters
+        ----------
+        chunk_size : int, default 1_000_000
+            The maximum number of data elements per chunk.
+
+        Returns
+        -------
+        Generator[list[Data], None, None]
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive (> 0).
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        offsets = [0] * len(self._streams)  # Next table row per stream
+        for start in range(0, len(self), chunk_size):
+            chunk_ids = self._stream_ids[start : start + chunk_size]
+            chunk_rows = (
+                self._row_counts[start : start + chunk_size]
+                if self._row_counts is not None
+                else None
+            )
+            chunk: list[Data | None] = [None] * len(chunk_ids)
+            for stream_id, stream_positions in _group_positions(chunk_ids):
+                positions = stream_positions.tolist()
+                counts = chunk_rows[stream_positions] if chunk_rows is not None else None
+                num_rows = int(counts.sum()) if counts is not None else len(positions)
+
+                offset = offsets[stream_id]
+                decoded = self._decode(stream_id, offset, num_rows, counts)
+                offsets[stream_id] = offset + num_rows
+
+                for position, obj in zip(positions, decoded, strict=True):
+                    chunk[position] = obj
+
+            yield chunk
+
+    def read_all(self, chunk_size: int = 1_000_000) -> list[Data]:
+        """
+        Return the entire data stream.
+
+        Parameters
+        ----------
+        chunk_size : int, default 1_000_000
+            The maximum number of data elements to decode at a time.
+
+        Returns
+        -------
+        list[Data]
+
+        """
+        data: list[Data] = []
+        for chunk in self.iter_chunks(chunk_size):
+            data.extend(chunk)
+        return data
+
+    def _decode(
+        self,
+        stream_id: int,
+        offset: int,
+        num_rows: int,
+        counts: np.ndarray | None,
+    ) -> list[Data]:
+        stream = self._streams[stream_id]
+        data_cls = resolve_path(stream["cls"])
+
+        table = self._tables.get(stream_id)
+        if table is None:
+            table = self._read_table(self._path / f"{stream_id}.arrow")
+            self._tables[stream_id] = table
+
+        data = ParquetDataCatalog._handle_table_nautilus(
+            table.slice(offset, num_rows),
+            data_cls=data_cls,
+        )
+
+        if data_cls is OrderBookDeltas:
+            # Regroup the flattened deltas into their containers
+            grouped = []
+            i = 0
+            for count in counts.tolist():
+                deltas = data[i : i + count]
+                instrument_id = deltas[0].instrument_id
+                grouped.append(OrderBookDeltas(instrument_id=instrument_id, deltas=deltas))
+                i += count
+            return grouped
+        elif stream["custom"]:
+            data_type = DataType(data_cls, metadata=stream["metadata"])
+            return [CustomData(data_type=data_type, data=obj) for obj in data]
+
+        return data
+
+    @staticmethod
+    def _read_table(file_path: Path) -> pa.Table:
+        with pa.memory_map(str(file_path)) as source:
+            return pa.ipc.open_file(source).read_all()
+
+    @staticmethod
+    def _to_numpy(table: pa.Table, column: str) -> np.ndarray:
+        return table.column(column).combine_chunks().to_numpy(zero_copy_only=True)
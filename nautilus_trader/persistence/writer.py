@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime
+import threading
+from collections import deque
 from io import TextIOWrapper
 from typing import Any, BinaryIO
 
@@ -40,6 +42,9 @@ from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.serializer import register_arrow
 
 
+_BACKPRESSURE_MODES = ("block", "drop_oldest", "drop_newest")
+
+
 class StreamingFeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files.
@@ -57,6 +62,26 @@ class StreamingFeatherWriter:
     include_types : list[type], optional
         A list of Arrow serializable types to write.
         If this is specified then **only** the included types will be written.
+    batch_size : int, default 1000
+        The maximum number of objects to buffer per table before writing them
+        as a single record batch. Buffers are also written on each flush interval.
+    use_writer_thread : bool, default False
+        If objects should be serialized and written on a dedicated writer thread.
+        Calls to `write` then only place the object on a bounded queue.
+    qsize : int, default 100_000
+        The maximum number of objects held on the writer thread queue.
+    backpressure : str, default 'block'
+        The behavior of `write` when the writer thread queue is full, either
+        'block' (wait for space), 'drop_oldest' or 'drop_newest'.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive (> 0).
+    ValueError
+        If `qsize` is not positive (> 0).
+    KeyError
+        If `backpressure` is not a valid backpressure mode.
 
     """
 
@@ -67,7 +92,15 @@ class StreamingFeatherWriter:
         flush_interval_ms: int | None = None,
         replace: bool = False,
         include_types: list[type] | None = None,
+        batch_size: int = 1000,
+        use_writer_thread: bool = False,
+        qsize: int = 100_000,
+        backpressure: str = "block",
     ) -> None:
+        PyCondition.positive_int(batch_size, "batch_size")
+        PyCondition.positive_int(qsize, "qsize")
+        PyCondition.is_in(backpressure, _BACKPRESSURE_MODES, "backpressure", "_BACKPRESSURE_MODES")
+
         self.path = path
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.fs.makedirs(self.fs._parent(self.path), exist_ok=True)
@@ -94,12 +127,57 @@ class StreamingFeatherWriter:
             "trade_tick",
         }
         self._instruments: dict[InstrumentId, Instrument] = {}
+        self._buffers: dict[str | tuple[str, str], list[object]] = {}
+        self._buffer_classes: dict[str | tuple[str, str], type] = {}
+        self._batch_size = batch_size
         self._create_writers()
 
         self.flush_interval_ms = datetime.timedelta(milliseconds=flush_interval_ms or 1000)
         self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
         self.missing_writers: set[type] = set()
 
+        # Writer thread
+        self._qsize = qsize
+        self._backpressure = backpressure
+        self._queue: deque[object] = deque()
+        self._queue_cond = threading.Condition()
+        self._io_lock = threading.RLock()
+        self._is_writing = False
+        self._is_stopping = False
+        self._dropped_count = 0
+        self._thread: threading.Thread | None = None
+        if use_writer_thread:
+            self._thread = threading.Thread(
+                target=self._run_writer,
+                name=type(self).__name__,
+                daemon=True,
+            )
+            self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Return the number of objects waiting on the writer thread queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._queue)
+
+    @property
+    def dropped_count(self) -> int:
+        """
+        Return the count of objects dropped due to writer thread queue backpressure.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._dropped_count
+
     @property
     def is_closed(self) -> bool:
         """
@@ -191,10 +269,13 @@ class StreamingFeatherWriter:
 
         return metadata
 
-    def write(self, obj: object) -> None:  # noqa: C901
+    def write(self, obj: object) -> None:
         """
         Write the object to the stream.
 
+        When using a writer thread the object is queued, and written on the
+        writer thread.
+
         Parameters
         ----------
         obj : object
@@ -208,6 +289,61 @@ class StreamingFeatherWriter:
         """
         PyCondition.not_none(obj, "obj")
 
+        if self._thread is None or not self._thread.is_alive():
+            with self._io_lock:
+                self._write(obj)
+            return
+
+        with self._queue_cond:
+            if len(self._queue) >= self._qsize:
+                if self._backpressure == "block":
+                    self._queue_cond.wait_for(lambda: len(self._queue) < self._qsize)
+                elif self._backpressure == "drop_oldest":
+                    self._queue.popleft()
+                    self._dropped_count += 1
+                else:  # drop_newest
+                    self._dropped_count += 1
+                    return
+            self._queue.append(obj)
+            self._queue_cond.notify_all()
+
+    def _run_writer(self) -> None:
+        timeout_secs = self.flush_interval_ms.total_seconds()
+        while True:
+            with self._queue_cond:
+                if not self._queue and not self._is_stopping:
+                    self._queue_cond.wait(timeout=timeout_secs)
+                if not self._queue and self._is_stopping:
+                    return
+                objs = list(self._queue)
+                self._queue.clear()
+                self._is_writing = True
+                self._queue_cond.notify_all()  # Queue now has space
+
+            try:
+                with self._io_lock:
+                    for obj in objs:
+                        try:
+                            self._write(obj)
+                        except Exception as e:
+                            self.logger.error(f"Failed to write {obj!r}: {e}")
+                    self.check_flush()
+            except Exception as e:
+                self.logger.error(f"Failed to flush: {e}")
+            finally:
+                with self._queue_cond:
+                    self._is_writing = False
+                    self._queue_cond.notify_all()
+
+    def _drain(self) -> None:
+        # Wait for the writer thread to write all queued objects
+        if self._thread is None or not self._thread.is_alive():
+            return
+        with self._queue_cond:
+            self._queue_cond.notify_all()
+            self._queue_cond.wait_for(lambda: not self._queue and not self._is_writing)
+
+    def _write(self, obj: object) -> None:  # noqa: C901
         cls = obj.__class__
 
         # Check if an include types filter has been specified
@@ -242,18 +378,49 @@ class StreamingFeatherWriter:
             else:
                 return
 
+        buffer_key: str | tuple[str, str] = table
         if table in self._per_instrument_writers:
-            writer: RecordBatchStreamWriter = self._instrument_writers[(table, obj.instrument_id.value)]  # type: ignore
-        else:
-            writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
+            buffer_key = (table, obj.instrument_id.value)  # type: ignore
+
+        buffer = self._buffers.get(buffer_key)
+        if buffer is None:
+            buffer = []
+            self._buffers[buffer_key] = buffer
+            self._buffer_classes[buffer_key] = cls
+
+        buffer.append(obj)
+        if len(buffer) >= self._batch_size:
+            self._write_buffer(buffer_key)
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
-        if not serialized:
+        self.check_flush()
+
+    def _write_buffer(self, key: str | tuple[str, str]) -> None:
+        buffer = self._buffers.get(key)
+        if not buffer:
             return
 
+        self._buffers[key] = []
+        cls = self._buffer_classes[key]
+
+        if isinstance(key, tuple):
+            writer: RecordBatchStreamWriter = self._instrument_writers[key]
+        else:
+            writer: RecordBatchStreamWriter = self._writers[key]  # type: ignore
+
+        try:
+            serialized = ArrowSerializer.serialize_batch(buffer, data_cls=cls)
+            # Write the buffered objects as a single record batch
+            writer.write_table(serialized.combine_chunks())
+        except Exception:
+            # Isolate the objects which failed to serialize
+            for obj in buffer:
+                self._write_object(writer, obj, cls)
+
+    def _write_object(self, writer: RecordBatchStreamWriter, obj: object, cls: type) -> None:
         try:
-            writer.write_table(serialized)
-            self.check_flush()
+            serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
+            if serialized:
+                writer.write_table(serialized)
         except Exception as e:
             self.logger.error(f"Failed to serialize {cls=}")
             self.logger.error(f"ERROR = `{e}`")
@@ -265,13 +432,22 @@ class StreamingFeatherWriter:
         """
         now = datetime.datetime.now()
         if now - self._last_flush > self.flush_interval_ms:
-            self.flush()
+            self._flush()
             self._last_flush = now
 
     def flush(self) -> None:
         """
-        Flush all stream writers.
+        Write all buffered objects and flush all stream writers.
+
+        When using a writer thread, all queued objects are written first.
         """
+        self._drain()
+        with self._io_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        for key in tuple(self._buffers):
+            self._write_buffer(key)
         for stream in self._files.values():
             if not stream.closed:
                 stream.flush()
@@ -279,7 +455,16 @@ class StreamingFeatherWriter:
     def close(self) -> None:
         """
         Flush and close all stream writers.
+
+        When using a writer thread, all queued objects are written and the
+        thread is stopped first.
         """
+        if self._thread is not None:
+            with self._queue_cond:
+                self._is_stopping = True
+                self._queue_cond.notify_all()
+            self._thread.join()
+
         self.flush()
         for wcls in tuple(self._writers):
             self._writers[wcls].close()
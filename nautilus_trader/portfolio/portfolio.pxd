@@ -20,15 +20,18 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
@@ -43,7 +46,12 @@ cdef class Portfolio(PortfolioFacade):
     cdef Venue _venue
     cdef dict _unrealized_pnls
     cdef dict _net_positions
+    cdef dict _net_exposures
+    cdef dict _net_exposure_positions
+    cdef dict _open_positions
+    cdef dict _open_totals
     cdef set _pending_calcs
+    cdef set _pending_margins
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -59,6 +67,10 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
+    cdef bint _update_margins(self, Account account, Instrument instrument)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
-    cdef Price _get_last_price(self, Position position)
+    cdef void _update_open_totals(self, InstrumentId instrument_id, PositionId position_id, PositionSide side, Quantity quantity, double avg_px_open)
+    cdef void _update_net_exposure(self, InstrumentId instrument_id, PositionId position_id, PositionSide side, OrderSide entry, Quantity quantity)
+    cdef tuple _calculate_net_exposure(self, Account account, Instrument instrument, str label)
+    cdef Price _get_last_price(self, InstrumentId instrument_id, PositionSide side)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
@@ -54,10 +54,13 @@ from nautilus_trader.model.events.order cimport OrderUpdated
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.functions cimport position_side_to_str
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
@@ -108,7 +111,12 @@ cdef class Portfolio(PortfolioFacade):
         self._venue = None  # Venue for specific portfolio behavior (Interactive Brokers)
         self._unrealized_pnls: dict[InstrumentId, Money] = {}
         self._net_positions: dict[InstrumentId, Decimal] = {}
+        self._net_exposures: dict[InstrumentId, dict] = {}
+        self._net_exposure_positions: dict[PositionId, tuple] = {}
+        self._open_positions: dict[InstrumentId, dict[PositionId, tuple]] = {}
+        self._open_totals: dict[InstrumentId, dict[PositionSide, tuple]] = {}
         self._pending_calcs: set[InstrumentId] = set()
+        self._pending_margins: set[InstrumentId] = set()
 
         self.analyzer = PortfolioAnalyzer()
 
@@ -226,6 +234,8 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._net_exposures.clear()
+        self._net_exposure_positions.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -233,6 +243,20 @@ cdef class Portfolio(PortfolioFacade):
         cdef Position position
         for position in all_positions_open:
             instruments.add(position.instrument_id)
+            self._update_net_exposure(
+                instrument_id=position.instrument_id,
+                position_id=position.id,
+                side=position.side,
+                entry=position.entry,
+                quantity=position.quantity,
+            )
+            self._update_open_totals(
+                instrument_id=position.instrument_id,
+                position_id=position.id,
+                side=position.side,
+                quantity=position.quantity,
+                avg_px_open=position.avg_px_open,
+            )
 
         cdef bint initialized = True
 
@@ -336,41 +360,18 @@ cdef class Portfolio(PortfolioFacade):
             )
             return  # No instrument found
 
-        cdef list orders_open = self._cache.orders_open(
-            venue=None,  # Faster query filtering
-            instrument_id=tick.instrument_id,
-        )
-
-        cdef:
-            Order o
-        # Initialize initial (order) margin
-        cdef AccountState result_init = self._accounts.update_orders(
-            account=account,
-            instrument=instrument,
-            orders_open=[o for o in orders_open if o.is_passive_c()],
-            ts_event=account.last_event_c().ts_event,
-        )
+        if tick.instrument_id in self._pending_margins:
+            if not self._update_margins(account, instrument):
+                return  # Margins still pending
 
-        result_maint = None
-        if account.is_margin_account:
-            positions_open = self._cache.positions_open(
-                venue=None,  # Faster query filtering
-                instrument_id=tick.instrument_id,
-            )
-
-            # Initialize maintenance (position) margin
-            result_maint = self._accounts.update_positions(
-                account=account,
-                instrument=instrument,
-                positions_open=positions_open,
-                ts_event=account.last_event_c().ts_event,
-            )
+            # Margins are not recalculated for the remaining pending calculations
+            self._pending_margins.discard(tick.instrument_id)
 
         # Calculate unrealized PnL
         cdef Money result_unrealized_pnl = self._calculate_unrealized_pnl(tick.instrument_id)
 
         # Check portfolio initialization
-        if result_init is not None and (account.is_cash_account or (result_maint is not None and result_unrealized_pnl)):
+        if account.is_cash_account or result_unrealized_pnl:
             self._pending_calcs.discard(tick.instrument_id)
             if not self._pending_calcs:
                 self.initialized = True
@@ -478,6 +479,7 @@ cdef class Portfolio(PortfolioFacade):
         if account_state is None:
             self._log.debug(f"Added pending calculation for {instrument.id}")
             self._pending_calcs.add(instrument.id)
+            self._pending_margins.add(instrument.id)
         else:
             self._msgbus.publish_c(
                 topic=f"events.account.{account.id}",
@@ -506,6 +508,20 @@ cdef class Portfolio(PortfolioFacade):
             instrument_id=event.instrument_id,
             positions_open=positions_open
         )
+        self._update_net_exposure(
+            instrument_id=event.instrument_id,
+            position_id=event.position_id,
+            side=event.side,
+            entry=event.entry,
+            quantity=event.quantity,
+        )
+        self._update_open_totals(
+            instrument_id=event.instrument_id,
+            position_id=event.position_id,
+            side=event.side,
+            quantity=event.quantity,
+            avg_px_open=event.avg_px_open,
+        )
 
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
@@ -530,17 +546,26 @@ cdef class Portfolio(PortfolioFacade):
             )
             return  # No instrument found
 
-        self._accounts.update_positions(
+        cdef AccountState result = self._accounts.update_positions(
             account=account,
             instrument=instrument,
             positions_open=positions_open,
             ts_event=event.ts_event,
         )
+        if result is None:
+            self._log.debug(f"Added pending calculation for {instrument.id}")
+            self._pending_calcs.add(instrument.id)
+            self._pending_margins.add(instrument.id)
 
     def _reset(self) -> None:
         self._net_positions.clear()
+        self._net_exposures.clear()
+        self._net_exposure_positions.clear()
+        self._open_positions.clear()
+        self._open_totals.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._pending_margins.clear()
         self.analyzer.reset()
 
         self.initialized = False
@@ -748,53 +773,30 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
+        cdef InstrumentId instrument_id
+        cdef list instrument_ids = [
+            instrument_id for instrument_id in self._net_exposures if instrument_id.venue == venue
+        ]
+        if not instrument_ids:
             return {}  # Nothing to calculate
 
         cdef dict net_exposures = {}  # type: dict[Currency, float]
 
         cdef:
-            Position position
             Instrument instrument
-            Price last
             Currency settlement_currency
-            double xrate
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
+            tuple result
+        for instrument_id in instrument_ids:
+            instrument = self._cache.instrument(instrument_id)
             if instrument is None:
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}"
+                    f"no instrument for {instrument_id}"
                 )
                 return None  # Cannot calculate
 
-            if position.side == PositionSide.FLAT:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"position is flat for {position.instrument_id}"
-                )
-                continue  # Nothing to calculate
-
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}"
-                )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
-                )
+            result = self._calculate_net_exposure(account, instrument, "net exposures")
+            if result is None:
                 return None  # Cannot calculate
 
             if account.base_currency is not None:
@@ -802,16 +804,7 @@ cdef class Portfolio(PortfolioFacade):
             else:
                 settlement_currency = instrument.get_settlement_currency()
 
-            net_exposure = instrument.notional_value(
-                position.quantity,
-                last,
-            ).as_f64_c()
-            net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
-
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
-
-            net_exposures[settlement_currency] = total_net_exposure
+            net_exposures[settlement_currency] = net_exposures.get(settlement_currency, 0.0) + result[1]
 
         return {k: Money(v, k) for k, v in net_exposures.items()}
 
@@ -872,47 +865,14 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
+        if instrument_id not in self._net_exposures:
             return Money(0, instrument.get_settlement_currency())
 
-        cdef double net_exposure = 0.0
-
-        cdef:
-            Position position
-            Price last
-            double xrate
-            Money notional_value
-        for position in positions_open:
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"no prices for {position.instrument_id}"
-                )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
-                )
-                return None  # Cannot calculate
+        cdef tuple result = self._calculate_net_exposure(account, instrument, "net exposure")
+        if result is None:
+            return None  # Cannot calculate
 
-            notional_value = instrument.notional_value(
-                position.quantity,
-                last,
-            )
-            net_exposure += notional_value.as_f64_c() * xrate
+        cdef double net_exposure = result[0]
 
         if account.base_currency is not None:
             return Money(net_exposure, account.base_currency)
@@ -1031,6 +991,44 @@ cdef class Portfolio(PortfolioFacade):
             self._net_positions[instrument_id] = net_position
             self._log.info(f"{instrument_id} net_position={net_position}")
 
+    cdef bint _update_margins(self, Account account, Instrument instrument):
+        # Update the initial (order) and maintenance (position) margins for the instrument,
+        # returning whether every margin could be calculated
+        cdef list orders_open = self._cache.orders_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument.id,
+        )
+
+        cdef:
+            Order o
+        # Initialize initial (order) margin
+        cdef AccountState result_init = self._accounts.update_orders(
+            account=account,
+            instrument=instrument,
+            orders_open=[o for o in orders_open if o.is_passive_c()],
+            ts_event=account.last_event_c().ts_event,
+        )
+        if result_init is None:
+            return False
+
+        if not account.is_margin_account:
+            return True
+
+        cdef list positions_open = self._cache.positions_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument.id,
+        )
+
+        # Initialize maintenance (position) margin
+        cdef AccountState result_maint = self._accounts.update_positions(
+            account=account,
+            instrument=instrument,
+            positions_open=positions_open,
+            ts_event=account.last_event_c().ts_event,
+        )
+
+        return result_maint is not None
+
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id):
         cdef Account account = self._cache.account_for_venue(self._venue or instrument_id.venue)
         if account is None:
@@ -1054,28 +1052,24 @@ cdef class Portfolio(PortfolioFacade):
         else:
             currency = instrument.get_settlement_currency()
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
+        cdef dict totals = self._open_totals.get(instrument_id)
+        if not totals:
             return Money(0, currency)
 
+        cdef double multiplier = instrument.multiplier.as_f64_c()
+        cdef Currency settlement_currency = instrument.get_settlement_currency()
         cdef double total_pnl = 0.0
 
         cdef:
-            Position position
+            PositionSide side
+            tuple total
             Price last
+            double last_px
+            double points
             double pnl
             double xrate
-        for position in positions_open:
-            if position.instrument_id != instrument_id:
-                continue  # Nothing to calculate
-
-            if position.side == PositionSide.FLAT:
-                continue  # Nothing to calculate
-
-            last = self._get_last_price(position)
+        for side, total in totals.items():
+            last = self._get_last_price(instrument_id, side)
             if last is None:
                 self._log.debug(
                     f"Cannot calculate unrealized PnL: no prices for {instrument_id}"
@@ -1083,13 +1077,26 @@ cdef class Portfolio(PortfolioFacade):
                 self._pending_calcs.add(instrument.id)
                 return None  # Cannot calculate
 
-            pnl = position.unrealized_pnl(last).as_f64_c()
+            # Calculate as for a position of the sides total quantity and average open price
+            last_px = last.as_f64_c()
+            if instrument.is_inverse:
+                if side == PositionSide.LONG:
+                    points = (1.0 / total[2]) - (1.0 / last_px)
+                else:
+                    points = (1.0 / last_px) - (1.0 / total[2])
+            else:
+                if side == PositionSide.LONG:
+                    points = last_px - total[1]
+                else:
+                    points = total[1] - last_px
+
+            pnl = Money(total[0] * multiplier * points, settlement_currency).as_f64_c()
 
             if account.base_currency is not None:
                 xrate = self._calculate_xrate_to_base(
                     instrument=instrument,
                     account=account,
-                    side=position.entry,
+                    side=OrderSide.BUY if side == PositionSide.LONG else OrderSide.SELL,
                 )
 
                 if xrate == 0.0:
@@ -1106,23 +1113,159 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
-    cdef Price _get_last_price(self, Position position):
+    cdef void _update_open_totals(
+        self,
+        InstrumentId instrument_id,
+        PositionId position_id,
+        PositionSide side,
+        Quantity quantity,
+        double avg_px_open,
+    ):
+        # Maintain the open quantity and average open price per instrument and position side,
+        # so unrealized PnL is calculated once per side rather than once per open position
+        cdef dict positions = self._open_positions.get(instrument_id)
+        if positions is None:
+            positions = {}
+            self._open_positions[instrument_id] = positions
+
+        if side == PositionSide.FLAT:
+            positions.pop(position_id, None)
+        else:
+            positions[position_id] = (side, quantity.as_f64_c(), avg_px_open)
+
+        if not positions:
+            del self._open_positions[instrument_id]
+            self._open_totals.pop(instrument_id, None)
+            return
+
+        # Sum (count, quantity, quantity * avg_px_open, quantity / avg_px_open) per side
+        cdef dict sums = {}
+        cdef:
+            tuple position
+            list sum_
+        for position in positions.values():
+            sum_ = sums.get(position[0])
+            if sum_ is None:
+                sum_ = [0, 0.0, 0.0, 0.0, position[2]]
+                sums[position[0]] = sum_
+            sum_[0] += 1
+            sum_[1] += position[1]
+            sum_[2] += position[1] * position[2]
+            if position[2] != 0.0:
+                sum_[3] += position[1] / position[2]
+
+        # Store (quantity, avg_px_open, inverse avg_px_open) per side, where a single
+        # position keeps its own average open price so results match the position exactly
+        cdef dict totals = {}
+        for side, sum_ in sums.items():
+            if sum_[0] == 1:
+                totals[side] = (sum_[1], sum_[4], sum_[4])
+            else:
+                totals[side] = (
+                    sum_[1],
+                    sum_[2] / sum_[1],
+                    sum_[1] / sum_[3] if sum_[3] != 0.0 else 0.0,
+                )
+
+        self._open_totals[instrument_id] = totals
+
+    cdef void _update_net_exposure(
+        self,
+        InstrumentId instrument_id,
+        PositionId position_id,
+        PositionSide side,
+        OrderSide entry,
+        Quantity quantity,
+    ):
+        # Maintain the open quantity totals per instrument by position side and entry,
+        # so prices and exchange rates are only applied when the exposure is read
+        cdef tuple previous = self._net_exposure_positions.pop(position_id, None)
+        cdef dict totals
+        if previous is not None:
+            totals = self._net_exposures[previous[0]]
+            totals[previous[1]] -= previous[2]
+            if totals[previous[1]] == 0:
+                del totals[previous[1]]
+            if not totals:
+                del self._net_exposures[previous[0]]
+
+        if side == PositionSide.FLAT:
+            return  # No exposure
+
+        cdef tuple key = (side, entry)
+        totals = self._net_exposures.setdefault(instrument_id, {})
+        totals[key] = totals.get(key, 0) + quantity._mem.raw
+        self._net_exposure_positions[position_id] = (instrument_id, key, quantity._mem.raw)
+
+    cdef tuple _calculate_net_exposure(self, Account account, Instrument instrument, str label):
+        # Return the (unrounded, rounded per side) net exposure for the instruments open
+        # quantity totals at the current prices and exchange rates
+        cdef Currency settlement_currency
+        if account.base_currency is not None:
+            settlement_currency = account.base_currency
+        else:
+            settlement_currency = instrument.get_settlement_currency()
+
+        cdef double net_exposure = 0.0
+        cdef double net_exposure_rounded = 0.0
+
+        cdef:
+            tuple key
+            PositionSide side
+            OrderSide entry
+            Price last
+            double xrate
+            double notional_value
+        for key, raw in self._net_exposures.get(instrument.id, {}).items():
+            side = key[0]
+            entry = key[1]
+            last = self._get_last_price(instrument.id, side)
+            if last is None:
+                self._log.error(
+                    f"Cannot calculate {label}: "
+                    f"no prices for {instrument.id}"
+                )
+                continue  # Cannot calculate
+
+            xrate = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=entry,
+            )
+
+            if xrate == 0.0:
+                self._log.error(
+                    f"Cannot calculate {label}: "
+                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
+                )
+                return None  # Cannot calculate
+
+            notional_value = instrument.notional_value(
+                Quantity.from_raw_c(raw, instrument.size_precision),
+                last,
+            ).as_f64_c()
+            net_exposure += notional_value * xrate
+            net_exposure_rounded += round(notional_value * xrate, settlement_currency._mem.precision)
+
+        return net_exposure, net_exposure_rounded
+
+    cdef Price _get_last_price(self, InstrumentId instrument_id, PositionSide side):
         cdef PriceType price_type
-        if position.side == PositionSide.LONG:
+        if side == PositionSide.LONG:
             price_type = PriceType.BID
-        elif position.side == PositionSide.SHORT:
+        elif side == PositionSide.SHORT:
             price_type = PriceType.ASK
         else:  # pragma: no cover (design-time error)
             raise RuntimeError(
-                f"invalid `PositionSide`, was {position_side_to_str(position.side)}",
+                f"invalid `PositionSide`, was {position_side_to_str(side)}",
             )
 
         cdef Price price
         return self._cache.price(
-            instrument_id=position.instrument_id,
+            instrument_id=instrument_id,
             price_type=price_type,
         ) or self._cache.price(
-            instrument_id=position.instrument_id,
+            instrument_id=instrument_id,
             price_type=PriceType.LAST,
         )
 
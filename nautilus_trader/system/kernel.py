@@ -521,6 +521,10 @@ class NautilusKernel:
             fs_protocol=config.fs_protocol,
             flush_interval_ms=config.flush_interval_ms,
             include_types=config.include_types,
+            batch_size=config.batch_size,
+            use_writer_thread=config.use_writer_thread,
+            qsize=config.qsize,
+            backpressure=config.backpressure,
         )
         self._trader.subscribe("*", self._writer.write)
         self._log.info(f"Writing data & events to {path}")
@@ -40,6 +40,10 @@ from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.enums import TriggerType
+from nautilus_trader.model.events import OrderEmulated
+from nautilus_trader.model.events import OrderPendingCancel
+from nautilus_trader.model.events import OrderUpdated
 from nautilus_trader.model.identifiers import ExecAlgorithmId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import TradeId
@@ -70,6 +74,17 @@ from nautilus_trader.trading.strategy import Strategy
 
 _AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 
+
+class _RecordingSerializer(MsgSpecSerializer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deserialized = []
+
+    def deserialize(self, obj_bytes):
+        obj = super().deserialize(obj_bytes)
+        self.deserialized.append(obj)
+        return obj
+
 # Requirements:
 # - A Redis service listening on the default port 6379
 
@@ -316,6 +331,230 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert self.database.load_order(order.client_order_id) == order
 
+    @pytest.mark.asyncio
+    async def test_load_order_with_checkpoint_replays_remaining_events(self):
+        # Arrange
+        serializer = _RecordingSerializer(encoding=msgspec.msgpack, timestamps_as_str=True)
+        database = CacheDatabaseAdapter(
+            trader_id=self.trader_id,
+            instance_id=UUID4(),
+            serializer=serializer,
+            config=CacheConfig(database=DatabaseConfig(), checkpoint_interval=5),
+        )
+
+        order = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        database.add_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: database.load_order(order.client_order_id))
+
+        order.apply(TestEventStubs.order_submitted(order))
+        database.update_order(order)
+
+        order.apply(TestEventStubs.order_accepted(order))
+        database.update_order(order)
+
+        order.apply(TestEventStubs.order_pending_update(order))
+        database.update_order(order)
+
+        order.apply(TestEventStubs.order_updated(order, price=Price.from_str("0.99000")))
+        database.update_order(order)  # Checkpoint at event 5
+
+        order.apply(TestEventStubs.order_pending_cancel(order))
+        database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: database.load_order(order.client_order_id).event_count == 3)
+        serializer.deserialized.clear()
+
+        # Act
+        result = database.load_order(order.client_order_id)
+
+        # Assert: only the checkpoint, its event and the following event are deserialized
+        assert [type(obj) for obj in serializer.deserialized] == [
+            dict,
+            OrderUpdated,
+            OrderPendingCancel,
+        ]
+        assert result == order
+        assert result.status == order.status
+        assert result.price == Price.from_str("0.99000")
+        assert result.venue_order_id == order.venue_order_id
+        assert result.account_id == order.account_id
+        assert result.events == [order.init_event, *order.events[4:]]
+        assert database.load_orders() == {order.client_order_id: order}
+
+    @pytest.mark.asyncio
+    async def test_load_orders_and_position_from_checkpoints_round_trip_state(self):
+        # Arrange
+        database = CacheDatabaseAdapter(
+            trader_id=self.trader_id,
+            instance_id=UUID4(),
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+            config=CacheConfig(database=DatabaseConfig(), checkpoint_interval=2),
+        )
+
+        database.add_instrument(_AUDUSD_SIM)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: database.load_instrument(_AUDUSD_SIM.id))
+
+        trailing_stop_market = self.strategy.order_factory.trailing_stop_market(
+            _AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            trailing_offset=Decimal("0.00100"),
+            trigger_price=Price.from_str("0.99000"),
+        )
+        trailing_stop_limit = self.strategy.order_factory.trailing_stop_limit(
+            _AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            limit_offset=Decimal("0.00050"),
+            trailing_offset=Decimal("0.00100"),
+            price=Price.from_str("0.98950"),
+            trigger_price=Price.from_str("0.99000"),
+        )
+        bracket = self.strategy.order_factory.bracket(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            entry_price=Price.from_str("1.00000"),
+            sl_trigger_price=Price.from_str("0.99000"),
+            tp_price=Price.from_str("1.01000"),
+            entry_order_type=OrderType.LIMIT,
+        )
+        entry, stop_loss, take_profit = bracket.orders
+        emulated = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("0.99500"),
+            emulation_trigger=TriggerType.BID_ASK,
+        )
+
+        def working(event) -> list:
+            # Checkpoints are taken at the 2nd and 4th events, the 5th event is replayed
+            return [
+                TestEventStubs.order_submitted,
+                TestEventStubs.order_accepted,
+                event,
+                TestEventStubs.order_pending_cancel,
+            ]
+
+        order_events = {
+            trailing_stop_market: working(
+                lambda o: TestEventStubs.order_updated(o, trigger_price=Price.from_str("0.99100")),
+            ),
+            trailing_stop_limit: working(TestEventStubs.order_triggered),
+            entry: working(
+                lambda o: TestEventStubs.order_filled(
+                    o,
+                    instrument=_AUDUSD_SIM,
+                    last_qty=Quantity.from_int(50_000),
+                    last_px=Price.from_str("1.00000"),
+                ),
+            ),
+            stop_loss: working(
+                lambda o: TestEventStubs.order_updated(o, trigger_price=Price.from_str("0.99100")),
+            ),
+            take_profit: working(
+                lambda o: TestEventStubs.order_updated(o, price=Price.from_str("1.02000")),
+            ),
+            emulated: [
+                lambda o: OrderEmulated(
+                    trader_id=o.trader_id,
+                    strategy_id=o.strategy_id,
+                    instrument_id=o.instrument_id,
+                    client_order_id=o.client_order_id,
+                    event_id=UUID4(),
+                    ts_init=0,
+                ),
+                lambda o: TestEventStubs.order_released(o, released_price=Price.from_str("0.99500")),
+            ],
+        }
+
+        for order, events in order_events.items():
+            database.add_order(order)
+
+            # Allow MPSC thread to insert
+            await eventually(lambda: database.load_order(order.client_order_id))
+
+            for event in events:
+                order.apply(event(order))
+                database.update_order(order)
+
+        position_id = PositionId("P-1")
+        fills = []
+        for side, quantity in [
+            (OrderSide.BUY, 100_000),
+            (OrderSide.BUY, 50_000),
+            (OrderSide.SELL, 50_000),
+        ]:
+            order = self.strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(quantity),
+            )
+            fills.append(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=_AUDUSD_SIM,
+                    position_id=position_id,
+                    last_px=Price.from_str(f"1.0000{len(fills)}"),
+                ),
+            )
+
+        position = Position(instrument=_AUDUSD_SIM, fill=fills[0])
+        database.add_position(position)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: database.load_position(position.id))
+
+        for fill in fills[1:]:
+            position.apply(fill)
+            database.update_position(position)  # Checkpoint at event 2, partially closed at 3
+
+        # Allow MPSC thread to insert
+        await eventually(
+            lambda: database.load_position(position.id).to_dict() == position.to_dict(),
+        )
+
+        # Act
+        orders = {order: database.load_order(order.client_order_id) for order in order_events}
+        result_position = database.load_position(position.id)
+
+        # Assert
+        for order, result in orders.items():
+            assert result.to_dict() == order.to_dict()
+            assert result.status == order.status
+            assert result.venue_order_ids == order.venue_order_ids
+            assert result.trade_ids == order.trade_ids
+            assert result.commissions() == order.commissions()
+            assert result.leaves_qty == order.leaves_qty
+            assert result.avg_px == order.avg_px
+            assert result.last_event == order.last_event
+        assert orders[trailing_stop_limit].is_triggered
+        assert orders[trailing_stop_limit].ts_triggered == trailing_stop_limit.ts_triggered
+        assert orders[entry].filled_qty == Quantity.from_int(50_000)
+        assert orders[stop_loss].parent_order_id == entry.client_order_id
+        assert orders[entry].linked_order_ids == entry.linked_order_ids
+        assert orders[emulated].emulation_trigger == TriggerType.NO_TRIGGER
+        assert result_position.to_dict() == position.to_dict()
+        assert result_position.is_open
+        assert result_position.quantity == Quantity.from_int(100_000)
+        assert result_position.realized_return == position.realized_return
+        assert result_position.realized_pnl == position.realized_pnl
+        assert result_position.commissions() == position.commissions()
+        assert result_position.trade_ids == position.trade_ids
+        assert result_position.last_event == position.last_event
+
     @pytest.mark.asyncio
     async def test_update_order_for_closed_order(self):
         # Arrange
@@ -947,6 +1186,30 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert result == {order.client_order_id: order}
 
+    @pytest.mark.asyncio
+    async def test_load_orders_cache_when_many_orders_in_database(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(2_500)  # Spans multiple bulk read batches
+        ]
+
+        for order in orders:
+            self.database.add_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: len(self.database.load_orders()) == len(orders))
+
+        # Act
+        result = self.database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+
     @pytest.mark.asyncio
     async def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
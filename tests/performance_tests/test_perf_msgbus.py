@@ -0,0 +1,107 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from typing import Any
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import is_matching_py
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+_TOPIC_COUNT = 5_000
+_TOPICS = [f"data.quotes.SIM.INST-{i}" for i in range(_TOPIC_COUNT)]
+
+
+def _message_bus_with_topics() -> MessageBus:
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=TestClock(),
+    )
+
+    for topic in _TOPICS:
+        msgbus.subscribe(topic=topic, handler=lambda msg: None)
+        msgbus.publish(topic, None)
+
+    return msgbus
+
+
+def test_is_matching(benchmark: Any) -> None:
+    benchmark.pedantic(
+        target=is_matching_py,
+        args=("data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*"),
+        iterations=100_000,
+        rounds=1,
+    )
+
+
+def test_subscribe_with_many_topics(benchmark: Any) -> None:
+    msgbus = _message_bus_with_topics()
+    handlers = [[] for _ in range(1_000)]
+
+    def subscribe_all() -> None:
+        for handler in handlers:
+            msgbus.subscribe(topic="data.quotes.SIM.INST-1*", handler=handler.append)
+
+    benchmark.pedantic(
+        target=subscribe_all,
+        iterations=1,
+        rounds=1,
+    )
+
+
+def test_subscribe_with_many_topics_linear_scan_baseline(benchmark: Any) -> None:
+    # Baseline of matching each new subscription against every published topic
+    def scan_all() -> None:
+        for _ in range(1_000):
+            for topic in _TOPICS:
+                is_matching_py(topic, "data.quotes.SIM.INST-1*")
+
+    benchmark.pedantic(
+        target=scan_all,
+        iterations=1,
+        rounds=1,
+    )
+
+
+def test_publish_new_topics_with_many_subscriptions(benchmark: Any) -> None:
+    msgbus = _message_bus_with_topics()
+    topics = [f"data.trades.SIM.INST-{i}" for i in range(1_000)]
+
+    def publish_all() -> None:
+        for topic in topics:
+            msgbus.publish(topic, None)
+
+    benchmark.pedantic(
+        target=publish_all,
+        iterations=1,
+        rounds=1,
+    )
+
+
+def test_publish_new_topics_with_many_subscriptions_linear_scan_baseline(benchmark: Any) -> None:
+    # Baseline of matching each new topic against every subscription
+    topics = [f"data.trades.SIM.INST-{i}" for i in range(1_000)]
+
+    def scan_all() -> None:
+        for topic in topics:
+            for pattern in _TOPICS:
+                is_matching_py(topic, pattern)
+
+    benchmark.pedantic(
+        target=scan_all,
+        iterations=1,
+        rounds=1,
+    )
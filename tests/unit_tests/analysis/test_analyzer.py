@@ -15,6 +15,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
 from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
 from nautilus_trader.common.component import TestClock
@@ -124,6 +126,37 @@ class TestPortfolioAnalyzer:
         # Assert
         assert len(result) == 10
 
+    def test_analyzer_sums_returns_at_same_timestamp_in_time_order(self):
+        # Arrange
+        t1 = datetime(year=2010, month=1, day=1)
+        t2 = datetime(year=2010, month=1, day=2)
+
+        # Act
+        self.analyzer.add_return(t2, 0.10)
+        self.analyzer.add_return(t1, 0.05)
+        self.analyzer.add_return(t2, -0.25)
+        result = self.analyzer.returns()
+
+        # Assert
+        assert list(result.index) == [t1, t2]
+        assert result[t1] == 0.05
+        assert result[t2] == pytest.approx(-0.15)
+
+    def test_returns_after_further_add_return_includes_new_value(self):
+        # Arrange
+        t1 = datetime(year=2010, month=1, day=1)
+        t2 = datetime(year=2010, month=1, day=2)
+        self.analyzer.add_return(t1, 0.05)
+        self.analyzer.returns()
+
+        # Act
+        self.analyzer.add_return(t2, 0.10)
+        result = self.analyzer.returns()
+
+        # Assert
+        assert len(result) == 2
+        assert result[t2] == 0.10
+
     def test_get_realized_pnls_when_all_flat_positions_returns_expected_series(self):
         # Arrange
         order1 = self.order_factory.market(
@@ -13,7 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pandas as pd
+
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.analysis.statistics.returns_avg import ReturnsAverage
+from nautilus_trader.analysis.statistics.returns_volatility import ReturnsVolatility
+from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
+from nautilus_trader.analysis.statistics.sortino_ratio import SortinoRatio
 
 
 class TestPortfolioStatistic:
@@ -33,3 +40,25 @@ class TestPortfolioStatistic:
 
         # Assert
         assert result == "Portfolio Statistic"
+
+    def test_calculate_batch_from_returns_matches_individual_calculations(self):
+        # Arrange
+        index = pd.date_range("2024-01-01", periods=20, freq="7h", tz="UTC")
+        returns = pd.Series([0.01, -0.02, 0.015, -0.005] * 5, index=index)
+        stats = [SharpeRatio(), SortinoRatio(), ReturnsVolatility(), ReturnsAverage()]
+
+        # Act
+        result = PortfolioStatistic.calculate_batch_from_returns(stats, returns)
+
+        # Assert
+        assert result == [stat.calculate_from_returns(returns) for stat in stats]
+
+    def test_calculate_batch_from_returns_given_empty_series_returns_nan(self):
+        # Arrange
+        stats = [SharpeRatio(), SortinoRatio(), ReturnsVolatility()]
+
+        # Act
+        result = PortfolioStatistic.calculate_batch_from_returns(stats, pd.Series(dtype=float))
+
+        # Assert
+        assert all(np.isnan(value) for value in result)
@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.backtest.data_cache import BacktestDataCache
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+def quote_ticks(count: int) -> list[QuoteTick]:
+    return [
+        TestDataStubs.quote_tick(AUDUSD_SIM, ts_event=i, ts_init=i) for i in range(count)
+    ]
+
+
+class TestBacktestDataCache:
+    def setup(self):
+        # Fixture Setup
+        self.data_config = BacktestDataConfig(
+            catalog_path="/catalog",
+            data_cls=QuoteTick,
+            instrument_id=AUDUSD_SIM.id,
+            start_time=1580398089820000000,
+            end_time=1580504394501000000,
+        )
+
+    def test_key_ignores_fields_not_affecting_query(self):
+        # Arrange
+        other = BacktestDataConfig(
+            catalog_path="/catalog",
+            data_cls="nautilus_trader.model.data:QuoteTick",
+            instrument_id=AUDUSD_SIM.id,
+            start_time="2020-01-30T15:28:09.820Z",
+            end_time=1580504394501000000,
+            client_id="SIM",
+            batch_size=1,
+        )
+
+        # Act, Assert
+        assert BacktestDataCache.key(other) == BacktestDataCache.key(self.data_config)
+
+    def test_key_differs_for_different_query(self):
+        # Arrange
+        other = BacktestDataConfig(
+            catalog_path="/catalog",
+            data_cls=QuoteTick,
+            instrument_id=AUDUSD_SIM.id,
+            start_time=1580398089820000000,
+        )
+
+        # Act, Assert
+        assert BacktestDataCache.key(other) != BacktestDataCache.key(self.data_config)
+
+    def test_get_when_empty_returns_none(self):
+        # Arrange
+        cache = BacktestDataCache()
+
+        # Act, Assert
+        assert cache.get("key", data_cls=QuoteTick) is None
+
+    def test_put_then_get_returns_same_data(self):
+        # Arrange
+        cache = BacktestDataCache()
+        data = quote_ticks(10)
+
+        # Act
+        cache.put("key", data, data_cls=QuoteTick)
+
+        # Assert
+        assert cache.get("key", data_cls=QuoteTick) is data
+        assert len(cache) == 1
+        assert cache.size_bytes > 0
+
+    def test_put_when_over_max_size_evicts_least_recently_used(self):
+        # Arrange
+        data = quote_ticks(10)
+        cache = BacktestDataCache(max_size_bytes=BacktestDataCache._estimate_size(data) * 2)
+        cache.put("a", data, data_cls=QuoteTick)
+        cache.put("b", data, data_cls=QuoteTick)
+        cache.get("a", data_cls=QuoteTick)
+
+        # Act
+        cache.put("c", data, data_cls=QuoteTick)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.size_bytes <= cache.max_size_bytes
+
+    def test_discard_removes_entry(self):
+        # Arrange
+        cache = BacktestDataCache()
+        cache.put("key", quote_ticks(10), data_cls=QuoteTick)
+
+        # Act
+        cache.discard("key")
+
+        # Assert
+        assert "key" not in cache
+        assert cache.size_bytes == 0
+
+    def test_get_with_path_loads_shared_arrow_file(self, tmp_path):
+        # Arrange
+        data = quote_ticks(10)
+        BacktestDataCache(path=str(tmp_path)).put("key", data, data_cls=QuoteTick)
+        cache = BacktestDataCache(path=str(tmp_path))
+
+        # Act
+        result = cache.get("key", data_cls=QuoteTick)
+
+        # Assert
+        assert result == data
+        assert "key" in cache
+
+    def test_init_with_negative_max_size_raises(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BacktestDataCache(max_size_bytes=-1)
@@ -24,6 +24,8 @@ from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.common.actor import Actor
+from nautilus_trader.common.component import TimeEvent
+from nautilus_trader.config import ActorConfig
 from nautilus_trader.config import ImportableControllerConfig
 from nautilus_trader.config import InvalidConfiguration
 from nautilus_trader.config import LoggingConfig
@@ -44,6 +46,7 @@ from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import BarAggregation
@@ -68,6 +71,7 @@ from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.config import TestConfigStubs
 from nautilus_trader.test_kit.stubs.data import MyData
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.trading.controller import Controller
 from nautilus_trader.trading.strategy import Strategy
 from tests import TEST_DATA_DIR
 
@@ -78,6 +82,39 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+class _TimerActor(Actor):
+    def on_start(self) -> None:
+        self.start_ns: int | None = None
+        self.events: list[tuple[str, int, int]] = []
+        self.subscribe_quote_ticks(USDJPY_SIM.id)
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        if self.start_ns is None:
+            self.start_ns = self.clock.timestamp_ns()
+            self.clock.set_time_alert_ns("FIRST", self.start_ns + 60_000_000_000, self._on_first)
+
+        # Reset a far-future timeout on every tick (leaving stale timer deadlines)
+        if "TIMEOUT" in self.clock.timer_names:
+            self.clock.cancel_timer("TIMEOUT")
+        self.clock.set_time_alert_ns("TIMEOUT", tick.ts_init + 3_600_000_000_000, self._record)
+
+    def _on_first(self, event: TimeEvent) -> None:
+        self._record(event)
+        self.clock.set_time_alert_ns("SECOND", event.ts_event + 90_000_000_000, self._record)
+
+    def _record(self, event: TimeEvent) -> None:
+        self.events.append((event.name, event.ts_event, self.clock.timestamp_ns()))
+
+
+class _TimerController(Controller):
+    def on_start(self) -> None:
+        self.clock.set_time_alert_ns(
+            "ADD_ACTOR",
+            self.clock.timestamp_ns() + 60_000_000_000,
+            lambda event: self.create_actor(_TimerActor(ActorConfig(component_id="TIMER-001"))),
+        )
+
+
 class TestBacktestEngine:
     def setup(self):
         # Fixture Setup
@@ -187,6 +224,34 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 8000
 
+    def test_run_with_start_and_end_only_iterates_window(self):
+        # Arrange
+        data = self.engine.data
+        start_ns = data[1000].ts_init
+        end_ns = data[2000].ts_init
+        expected = len([x for x in data if start_ns <= x.ts_init <= end_ns])
+
+        # Act
+        self.engine.run(start=start_ns, end=end_ns)
+
+        # Assert
+        assert self.engine.iteration == expected
+
+    def test_run_multiple_windows_after_reset(self):
+        # Arrange
+        data = self.engine.data
+        windows = [(data[0].ts_init, data[3000].ts_init), (data[4000].ts_init, data[-1].ts_init)]
+
+        for start_ns, end_ns in windows:
+            expected = len([x for x in data if start_ns <= x.ts_init <= end_ns])
+
+            # Act
+            self.engine.run(start=start_ns, end=end_ns)
+
+            # Assert
+            assert self.engine.iteration == expected
+            self.engine.reset()
+
     def test_run(self):
         # Arrange, Act
         self.engine.add_strategy(Strategy())
@@ -195,6 +260,47 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_when_timer_set_in_time_event_handler_fires_at_its_time(self):
+        # Arrange
+        actor = _TimerActor()
+        self.engine.add_actor(actor)
+        start_ns = self.engine.data[0].ts_init
+
+        # Act
+        self.engine.run(end=start_ns + 600_000_000_000)
+
+        # Assert
+        assert actor.start_ns == start_ns
+        assert actor.events == [
+            ("FIRST", start_ns + 60_000_000_000, start_ns + 60_000_000_000),
+            ("SECOND", start_ns + 150_000_000_000, start_ns + 150_000_000_000),
+        ]
+
+    def test_run_when_actor_added_by_controller_fires_its_timers_at_their_times(self):
+        # Arrange
+        config = BacktestEngineConfig(
+            logging=LoggingConfig(bypass_logging=True),
+            controller=ImportableControllerConfig(
+                controller_path=f"{__name__}:_TimerController",
+                config_path="nautilus_trader.test_kit.mocks.controller:ControllerConfig",
+                config={},
+            ),
+        )
+        engine = self.create_engine(config=config)
+        start_ns = engine.data[0].ts_init
+
+        # Act
+        engine.run(end=start_ns + 600_000_000_000)
+
+        # Assert
+        [actor] = engine.trader.actors()
+        added_ns = start_ns + 60_000_000_000
+        assert actor.start_ns == min(x.ts_init for x in engine.data if x.ts_init > added_ns)
+        assert actor.events == [
+            ("FIRST", actor.start_ns + 60_000_000_000, actor.start_ns + 60_000_000_000),
+            ("SECOND", actor.start_ns + 150_000_000_000, actor.start_ns + 150_000_000_000),
+        ]
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -559,6 +665,29 @@ class TestBacktestEngineData:
         assert self.engine.data[0] == operations1
         assert self.engine.data[1] == operations2
 
+    def test_run_routes_data_to_each_venue(self):
+        # Arrange
+        self.engine.add_venue(
+            venue=Venue("BINANCE"),
+            oms_type=OmsType.NETTING,
+            account_type=AccountType.CASH,
+            base_currency=None,
+            starting_balances=[Money(1_000_000, USDT)],
+        )
+        self.engine.add_instrument(ETHUSDT_BINANCE)
+        wrangler = TradeTickDataWrangler(ETHUSDT_BINANCE)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("binance/ethusdt-trades.csv"))[:1000]
+        self.engine.add_data(ticks)
+
+        # Act
+        self.engine.run(end=ticks[-1].ts_init)
+
+        # Assert
+        assert self.engine.iteration == 9000
+        assert self.engine.kernel.cache.quote_tick(USDJPY_SIM.id) is not None
+        assert self.engine.kernel.cache.trade_tick(ETHUSDT_BINANCE.id) == ticks[-1]
+
     def test_add_quote_ticks_adds_to_engine(self):
         # Arrange, Setup data
         self.engine.add_instrument(AUDUSD_SIM)
@@ -639,6 +768,52 @@ class TestBacktestEngineData:
         assert len(self.engine.data) == 2
         assert self.engine.data == data
 
+    def test_add_data_merges_batches_into_sorted_stream(self):
+        # Arrange
+        self.engine.clear_data()
+        self.engine.add_instrument(USDJPY_SIM)
+
+        def status(ts: int, action: MarketStatusAction) -> InstrumentStatus:
+            return InstrumentStatus(
+                instrument_id=USDJPY_SIM.id,
+                action=action,
+                ts_init=ts,
+                ts_event=ts,
+            )
+
+        batch1 = [status(ts, MarketStatusAction.TRADING) for ts in (1, 3, 5)]
+        batch2 = [status(ts, MarketStatusAction.CLOSE) for ts in (6, 2, 4, 3)]  # <-- not sorted
+
+        # Act
+        self.engine.add_data(batch1)
+        self.engine.add_data(batch2)
+
+        # Assert
+        data = self.engine.data
+        assert [d.ts_init for d in data] == [1, 2, 3, 3, 4, 5, 6]
+        assert data[2] == batch1[1]  # <-- earlier batch first for equal timestamps
+        assert data[3] == batch2[3]
+
+    def test_add_data_without_sort_appends_to_stream(self):
+        # Arrange
+        self.engine.clear_data()
+        self.engine.add_instrument(USDJPY_SIM)
+        data = [
+            InstrumentStatus(
+                instrument_id=USDJPY_SIM.id,
+                action=MarketStatusAction.TRADING,
+                ts_init=ts,
+                ts_event=ts,
+            )
+            for ts in (2, 1)
+        ]
+
+        # Act
+        self.engine.add_data(data, sort=False)
+
+        # Assert
+        assert self.engine.data == data
+
 
 class TestBacktestWithAddedBars:
     def setup(self):
@@ -757,3 +932,46 @@ class TestBacktestWithAddedBars:
             1_011_166.89,
             USD,
         )
+
+    def test_dump_data_ipc_then_load_data_ipc_round_trips_stream(self, tmp_path):
+        # Arrange
+        data = self.engine.data
+        self.engine.dump_data_ipc(str(tmp_path))
+        self.engine.clear_data()
+
+        # Act
+        self.engine.load_data_ipc(str(tmp_path), chunk_size=10_000)
+
+        # Assert
+        assert self.engine.data == data
+
+    def test_load_data_ipc_then_run(self, tmp_path):
+        # Arrange
+        bar_type = BarType(
+            instrument_id=GBPUSD_SIM.id,
+            bar_spec=TestDataStubs.bar_spec_1min_bid(),
+            aggregation_source=AggregationSource.EXTERNAL,  # <-- important
+        )
+        config = EMACrossConfig(
+            instrument_id=GBPUSD_SIM.id,
+            bar_type=bar_type,
+            trade_size=Decimal(100_000),
+            fast_ema_period=10,
+            slow_ema_period=20,
+        )
+        strategy = EMACross(config=config)
+        self.engine.add_strategy(strategy)
+
+        self.engine.dump_data_ipc(str(tmp_path))
+
+        # Act
+        self.engine.load_data_ipc(str(tmp_path))
+        self.engine.run()
+
+        # Assert
+        assert strategy.fast_ema.count == 30117
+        assert self.engine.iteration == 60234
+        assert self.engine.portfolio.account(self.venue).balance_total(USD) == Money(
+            1_011_166.89,
+            USD,
+        )
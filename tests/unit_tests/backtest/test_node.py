@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
+
 import msgspec
 import pytest
 
+from nautilus_trader.backtest import node as node_module
+from nautilus_trader.backtest.data_cache import BacktestDataCache
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.node import _run_config_in_worker
 from nautilus_trader.common.config import InvalidConfiguration
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
@@ -29,6 +34,12 @@ from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.funcs import parse_bytes
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.trading.strategy import Strategy
+
+
+class _CrashingStrategy(Strategy):
+    def on_start(self) -> None:
+        os._exit(1)  # Crash the worker process
 
 
 class TestBacktestNode:
@@ -145,6 +156,191 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_backtest_run_batch_sync_with_memory_catalog(self):
+        # Arrange
+        catalog_memory = setup_catalog(protocol="memory")
+        load_catalog_with_stub_quote_ticks_audusd(catalog_memory)
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                ),
+                venues=[self.venue_config],
+                data=[
+                    BacktestDataConfig(
+                        catalog_path=catalog.path,
+                        catalog_fs_protocol=catalog.fs_protocol,
+                        data_cls=QuoteTick,
+                        instrument_id=InstrumentId.from_str("AUD/USD.SIM"),
+                        start_time=1580398089820000000,
+                        end_time=1580504394501000000,
+                    ),
+                ],
+                batch_size_bytes=parse_bytes("10kib"),
+            )
+            for catalog in (self.catalog, catalog_memory)
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run()
+
+        # Assert
+        assert len(results) == 2
+        assert results[0].total_events > 0
+        assert results[1].total_events == results[0].total_events
+        assert results[1].total_orders == results[0].total_orders
+
+    def test_run_with_multiple_workers_returns_results_in_config_order(self):
+        # Arrange
+        configs = [
+            self.backtest_configs[0],
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+                batch_size_bytes=parse_bytes("10kib"),
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(workers=2)
+
+        # Assert
+        assert [result.run_config_id for result in results] == [config.id for config in configs]
+        assert results[0].total_orders == results[1].total_orders
+        assert node.get_engines() == []
+
+    def test_run_with_multiple_workers_when_runs_fail_returns_other_results(self):
+        # Arrange
+        raising_config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=[
+                    ImportableStrategyConfig(
+                        strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+                        config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+                        config={
+                            "instrument_id": "AUD/USD.SIM",
+                            "bar_type": "AUD/USD.SIM-100-TICK-MID-INTERNAL",
+                            "trade_size": "1_000_000",
+                            "fast_ema_period": 20,
+                            "slow_ema_period": 10,  # Raises on init (fast >= slow)
+                        },
+                    ),
+                ],
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[self.venue_config],
+            data=[self.data_config],
+        )
+        crashing_config = BacktestRunConfig(
+            engine=BacktestEngineConfig(
+                strategies=[
+                    ImportableStrategyConfig(
+                        strategy_path=f"{__name__}:_CrashingStrategy",
+                        config_path="nautilus_trader.trading.config:StrategyConfig",
+                        config={},
+                    ),
+                ],
+                logging=LoggingConfig(bypass_logging=True),
+            ),
+            venues=[self.venue_config],
+            data=[self.data_config],
+        )
+        configs = [
+            self.backtest_configs[0],
+            raising_config,
+            crashing_config,
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                    run_analysis=False,
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(workers=2)
+
+        # Assert
+        assert [result.run_config_id for result in results] == [configs[0].id, configs[3].id]
+
+    def test_run_with_shared_data_configs_reads_data_once(self, mocker):
+        # Arrange
+        configs = [
+            self.backtest_configs[0],
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                    run_analysis=False,
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+        spy = mocker.spy(BacktestNode, "load_data_config")
+
+        # Act
+        results = node.run()
+
+        # Assert
+        assert len(results) == 2
+        assert results[0].total_events == results[1].total_events
+        assert spy.call_count == 1
+        assert len(node._data_cache) == 0  # Released after last run
+
+    def test_run_config_in_worker_with_non_shared_data_does_not_cache_or_export(
+        self,
+        tmp_path,
+        monkeypatch,
+    ):
+        # Arrange
+        monkeypatch.setattr(node_module, "_worker_node", None)
+        config = self.backtest_configs[0]
+
+        # Act
+        result = _run_config_in_worker(config, str(tmp_path))
+
+        # Assert
+        assert result.run_config_id == config.id
+        assert list(tmp_path.iterdir()) == []
+        assert len(node_module._worker_node._data_cache) == 0
+
+    def test_run_config_in_worker_reads_shared_data_from_exported_file(
+        self,
+        tmp_path,
+        monkeypatch,
+        mocker,
+    ):
+        # Arrange
+        monkeypatch.setattr(node_module, "_worker_node", None)
+        config = self.backtest_configs[0]
+        BacktestDataCache(path=str(tmp_path)).export(
+            BacktestDataCache.key(self.data_config),
+            BacktestNode.load_data_config(self.data_config).data,
+            QuoteTick,
+        )
+        spy = mocker.spy(BacktestNode, "load_data_config")
+
+        # Act
+        result = _run_config_in_worker(config, str(tmp_path))
+
+        # Assert
+        assert result.total_events > 0
+        assert spy.call_count == 0
+        assert len(node_module._worker_node._data_cache) == 0
+
     def test_backtest_run_results(self):
         # Arrange
         node = BacktestNode(configs=self.backtest_configs)
@@ -701,3 +701,66 @@ class TestCache:
 
         # Assert
         assert result == 0.80005
+
+    def test_get_xrate_when_quotes_updated_returns_updated_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.80000, 0.80010))
+        assert self.cache.get_xrate(SIM, AUD, USD) == 0.80005
+
+        # Act
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.90000, 0.90010))
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result == 0.90005
+
+    def test_get_xrate_for_cross_rate_when_contributing_pair_added_returns_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.80000, 0.80000))
+        assert self.cache.get_xrate(SIM, AUD, JPY) == 0.0  # Insufficient data
+
+        # Act
+        self.cache.add_instrument(USDJPY_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, 110.000, 110.000))
+        result1 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, 120.000, 120.000))
+        result2 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Assert
+        assert result1 == pytest.approx(88.0)
+        assert result2 == pytest.approx(96.0)
+
+    def test_get_xrate_when_unrelated_pair_repriced_keeps_memoized_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.80000, 0.80010))
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, 110.000, 110.010))
+        assert self.cache.get_xrate(SIM, AUD, USD) == 0.80005
+        assert self.cache.get_xrate(SIM, AUD, JPY) == pytest.approx(0.80005 * 110.005)
+
+        # Act
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(USDJPY_SIM, 120.000, 120.010))
+
+        # Assert
+        memoized = self.cache._xrate_rates[SIM]
+        assert ("AUD", "USD", PriceType.MID) in memoized
+        assert ("AUD", "JPY", PriceType.MID) not in memoized  # Cross rate depends on USD/JPY
+        assert self.cache.get_xrate(SIM, AUD, USD) == 0.80005
+        assert self.cache.get_xrate(SIM, AUD, JPY) == pytest.approx(0.80005 * 120.005)
+
+    def test_get_xrate_for_inverse_rate_when_pair_repriced_returns_updated_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.80000, 0.80000))
+        assert self.cache.get_xrate(SIM, USD, AUD) == pytest.approx(1.25)
+
+        # Act
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM, 0.50000, 0.50000))
+        result = self.cache.get_xrate(SIM, USD, AUD)
+
+        # Assert
+        assert result == pytest.approx(2.0)
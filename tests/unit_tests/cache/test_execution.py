@@ -1119,6 +1119,115 @@ class TestCache:
         assert self.cache.positions_closed(venue=GBPUSD_SIM.venue) == [position2]
         assert self.cache.positions_closed(instrument_id=GBPUSD_SIM.id) == [position2]
 
+    def test_orders_queries_are_maintained_as_orders_are_updated(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        # Build the views before any orders are added
+        assert self.cache.orders() == []
+        assert self.cache.orders_open(venue=AUDUSD_SIM.venue, strategy_id=self.strategy.id) == []
+
+        # Act
+        self.cache.add_order(order2)
+        self.cache.add_order(order1)
+
+        order1.apply(TestEventStubs.order_submitted(order1))
+        self.cache.update_order(order1)
+        order1.apply(TestEventStubs.order_accepted(order1))
+        self.cache.update_order(order1)
+
+        # Assert
+        assert self.cache.orders() == [order1, order2]  # Sorted by client order ID
+        assert self.cache.orders(side=OrderSide.SELL) == [order2]
+        assert self.cache.orders_open() == [order1]
+        assert self.cache.orders_open(venue=AUDUSD_SIM.venue, strategy_id=self.strategy.id) == [
+            order1,
+        ]
+        assert self.cache.orders_open(instrument_id=GBPUSD_SIM.id) == []
+
+        # Act
+        order1.apply(TestEventStubs.order_canceled(order1))
+        self.cache.update_order(order1)
+
+        # Assert
+        assert self.cache.orders_open() == []
+        assert self.cache.orders_open(venue=AUDUSD_SIM.venue, strategy_id=self.strategy.id) == []
+        assert self.cache.orders_closed() == [order1]
+        assert self.cache.orders() == [order1, order2]
+        assert self.cache.client_order_ids(
+            venue=AUDUSD_SIM.venue,
+            strategy_id=self.strategy.id,
+        ) == {order1.client_order_id, order2.client_order_id}
+
+    def test_orders_query_returns_new_list(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        self.cache.add_order(order)
+
+        # Act
+        result = self.cache.orders()
+        result.clear()
+
+        # Assert
+        assert self.cache.orders() == [order]
+
+    def test_positions_queries_are_maintained_as_positions_are_updated(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00001"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+
+        # Build the views before any positions are added
+        assert self.cache.positions_open() == []
+        assert self.cache.positions_closed(instrument_id=AUDUSD_SIM.id) == []
+
+        self.cache.add_position(position, OmsType.HEDGING)
+        assert self.cache.positions_open(side=PositionSide.LONG) == [position]
+
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00001"),
+        )
+        position.apply(fill2)
+
+        # Act
+        self.cache.update_position(position)
+
+        # Assert
+        assert self.cache.positions_open() == []
+        assert self.cache.positions_open(side=PositionSide.LONG) == []
+        assert self.cache.positions_closed(instrument_id=AUDUSD_SIM.id) == [position]
+        assert self.cache.positions(side=PositionSide.FLAT) == [position]
+
     def test_update_account(self):
         # Arrange
         account = TestExecStubs.cash_account()
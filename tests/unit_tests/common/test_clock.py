@@ -49,6 +49,33 @@ class TestTestClock:
         assert self.clock.utc_now().tzinfo == pytz.utc
         assert isinstance(self.clock.timestamp_ns(), int)
 
+    def test_share_time_sets_time_for_both_clocks(self):
+        # Arrange
+        other = TestClock()
+        self.clock.share_time(other)
+
+        # Act
+        other.set_time(1_000)
+
+        # Assert
+        assert self.clock.timestamp_ns() == 1_000
+        assert other.timestamp_ns() == 1_000
+
+    def test_next_deadline_ns_with_no_timers_returns_max(self):
+        # Arrange, Act, Assert
+        assert self.clock.next_deadline_ns() == 2**64 - 1
+
+    def test_next_deadline_ns_returns_earliest_next_time(self):
+        # Arrange
+        self.clock.set_timer_ns("TIMER1", interval_ns=100, start_time_ns=0, stop_time_ns=0)
+        self.clock.set_timer_ns("TIMER2", interval_ns=30, start_time_ns=0, stop_time_ns=0)
+
+        # Act
+        self.clock.advance_time(30)
+
+        # Assert
+        assert self.clock.next_deadline_ns() == 60
+
     def test_utc_now_when_time_set(self):
         # Arrange
         moment = pd.Timestamp("2000-01-01 10:00:00+00:00")
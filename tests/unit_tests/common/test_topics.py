@@ -0,0 +1,61 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.topics import get_bars_topic
+from nautilus_trader.common.topics import get_book_deltas_topic
+from nautilus_trader.common.topics import get_book_depth_topic
+from nautilus_trader.common.topics import get_instrument_status_topic
+from nautilus_trader.common.topics import get_quotes_topic
+from nautilus_trader.common.topics import get_trades_topic
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [
+        [get_quotes_topic, "data.quotes.BINANCE.ETHUSDT"],
+        [get_trades_topic, "data.trades.BINANCE.ETHUSDT"],
+        [get_instrument_status_topic, "data.status.BINANCE.ETHUSDT"],
+        [get_book_deltas_topic, "data.book.deltas.BINANCE.ETHUSDT"],
+        [get_book_depth_topic, "data.book.depth.BINANCE.ETHUSDT"],
+    ],
+)
+def test_instrument_topics(func, expected):
+    # Arrange
+    instrument_id = InstrumentId.from_str("ETHUSDT.BINANCE")
+
+    # Act
+    topic1 = func(instrument_id)
+    topic2 = func(InstrumentId.from_str("ETHUSDT.BINANCE"))
+
+    # Assert
+    assert topic1 == expected
+    assert topic2 is topic1
+
+
+def test_bars_topic():
+    # Arrange
+    bar_type = BarType.from_str("ETHUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL")
+
+    # Act
+    topic1 = get_bars_topic(bar_type)
+    topic2 = get_bars_topic(BarType.from_str("ETHUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL"))
+
+    # Assert
+    assert topic1 == "data.bars.ETHUSDT.BINANCE-1-MINUTE-LAST-EXTERNAL"
+    assert topic2 is topic1
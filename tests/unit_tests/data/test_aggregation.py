@@ -24,6 +24,7 @@ from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.data.aggregation import BarBuilder
 from nautilus_trader.data.aggregation import TickBarAggregator
 from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import TimeBarScheduler
 from nautilus_trader.data.aggregation import ValueBarAggregator
 from nautilus_trader.data.aggregation import VolumeBarAggregator
 from nautilus_trader.model.data import Bar
@@ -1014,6 +1015,35 @@ class TestTestValueBarAggregator:
         assert handler[1].volume == Quantity.from_str("5000.00")
         assert aggregator.get_cumulative_value() == Decimal("40000.11000")
 
+    def test_handle_trade_tick_when_value_beyond_64_bit_raw_range_sends_bars_to_handler(self):
+        # Arrange
+        handler = []
+        bar_spec = BarSpecification(100000, BarAggregation.VALUE, PriceType.LAST)
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        aggregator = ValueBarAggregator(
+            ETHUSDT_BITMEX,
+            bar_type,
+            handler.append,
+        )
+
+        tick = TradeTick(
+            instrument_id=ETHUSDT_BITMEX.id,
+            price=Price.from_str("50000.00"),
+            size=Quantity.from_int(21),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("123456"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        aggregator.handle_trade_tick(tick)
+
+        # Assert
+        assert len(handler) == 10
+        assert all(bar.volume == Quantity.from_int(2) for bar in handler)
+        assert aggregator.get_cumulative_value() == Decimal("50000.00")
+
     def test_run_quote_ticks_through_aggregator_results_in_expected_bars(self):
         # Arrange
         handler = []
@@ -1372,3 +1402,132 @@ class TestTimeBarAggregator:
         assert len(handler) == 2
         assert handler[0].ts_event == ts_event1
         assert handler[1].ts_event == ts_event2
+
+
+class TestTimeBarScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.scheduler = TimeBarScheduler(self.clock)
+        self.handler = []
+
+    def create_aggregator(self, instrument, bar_spec):
+        return TimeBarAggregator(
+            instrument,
+            BarType(instrument.id, bar_spec),
+            self.handler.append,
+            self.clock,
+            scheduler=self.scheduler,
+        )
+
+    def test_aggregators_with_same_interval_share_timer(self):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+
+        # Act
+        aggregator1 = self.create_aggregator(AUDUSD_SIM, bar_spec)
+        aggregator2 = self.create_aggregator(BTCUSDT_BINANCE, bar_spec)
+
+        # Assert
+        assert self.clock.timer_count == 1
+        assert aggregator1.next_close_ns == 60_000_000_000
+        assert aggregator2.next_close_ns == 60_000_000_000
+
+    def test_aggregators_with_different_intervals_use_separate_timers(self):
+        # Arrange, Act
+        self.create_aggregator(
+            AUDUSD_SIM,
+            BarSpecification(1, BarAggregation.MINUTE, PriceType.MID),
+        )
+        self.create_aggregator(
+            AUDUSD_SIM,
+            BarSpecification(5, BarAggregation.MINUTE, PriceType.MID),
+        )
+
+        # Assert
+        assert self.clock.timer_count == 2
+
+    def test_shared_timer_builds_bars_for_all_aggregators(self):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregator1 = self.create_aggregator(AUDUSD_SIM, bar_spec)
+        aggregator2 = self.create_aggregator(BTCUSDT_BINANCE, bar_spec)
+        aggregator1.handle_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+        aggregator2.handle_quote_tick(TestDataStubs.quote_tick(BTCUSDT_BINANCE))
+
+        # Act
+        events = self.clock.advance_time(60_000_000_000)
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(events) == 1
+        assert [bar.bar_type.instrument_id for bar in self.handler] == [
+            AUDUSD_SIM.id,
+            BTCUSDT_BINANCE.id,
+        ]
+        assert all(bar.ts_event == 60_000_000_000 for bar in self.handler)
+        assert aggregator1.next_close_ns == 120_000_000_000
+        assert aggregator2.next_close_ns == 120_000_000_000
+
+    def test_stop_last_aggregator_cancels_shared_timer(self):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregator1 = self.create_aggregator(AUDUSD_SIM, bar_spec)
+        aggregator2 = self.create_aggregator(BTCUSDT_BINANCE, bar_spec)
+
+        # Act
+        aggregator1.stop()
+        timer_count = self.clock.timer_count
+        aggregator2.stop()
+
+        # Assert
+        assert timer_count == 1
+        assert self.clock.timer_count == 0
+
+    def test_stopped_aggregator_does_not_build_bars(self):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregator1 = self.create_aggregator(AUDUSD_SIM, bar_spec)
+        aggregator2 = self.create_aggregator(BTCUSDT_BINANCE, bar_spec)
+        aggregator1.handle_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+        aggregator2.handle_quote_tick(TestDataStubs.quote_tick(BTCUSDT_BINANCE))
+
+        # Act
+        aggregator1.stop()
+        for event in self.clock.advance_time(60_000_000_000):
+            event.handle()
+
+        # Assert
+        assert [bar.bar_type.instrument_id for bar in self.handler] == [BTCUSDT_BINANCE.id]
+
+    def test_aggregator_registered_when_timer_already_due_skips_stale_close(self):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        self.create_aggregator(AUDUSD_SIM, bar_spec)
+        self.clock.set_time(60_000_000_000)  # Timer due but not yet fired
+        aggregator = self.create_aggregator(BTCUSDT_BINANCE, bar_spec)
+        aggregator.handle_quote_tick(
+            TestDataStubs.quote_tick(BTCUSDT_BINANCE, ts_event=60_000_000_000),
+        )
+
+        # Act
+        for event in self.clock.advance_time(60_000_000_000):
+            event.handle()
+
+        # Assert
+        assert self.handler == []
+        assert aggregator.next_close_ns == 120_000_000_000
+
+    def test_clear_cancels_shared_timers(self):
+        # Arrange
+        self.create_aggregator(
+            AUDUSD_SIM,
+            BarSpecification(1, BarAggregation.MINUTE, PriceType.MID),
+        )
+
+        # Act
+        self.scheduler.clear()
+
+        # Assert
+        assert self.clock.timer_count == 0
@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.data.aggregation import TickBarAggregator
+from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import ValueBarAggregator
+from nautilus_trader.data.aggregation import VolumeBarAggregator
+from nautilus_trader.data.batch_aggregation import BatchBarAggregator
+from nautilus_trader.model.data import BarSpecification
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+ETHUSDT_BITMEX = TestInstrumentProvider.ethusd_bitmex()
+
+
+def trade_columns(ticks):
+    return (
+        np.array([tick.ts_event for tick in ticks], dtype=np.uint64),
+        np.array([tick.price.raw for tick in ticks], dtype=np.int64),
+        np.array([tick.size.raw for tick in ticks], dtype=np.uint64),
+    )
+
+
+def run_time_bar_aggregator(bar_type, ticks, **kwargs):
+    # Fire timers before later ticks, and after all ticks at the same timestamp
+    bars = []
+    clock = TestClock()
+    clock.set_time(ticks[0].ts_event)
+    aggregator = TimeBarAggregator(ETHUSDT_BITMEX, bar_type, bars.append, clock, **kwargs)
+    for tick in ticks:
+        if tick.ts_event - 1 > clock.timestamp_ns():
+            for event in clock.advance_time(tick.ts_event - 1):
+                event.handle()
+        aggregator.handle_trade_tick(tick)
+    for event in clock.advance_time(ticks[-1].ts_event):
+        event.handle()
+    return bars
+
+
+class TestBatchBarAggregator:
+    def setup(self):
+        # Fixture Setup
+        wrangler = TradeTickDataWrangler(instrument=ETHUSDT_BITMEX)
+        provider = TestDataProvider()
+        self.ticks = wrangler.process(provider.read_csv_ticks("binance/ethusdt-trades.csv")[:1000])
+
+    @pytest.mark.parametrize(
+        ("bar_spec", "aggregator_cls"),
+        [
+            [BarSpecification(7, BarAggregation.TICK, PriceType.LAST), TickBarAggregator],
+            [BarSpecification(100, BarAggregation.VOLUME, PriceType.LAST), VolumeBarAggregator],
+            [BarSpecification(10_000, BarAggregation.VALUE, PriceType.LAST), ValueBarAggregator],
+        ],
+    )
+    def test_aggregate_matches_streaming_aggregator(self, bar_spec, aggregator_cls):
+        # Arrange
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        expected = []
+        aggregator = aggregator_cls(ETHUSDT_BITMEX, bar_type, expected.append)
+        for tick in self.ticks:
+            aggregator.handle_trade_tick(tick)
+
+        # Act
+        bars = BatchBarAggregator(ETHUSDT_BITMEX, bar_type).aggregate(
+            *trade_columns(self.ticks),
+        )
+
+        # Assert
+        assert len(bars) > 0
+        assert bars == expected
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"build_with_no_updates": False},
+            {"timestamp_on_close": False},
+            {"interval_type": "right-open"},
+        ],
+    )
+    def test_aggregate_time_bars_matches_streaming_aggregator(self, kwargs):
+        # Arrange
+        bar_spec = BarSpecification(1, BarAggregation.SECOND, PriceType.LAST)
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        expected = run_time_bar_aggregator(bar_type, self.ticks, **kwargs)
+
+        # Act
+        bars = BatchBarAggregator(ETHUSDT_BITMEX, bar_type, **kwargs).aggregate(
+            *trade_columns(self.ticks),
+        )
+
+        # Assert
+        assert bars == expected
+
+    def test_aggregate_volume_bars_when_tick_spans_multiple_bars(self):
+        # Arrange
+        bar_spec = BarSpecification(2, BarAggregation.VOLUME, PriceType.LAST)
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        ts_event = np.array([1, 2, 3], dtype=np.uint64)
+        prices = np.array([Price.from_str(p).raw for p in ("100.00", "101.00", "99.00")])
+        sizes = np.array([Quantity.from_int(q).raw for q in (1, 4, 1)], dtype=np.uint64)
+
+        # Act
+        bars = BatchBarAggregator(ETHUSDT_BITMEX, bar_type).aggregate(ts_event, prices, sizes)
+
+        # Assert
+        assert len(bars) == 3
+        assert bars[0].open == Price.from_str("100.00")
+        assert bars[0].high == Price.from_str("101.00")
+        assert bars[1].open == Price.from_str("101.00")
+        assert bars[1].close == Price.from_str("101.00")
+        assert bars[2].low == Price.from_str("99.00")
+        assert all(bar.volume == Quantity.from_int(2) for bar in bars)
+        assert [bar.ts_event for bar in bars] == [2, 2, 3]
+
+    def test_aggregate_to_arrow_returns_bar_table(self):
+        # Arrange
+        bar_spec = BarSpecification(7, BarAggregation.TICK, PriceType.LAST)
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        aggregator = BatchBarAggregator(ETHUSDT_BITMEX, bar_type)
+        columns = [pa.array(column) for column in trade_columns(self.ticks)]
+
+        # Act
+        table = aggregator.aggregate_to_arrow(*columns)
+
+        # Assert
+        bars = aggregator.aggregate(*columns)
+        assert table.num_rows == len(bars)
+        assert table.column_names == [
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "ts_event",
+            "ts_init",
+        ]
+        assert table.schema.metadata[b"bar_type"] == str(bar_type).encode()
+        assert table.column("close").to_pylist() == [bar.close.raw for bar in bars]
+
+    def test_aggregate_with_unsorted_ts_event_raises(self):
+        # Arrange
+        bar_spec = BarSpecification(7, BarAggregation.TICK, PriceType.LAST)
+        bar_type = BarType(ETHUSDT_BITMEX.id, bar_spec)
+        ts_event, prices, sizes = trade_columns(self.ticks)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            BatchBarAggregator(ETHUSDT_BITMEX, bar_type).aggregate(
+                ts_event[::-1],
+                prices,
+                sizes,
+            )
@@ -38,6 +38,7 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import PriceType
@@ -1758,6 +1759,32 @@ class TestDataEngine:
         assert self.data_engine.subscribed_bars() == []
         assert self.binance_client.subscribed_bars() == []
 
+    def test_subscribe_internal_time_bars_with_same_interval_share_timer(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.LAST)
+        bar_types = [
+            BarType(BTCUSDT_BINANCE.id, bar_spec, AggregationSource.INTERNAL),
+            BarType(ETHUSDT_BINANCE.id, bar_spec, AggregationSource.INTERNAL),
+        ]
+
+        # Act
+        for bar_type in bar_types:
+            subscribe = Subscribe(
+                client_id=ClientId(BINANCE.value),
+                venue=BINANCE,
+                data_type=DataType(Bar, metadata={"bar_type": bar_type}),
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            )
+            self.data_engine.execute(subscribe)
+
+        # Assert
+        assert set(self.data_engine.subscribed_bars()) == set(bar_types)
+        assert self.clock.timer_count == 1
+
     def test_process_bar_when_subscriber_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -0,0 +1,279 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import pandas as pd
+
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.execution.matching_core import MatchingCore
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.enums import TrailingOffsetType
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class _RecordingMatchingCore(MatchingCore):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.matched: list = []
+
+    def match_order(self, order, initial: bool = False) -> None:
+        self.matched.append(order)
+        super().match_order(order, initial)
+
+
+class TestMatchingCore:
+    def setup(self) -> None:
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=TestClock(),
+        )
+        self.matching_core = MatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=lambda order: None,
+            fill_market_order=lambda order: None,
+            fill_limit_order=lambda order: None,
+        )
+
+    def limit(self, side: OrderSide, price: str):
+        return self.order_factory.limit(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100_000),
+            AUDUSD_SIM.make_price(float(price)),
+        )
+
+    def test_add_orders_sorts_each_side_by_price(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.limit(OrderSide.BUY, "1.00020")
+        bid3 = self.limit(OrderSide.BUY, "1.00010")
+        ask1 = self.limit(OrderSide.SELL, "1.00050")
+        ask2 = self.limit(OrderSide.SELL, "1.00030")
+
+        # Act
+        for order in (bid1, bid2, bid3, ask1, ask2):
+            self.matching_core.add_order(order)
+
+        # Assert
+        assert self.matching_core.get_orders_bid() == [bid2, bid3, bid1]
+        assert self.matching_core.get_orders_ask() == [ask2, ask1]
+        assert self.matching_core.get_orders() == [bid2, bid3, bid1, ask2, ask1]
+
+    def test_orders_at_same_price_are_held_in_fifo_sequence(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.limit(OrderSide.BUY, "1.00000")
+        bid3 = self.limit(OrderSide.BUY, "1.00000")
+
+        # Act
+        for order in (bid1, bid2, bid3):
+            self.matching_core.add_order(order)
+
+        # Assert
+        assert self.matching_core.get_orders_bid() == [bid1, bid2, bid3]
+
+    def test_limit_and_stop_orders_at_same_price_are_held_in_arrival_sequence(self) -> None:
+        # Arrange
+        stop1 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            AUDUSD_SIM.make_price(1.00010),
+        )
+        limit1 = self.limit(OrderSide.BUY, "1.00010")
+        stop2 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            AUDUSD_SIM.make_price(1.00010),
+        )
+        limit2 = self.limit(OrderSide.BUY, "1.00020")
+
+        # Act
+        for order in (stop1, limit1, stop2, limit2):
+            self.matching_core.add_order(order)
+
+        # Assert
+        assert self.matching_core.get_orders_bid() == [limit2, stop1, limit1, stop2]
+
+    def test_delete_order_removes_order_from_core(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.limit(OrderSide.BUY, "1.00000")
+        ask1 = self.limit(OrderSide.SELL, "1.00010")
+        for order in (bid1, bid2, ask1):
+            self.matching_core.add_order(order)
+
+        # Act
+        self.matching_core.delete_order(bid1)
+        self.matching_core.delete_order(ask1)
+
+        # Assert
+        assert not self.matching_core.order_exists(bid1.client_order_id)
+        assert not self.matching_core.order_exists(ask1.client_order_id)
+        assert self.matching_core.get_orders() == [bid2]
+
+    def test_delete_order_not_held_does_nothing(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+
+        # Act
+        self.matching_core.delete_order(bid1)
+
+        # Assert
+        assert self.matching_core.get_orders() == []
+
+    def test_add_order_already_held_does_not_duplicate(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        self.matching_core.add_order(bid1)
+
+        # Act
+        self.matching_core.add_order(bid1)
+
+        # Assert
+        assert self.matching_core.get_orders() == [bid1]
+
+    def test_update_order_reindexes_at_new_price(self) -> None:
+        # Arrange
+        bid1 = TestExecStubs.make_accepted_order(self.limit(OrderSide.BUY, "1.00000"))
+        bid2 = TestExecStubs.make_accepted_order(self.limit(OrderSide.BUY, "1.00010"))
+        self.matching_core.add_order(bid1)
+        self.matching_core.add_order(bid2)
+
+        # Act
+        bid1.apply(
+            TestEventStubs.order_updated(bid1, price=AUDUSD_SIM.make_price(1.00020)),
+        )
+        self.matching_core.update_order(bid1)
+
+        # Assert
+        assert self.matching_core.get_orders_bid() == [bid1, bid2]
+
+    def test_reset_clears_orders(self) -> None:
+        # Arrange
+        self.matching_core.add_order(self.limit(OrderSide.BUY, "1.00000"))
+        self.matching_core.add_order(self.limit(OrderSide.SELL, "1.00010"))
+
+        # Act
+        self.matching_core.reset()
+
+        # Assert
+        assert self.matching_core.get_orders() == []
+
+    def test_iterate_only_matches_orders_crossed_by_market(self) -> None:
+        # Arrange
+        matching_core = _RecordingMatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=lambda order: None,
+            fill_market_order=lambda order: None,
+            fill_limit_order=lambda order: None,
+        )
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.limit(OrderSide.BUY, "1.00010")
+        bid3 = self.limit(OrderSide.BUY, "1.00020")
+        ask1 = self.limit(OrderSide.SELL, "1.00050")
+        ask2 = self.limit(OrderSide.SELL, "1.00060")
+        for order in (bid1, bid2, bid3, ask1, ask2):
+            matching_core.add_order(order)
+        matching_core.set_bid_raw(AUDUSD_SIM.make_price(1.00005).raw)
+        matching_core.set_ask_raw(AUDUSD_SIM.make_price(1.00010).raw)
+
+        # Act
+        matching_core.iterate(0)
+
+        # Assert
+        assert matching_core.matched == [bid3, bid2]
+
+    def test_iterate_when_triggered_stop_limit_moves_market_matches_newly_crossed_order(
+        self,
+    ) -> None:
+        # Arrange
+        filled = []
+
+        def fill_limit_order(order) -> None:
+            # Taker fill trades the market through the limit price
+            filled.append(order)
+            if order.side == OrderSide.BUY:
+                matching_core.set_bid_raw(order.price.raw)
+
+        matching_core = MatchingCore(
+            instrument_id=AUDUSD_SIM.id,
+            price_increment=AUDUSD_SIM.price_increment,
+            trigger_stop_order=lambda order: None,
+            fill_market_order=lambda order: None,
+            fill_limit_order=fill_limit_order,
+        )
+        stop_limit = self.order_factory.stop_limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            price=AUDUSD_SIM.make_price(1.00030),
+            trigger_price=AUDUSD_SIM.make_price(1.00010),
+        )
+        ask1 = self.limit(OrderSide.SELL, "1.00020")
+        matching_core.add_order(stop_limit)
+        matching_core.add_order(ask1)
+        matching_core.set_bid_raw(AUDUSD_SIM.make_price(1.00000).raw)
+        matching_core.set_ask_raw(AUDUSD_SIM.make_price(1.00010).raw)
+
+        # Act
+        matching_core.iterate(0)
+
+        # Assert
+        assert filled == [stop_limit, ask1]
+
+    def test_get_orders_managed_returns_expiring_and_trailing_orders_in_sequence(self) -> None:
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            AUDUSD_SIM.make_price(1.00010),
+            time_in_force=TimeInForce.GTD,
+            expire_time=pd.Timestamp("2100-01-01", tz="UTC"),
+        )
+        ask1 = self.order_factory.trailing_stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            trigger_price=AUDUSD_SIM.make_price(0.99990),
+            trailing_offset=Decimal("0.00010"),
+            trailing_offset_type=TrailingOffsetType.PRICE,
+        )
+        for order in (bid1, bid2, ask1):
+            self.matching_core.add_order(order)
+
+        # Act
+        self.matching_core.delete_order(bid2)
+
+        # Assert
+        assert self.matching_core.get_orders() == [bid1, ask1]
+        assert self.matching_core.get_orders_managed() == [ask1]
@@ -0,0 +1,250 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import math
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.ta_lib.streaming import InputRingBuffer
+from nautilus_trader.indicators.ta_lib.streaming import StreamingATR
+from nautilus_trader.indicators.ta_lib.streaming import StreamingEMA
+from nautilus_trader.indicators.ta_lib.streaming import StreamingMACD
+from nautilus_trader.indicators.ta_lib.streaming import StreamingRSI
+from nautilus_trader.indicators.ta_lib.streaming import StreamingSMA
+from nautilus_trader.indicators.ta_lib.streaming import create_streaming_function
+
+
+def row(i: int, close: float, high: float | None = None, low: float | None = None) -> tuple:
+    high = close if high is None else high
+    low = close if low is None else low
+    return (i, i, close, high, low, close, 1.0)
+
+
+def run(function, rows: list[tuple], capacity: int = 10) -> list[tuple[float, ...]]:
+    buffer = InputRingBuffer(capacity)
+    outputs = []
+    for values in rows:
+        buffer.append(values)
+        outputs.append(function.update(buffer))
+    return outputs
+
+
+class TestInputRingBuffer:
+    def test_column_returns_values_in_time_order_after_wrapping(self):
+        # Arrange
+        buffer = InputRingBuffer(capacity=3)
+
+        # Act
+        for i in range(5):
+            buffer.append(row(i, float(i)))
+
+        # Assert
+        assert len(buffer) == 3
+        assert buffer.column("close").tolist() == [2.0, 3.0, 4.0]
+        assert buffer.column("ts_event").tolist() == [2, 3, 4]
+        assert buffer.ago("close", 2) == 2.0
+
+    def test_column_is_a_view_of_the_buffer(self):
+        # Arrange
+        buffer = InputRingBuffer(capacity=3)
+        buffer.append(row(0, 1.0))
+
+        # Act
+        view = buffer.column("close")
+
+        # Assert
+        assert view.flags.c_contiguous
+        assert np.shares_memory(view, buffer.column("close"))
+
+    def test_update_last_replaces_most_recent_row(self):
+        # Arrange
+        buffer = InputRingBuffer(capacity=3)
+        buffer.append(row(0, 1.0))
+        buffer.append(row(1, 2.0))
+
+        # Act
+        buffer.update_last(row(1, 3.0))
+
+        # Assert
+        assert buffer.column("close").tolist() == [1.0, 3.0]
+
+
+class TestStreamingFunctions:
+    def test_sma_returns_nan_until_period_then_average(self):
+        # Arrange
+        sma = StreamingSMA(period=3)
+
+        # Act
+        outputs = run(sma, [row(i, close) for i, close in enumerate([1.0, 2.0, 3.0, 4.0, 8.0])])
+
+        # Assert
+        assert math.isnan(outputs[1][0])
+        assert [output[0] for output in outputs[2:]] == [2.0, 3.0, 5.0]
+
+    def test_ema_is_seeded_with_sma_then_smoothed(self):
+        # Arrange
+        ema = StreamingEMA(period=3)
+
+        # Act
+        outputs = run(ema, [row(i, close) for i, close in enumerate([1.0, 2.0, 3.0, 5.0])])
+
+        # Assert
+        assert math.isnan(outputs[1][0])
+        assert outputs[2][0] == 2.0
+        assert outputs[3][0] == 3.5
+
+    def test_rsi_with_only_gains_returns_one_hundred(self):
+        # Arrange
+        rsi = StreamingRSI(period=3)
+
+        # Act
+        outputs = run(rsi, [row(i, float(i)) for i in range(6)])
+
+        # Assert
+        assert all(math.isnan(output[0]) for output in outputs[:3])
+        assert [output[0] for output in outputs[3:]] == [100.0, 100.0, 100.0]
+
+    def test_atr_with_constant_range_returns_range(self):
+        # Arrange
+        atr = StreamingATR(period=3)
+
+        # Act
+        outputs = run(atr, [row(i, 10.0, high=11.0, low=9.0) for i in range(6)])
+
+        # Assert
+        assert math.isnan(outputs[2][0])
+        assert [output[0] for output in outputs[3:]] == [2.0, 2.0, 2.0]
+
+    def test_macd_with_constant_prices_returns_zeros(self):
+        # Arrange
+        macd = StreamingMACD(fast_period=2, slow_period=4, signal_period=2)
+
+        # Act
+        outputs = run(macd, [row(i, 10.0) for i in range(6)])
+
+        # Assert
+        assert all(math.isnan(value) for value in outputs[3])
+        assert outputs[4] == (0.0, 0.0, 0.0)
+
+    def test_update_without_append_replaces_latest_bar(self):
+        # Arrange
+        ema = StreamingEMA(period=2)
+        buffer = InputRingBuffer(capacity=2)
+        buffer.append(row(0, 1.0))
+        ema.update(buffer)
+        buffer.append(row(1, 2.0))
+        ema.update(buffer)
+        buffer.append(row(2, 100.0))
+        ema.update(buffer)
+
+        # Act
+        buffer.update_last(row(2, 3.0))
+        result = ema.update(buffer, append=False)
+
+        # Assert
+        assert result == pytest.approx((1.5 + (3.0 - 1.5) * 2.0 / 3.0,))
+
+    @pytest.mark.parametrize(
+        ("name", "parameters", "input_names", "expected"),
+        [
+            ["EMA", {"timeperiod": 5}, {"price": "close"}, StreamingEMA],
+            ["ATR", {"timeperiod": 5}, {"prices": ["high", "low", "close"]}, StreamingATR],
+            ["ATR", {"timeperiod": 5}, {"prices": ["open", "low", "close"]}, None],
+            ["KAMA", {"timeperiod": 5}, {"price": "close"}, None],
+        ],
+    )
+    def test_create_streaming_function(self, name, parameters, input_names, expected):
+        # Arrange, Act
+        result = create_streaming_function(name, parameters, input_names)
+
+        # Assert
+        if expected is None:
+            assert result is None
+        else:
+            assert isinstance(result, expected)
+
+
+class TestStreamingFunctionsMatchTALib:
+    def setup(self):
+        # Fixture Setup
+        rng = np.random.default_rng(42)
+        self.close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 1_000))
+        self.high = self.close + rng.uniform(0.0, 2.0, 1_000)
+        self.low = self.close - rng.uniform(0.0, 2.0, 1_000)
+        self.rows = [
+            (i, i, close, high, low, close, 1.0)
+            for i, (close, high, low) in enumerate(
+                zip(self.close, self.high, self.low, strict=True),
+            )
+        ]
+
+    def expected(self, name: str, parameters: dict) -> np.ndarray:
+        abstract = pytest.importorskip("talib.abstract")
+        inputs = {
+            "open": self.close,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": np.ones(len(self.close)),
+        }
+        results = abstract.Function(name)(inputs, **parameters)
+        if isinstance(results, list):
+            return np.column_stack(results)
+        return results.reshape(-1, 1)
+
+    @pytest.mark.parametrize(
+        ("name", "parameters", "input_names"),
+        [
+            ["SMA", {"timeperiod": 10}, {"price": "close"}],
+            ["EMA", {"timeperiod": 10}, {"price": "close"}],
+            ["RSI", {"timeperiod": 14}, {"price": "close"}],
+            ["ATR", {"timeperiod": 14}, {"prices": ["high", "low", "close"]}],
+            ["TRANGE", {}, {"prices": ["high", "low", "close"]}],
+            [
+                "MACD",
+                {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9},
+                {"price": "close"},
+            ],
+        ],
+    )
+    @pytest.mark.parametrize("replace_bars", [False, True])
+    def test_outputs_match_talib_over_complete_history(
+        self,
+        name,
+        parameters,
+        input_names,
+        replace_bars,
+    ):
+        # Arrange
+        expected = self.expected(name, parameters)
+        function = create_streaming_function(name, parameters, input_names)
+        buffer = InputRingBuffer(capacity=50)  # Shorter than the history
+
+        # Act
+        outputs = []
+        for values in self.rows:
+            if replace_bars:
+                # Update with a provisional bar, then replace it with the final bar
+                buffer.append((*values[:2], 1.0, 500.0, 0.5, 250.0, 1.0))
+                function.update(buffer)
+                buffer.update_last(values)
+                outputs.append(function.update(buffer, append=False))
+            else:
+                buffer.append(values)
+                outputs.append(function.update(buffer))
+
+        # Assert
+        np.testing.assert_allclose(np.array(outputs), expected, rtol=1e-9, equal_nan=True)
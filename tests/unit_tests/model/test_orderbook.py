@@ -435,6 +435,126 @@ class TestOrderBook:
         assert self.empty_book.best_bid_price() == 20.0
         assert self.empty_book.best_ask_price() == 21.0
 
+    def test_bids_and_asks_with_depth(self):
+        # Arrange, Act
+        bids = self.sample_book.bids(depth=1)
+        asks = self.sample_book.asks(depth=2)
+
+        # Assert
+        assert [level.price for level in bids] == [Price(0.83000, 5)]
+        assert [level.price for level in asks] == [Price(0.88600, 5), Price(0.88700, 5)]
+        assert len(self.sample_book.bids(depth=10)) == 2
+        assert len(self.sample_book.asks()) == 3
+
+    def test_bids_and_asks_to_numpy(self):
+        # Arrange, Act
+        bid_prices, bid_sizes, bid_counts = self.sample_book.bids_to_numpy(depth=10)
+        ask_prices, ask_sizes, ask_counts = self.sample_book.asks_to_numpy(depth=2)
+
+        # Assert
+        assert bid_prices.tolist() == [0.83, 0.82]
+        assert bid_sizes.tolist() == [4.0, 1.0]
+        assert bid_counts.tolist() == [1, 1]
+        assert ask_prices.tolist() == [0.886, 0.887]
+        assert ask_sizes.tolist() == [5.0, 10.0]
+        assert ask_counts.tolist() == [1, 1]
+
+    def test_bids_to_numpy_when_no_orders_returns_empty_arrays(self):
+        # Arrange, Act
+        prices, sizes, counts = self.empty_book.bids_to_numpy(depth=5)
+
+        # Assert
+        assert len(prices) == 0
+        assert len(sizes) == 0
+        assert len(counts) == 0
+
+    def test_bids_to_numpy_with_zero_depth_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.sample_book.bids_to_numpy(depth=0)
+
+    def test_bids_with_depth_when_update_beyond_depth_returns_cached_levels(self):
+        # Arrange
+        book = TestDataStubs.make_book(
+            instrument=self.instrument,
+            book_type=BookType.L2_MBP,
+            bids=[(0.83000, 4.0), (0.82000, 1.0), (0.81000, 2.0)],
+        )
+        levels = book.bids(depth=2)
+
+        # Act
+        book.add(
+            BookOrder(
+                side=OrderSide.BUY,
+                price=Price(0.80000, 5),
+                size=Quantity(3.0, 0),
+                order_id=0,
+            ),
+            ts_event=0,
+        )
+
+        # Assert
+        result = book.bids(depth=2)
+        assert result == levels
+        assert result[0] is levels[0]
+        assert result[1] is levels[1]
+        assert len(book.bids()) == 4
+
+    def test_bids_with_depth_when_update_within_depth_returns_updated_levels(self):
+        # Arrange
+        book = TestDataStubs.make_book(
+            instrument=self.instrument,
+            book_type=BookType.L2_MBP,
+            bids=[(0.83000, 4.0), (0.82000, 1.0), (0.81000, 2.0)],
+        )
+        levels = book.bids(depth=2)
+
+        # Act
+        book.update(
+            BookOrder(
+                side=OrderSide.BUY,
+                price=Price(0.82000, 5),
+                size=Quantity(3.0, 0),
+                order_id=0,
+            ),
+            ts_event=0,
+        )
+
+        # Assert
+        result = book.bids(depth=2)
+        assert result == levels
+        assert result[1] is not levels[1]
+        assert result[1].size() == 3.0
+
+    def test_bids_with_depth_when_l3_order_moves_beyond_depth_returns_updated_levels(self):
+        # Arrange
+        self.sample_book.bids(depth=1)
+
+        # Act
+        self.sample_book.update(
+            BookOrder(
+                side=OrderSide.BUY,
+                price=Price(0.81000, 5),
+                size=Quantity(4.0, 0),
+                order_id=0,
+            ),
+            ts_event=0,
+        )
+
+        # Assert
+        assert [level.price for level in self.sample_book.bids(depth=1)] == [Price(0.82000, 5)]
+
+    def test_asks_with_depth_after_clear_delta_returns_empty_list(self):
+        # Arrange
+        self.sample_book.asks(depth=1)
+        delta = TestDataStubs.order_book_delta_clear(instrument_id=self.instrument.id)
+
+        # Act
+        self.sample_book.apply_delta(delta)
+
+        # Assert
+        assert self.sample_book.asks(depth=1) == []
+
     def test_orderbook_operation_update(self):
         # Arrange
         delta = OrderBookDelta(
@@ -456,6 +456,55 @@ class TestMessageBus:
         assert len(subscriber) == 2
         assert subscriber == ["DUMMY EVENT", "TRADER EVENT"]
 
+    def test_subscribe_after_publish_then_receives_message_on_matching_topics(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.publish("data.quotes.BINANCE.ETHUSDT", "message1")
+        self.msgbus.publish("data.trades.BINANCE.ETHUSDT", "message2")
+        self.msgbus.publish("events.order.S-001", "message3")
+
+        # Act
+        self.msgbus.subscribe(topic="data.*.BINANCE.ETHUSDT", handler=handler1.append)
+        self.msgbus.subscribe(topic="events.order.S-001", handler=handler2.append)
+        self.msgbus.publish("data.quotes.BINANCE.ETHUSDT", "message4")
+        self.msgbus.publish("data.trades.BINANCE.ETHUSDT", "message5")
+        self.msgbus.publish("data.quotes.BINANCE.BTCUSDT", "message6")
+        self.msgbus.publish("events.order.S-001", "message7")
+
+        # Assert
+        assert handler1 == ["message4", "message5"]
+        assert handler2 == ["message7"]
+
+    def test_publish_sends_to_handlers_in_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append(1))
+        self.msgbus.subscribe(topic="data.quotes", handler=lambda m: received.append(2))
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append(3), priority=10)
+        self.msgbus.subscribe(topic="data.quote?", handler=lambda m: received.append(4))
+
+        # Act
+        self.msgbus.publish("data.quotes", "message1")
+
+        # Assert
+        assert received == [3, 1, 2, 4]
+
+    def test_unsubscribe_wildcard_then_no_longer_receives_messages(self):
+        # Arrange
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes.*", handler=handler.append)
+        self.msgbus.publish("data.quotes.BINANCE", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.quotes.*", handler=handler.append)
+        self.msgbus.publish("data.quotes.BINANCE", "message2")
+        self.msgbus.publish("data.quotes.BYBIT", "message3")
+
+        # Assert
+        assert handler == ["message1"]
+        assert not self.msgbus.has_subscribers("data.quotes.*")
+
 
 @pytest.mark.parametrize(
     ("topic", "pattern", "expected"),
@@ -469,6 +518,15 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["", "*", True],
+        ["", "?", False],
+        ["ab", "a?", True],
+        ["abc", "a?", False],
+        ["data.quotes.BINANCE", "data.*.BYBIT", False],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.trades.BINANCE.ETHUSDT", "*.*.*.ETH???T", True],
+        ["aaab", "*a*b", True],
+        ["aaab", "*a*c", False],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Generator
+
 import pytest
 
 from nautilus_trader.adapters.betfair.parsing.core import betting_instruments_from_file
@@ -32,6 +34,36 @@ def fixture_catalog() -> ParquetDataCatalog:
     return setup_catalog(protocol="file")
 
 
+@pytest.fixture(name="catalog_s3")
+def fixture_catalog_s3() -> Generator[ParquetDataCatalog, None, None]:
+    # Local S3 stand-in, skipped when the optional test dependencies are not installed
+    pytest.importorskip("s3fs")
+    moto_server = pytest.importorskip("moto.server")
+
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+
+    catalog = ParquetDataCatalog(
+        path="catalog-bucket/catalog",
+        fs_protocol="s3",
+        fs_storage_options={
+            "key": "testing",
+            "secret": "testing",
+            "skip_instance_cache": True,
+            "client_kwargs": {
+                "endpoint_url": f"http://{host}:{port}",
+                "region_name": "us-east-1",
+            },
+        },
+    )
+    catalog.fs.mkdir("catalog-bucket")
+
+    yield catalog
+
+    server.stop()
+
+
 @pytest.fixture(name="catalog_betfair")
 def fixture_catalog_betfair(catalog: ParquetDataCatalog) -> ParquetDataCatalog:
     filename = TEST_DATA_DIR / "betfair" / "1.166564490.bz2"
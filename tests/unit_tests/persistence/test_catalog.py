@@ -15,6 +15,7 @@
 
 import datetime
 import sys
+import warnings
 from decimal import Decimal
 
 import pandas as pd
@@ -29,6 +30,7 @@ from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import CustomData
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TradeId
@@ -397,6 +399,145 @@ def test_catalog_persists_equity(
     assert quotes_from_catalog[0].instrument_id == instrument.id
 
 
+def test_catalog_memory_query_uses_backend_session(catalog_memory: ParquetDataCatalog) -> None:
+    # Arrange
+    quotes = [TestDataStubs.quote_tick(ts_init=ts) for ts in range(10)]
+    catalog_memory.write_data(quotes)
+
+    # Act
+    session = catalog_memory.backend_session(data_cls=QuoteTick, start=2, end=5)
+    result = [quote for chunk in session.to_query_result() for quote in capsule_to_list(chunk)]
+
+    # Assert
+    assert [quote.ts_init for quote in result] == [2, 3, 4, 5]
+    assert [quote.ts_init for quote in catalog_memory.quote_ticks()] == list(range(10))
+
+
+def test_catalog_s3_query_streams_record_batch_readers(catalog_s3: ParquetDataCatalog) -> None:
+    # Arrange
+    quotes = [TestDataStubs.quote_tick(ts_init=ts) for ts in range(10)]
+    catalog_s3.write_data(quotes)
+
+    # Act
+    session = catalog_s3.backend_session(data_cls=QuoteTick, start=2, end=5)
+    result = [quote for chunk in session.to_query_result() for quote in capsule_to_list(chunk)]
+
+    # Assert
+    assert [quote.ts_init for quote in result] == [2, 3, 4, 5]
+    assert [quote.ts_init for quote in catalog_s3.quote_ticks()] == list(range(10))
+
+
+def test_write_data_records_files_in_manifest(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    quotes = [TestDataStubs.quote_tick(ts_init=ts) for ts in (1, 2, 3)]
+
+    # Act
+    catalog.write_data(quotes)
+
+    # Assert
+    files = catalog._read_manifest(QuoteTick, "AUDUSD.SIM")
+    assert catalog._read_manifest(QuoteTick) is None
+    assert list(files) == ["data/quote_tick/AUDUSD.SIM/part-0.parquet"]
+    entry = files["data/quote_tick/AUDUSD.SIM/part-0.parquet"]
+    assert entry["identifier"] == "AUDUSD.SIM"
+    assert entry["ts_init_min"] == 1
+    assert entry["ts_init_max"] == 3
+    assert entry["num_rows"] == 3
+    assert "bid_price" in entry["schema"]
+
+
+@pytest.mark.parametrize("protocol", ["catalog", "catalog_memory"])
+def test_query_prunes_files_outside_time_range(protocol: str, request) -> None:
+    # Arrange
+    catalog: ParquetDataCatalog = request.getfixturevalue(protocol)
+    catalog.write_data(
+        [TestDataStubs.quote_tick(ts_init=ts) for ts in (1, 2)],
+        basename_template="early-{i}",
+    )
+    catalog.write_data(
+        [TestDataStubs.quote_tick(ts_init=ts) for ts in (10, 11)],
+        basename_template="late-{i}",
+    )
+
+    # Act
+    files = catalog._query_files(QuoteTick, start=5)
+    quotes = catalog.quote_ticks(start=5)
+
+    # Assert
+    assert [path.rsplit("/", 1)[-1] for path, _ in files] == ["late-0.parquet"]
+    assert [quote.ts_init for quote in quotes] == [10, 11]
+
+
+def test_rebuild_manifest_reindexes_files(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=1)], basename_template="a-{i}")
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=2)], basename_template="b-{i}")
+    catalog.fs.rm(f"{catalog.path}/data/quote_tick/AUDUSD.SIM/a-0.parquet")
+
+    # Act
+    catalog.rebuild_manifest(QuoteTick)
+
+    # Assert
+    assert list(catalog._read_manifest(QuoteTick, "AUDUSD.SIM")) == [
+        "data/quote_tick/AUDUSD.SIM/b-0.parquet",
+    ]
+    assert [quote.ts_init for quote in catalog.quote_ticks()] == [2]
+
+
+def test_query_when_file_removed_externally_warns_and_globs(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=1)], basename_template="a-{i}")
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=2)], basename_template="b-{i}")
+    catalog.fs.rm(f"{catalog.path}/data/quote_tick/AUDUSD.SIM/a-0.parquet")
+
+    # Act
+    with pytest.warns(UserWarning, match="0 unindexed, 1 missing"):
+        quotes = catalog.quote_ticks()
+
+    # Assert
+    assert [quote.ts_init for quote in quotes] == [2]
+
+
+def test_query_when_file_added_externally_warns_and_globs(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=1)], basename_template="a-{i}")
+    path = f"{catalog.path}/data/quote_tick/AUDUSD.SIM"
+    catalog.fs.copy(f"{path}/a-0.parquet", f"{path}/b-0.parquet")
+
+    # Act
+    with pytest.warns(UserWarning, match="1 unindexed, 0 missing"):
+        files = catalog._query_files(QuoteTick)
+
+    # Assert
+    assert files is None
+    assert len(catalog.quote_ticks()) == 2
+
+
+def test_query_with_instrument_ids_only_reads_requested_identifiers(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    catalog.write_data([TestDataStubs.quote_tick(ts_init=1)])
+    catalog.write_data([TestDataStubs.quote_tick(usdjpy, ts_init=2)])
+    catalog.fs.rm(f"{catalog.path}/data/quote_tick/USDJPY.SIM/part-0.parquet")
+
+    # Act
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # The USDJPY.SIM manifest is not read
+        files = catalog._query_files(
+            QuoteTick,
+            identifiers=catalog._query_identifiers(QuoteTick, ["AUD/USD.SIM"]),
+        )
+        quotes = catalog.quote_ticks(instrument_ids=["AUD/USD.SIM"])
+
+    # Assert
+    assert [path for path, _ in files] == [
+        f"{catalog.path}/data/quote_tick/AUDUSD.SIM/part-0.parquet",
+    ]
+    assert [quote.ts_init for quote in quotes] == [1]
+
+
 def test_list_backtest_runs(
     catalog_betfair: ParquetDataCatalog,
 ) -> None:
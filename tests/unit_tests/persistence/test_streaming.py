@@ -16,6 +16,9 @@
 import copy
 from collections import Counter
 
+import pyarrow as pa
+import pytest
+
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.config import BacktestDataConfig
@@ -31,8 +34,11 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.persistence.writer import generate_signal_class
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
@@ -420,3 +426,135 @@ class TestPersistenceStreaming:
             "TradeTick": 179,
         }
         assert counts == expected
+
+
+class TestStreamingFeatherWriter:
+    def setup(self) -> None:
+        self.instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+    def _read_batches(self, path: str) -> list[pa.RecordBatch]:
+        with open(path, "rb") as f:
+            return list(pa.ipc.open_stream(f))
+
+    def test_write_buffers_objects_into_batches(self, tmp_path) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=str(tmp_path),
+            batch_size=100,
+            flush_interval_ms=3_600_000,  # Ensure no interval flush during the test
+        )
+        writer.write(self.instrument)
+        ticks = [TestDataStubs.quote_tick(self.instrument, ts_init=i) for i in range(250)]
+
+        # Act
+        for tick in ticks:
+            writer.write(tick)
+        writer.close()
+
+        # Assert
+        batches = self._read_batches(f"{tmp_path}/quote_tick/AUDUSD.SIM.feather")
+        assert [batch.num_rows for batch in batches] == [100, 100, 50]
+        assert pa.Table.from_batches(batches).column("ts_init").to_pylist() == list(range(250))
+
+    def test_flush_writes_partial_buffers(self, tmp_path) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(path=str(tmp_path), batch_size=100)
+        writer.write(self.instrument)
+        for i in range(10):
+            writer.write(TestDataStubs.quote_tick(self.instrument, ts_init=i))
+
+        # Act
+        writer.flush()
+
+        # Assert
+        batches = self._read_batches(f"{tmp_path}/quote_tick/AUDUSD.SIM.feather")
+        assert [batch.num_rows for batch in batches] == [10]
+        writer.close()
+
+    def test_write_with_writer_thread_drains_on_close(self, tmp_path) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=str(tmp_path),
+            batch_size=100,
+            use_writer_thread=True,
+        )
+        writer.write(self.instrument)
+
+        # Act
+        for i in range(250):
+            writer.write(TestDataStubs.quote_tick(self.instrument, ts_init=i))
+        writer.close()
+
+        # Assert
+        batches = self._read_batches(f"{tmp_path}/quote_tick/AUDUSD.SIM.feather")
+        assert pa.Table.from_batches(batches).column("ts_init").to_pylist() == list(range(250))
+        assert writer.queue_depth == 0
+        assert writer.dropped_count == 0
+
+    def test_flush_with_writer_thread_writes_queued_objects(self, tmp_path) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(path=str(tmp_path), use_writer_thread=True)
+        writer.write(self.instrument)
+        for i in range(10):
+            writer.write(TestDataStubs.quote_tick(self.instrument, ts_init=i))
+
+        # Act
+        writer.flush()
+
+        # Assert
+        batches = self._read_batches(f"{tmp_path}/quote_tick/AUDUSD.SIM.feather")
+        assert sum(batch.num_rows for batch in batches) == 10
+        assert writer.queue_depth == 0
+        writer.close()
+
+    @pytest.mark.parametrize(
+        ("backpressure", "expected_ts_init"),
+        [
+            ["drop_oldest", [0, 4, 5]],
+            ["drop_newest", [0, 1, 2]],
+        ],
+    )
+    def test_write_with_full_queue_drops_objects(
+        self,
+        tmp_path,
+        backpressure: str,
+        expected_ts_init: list[int],
+    ) -> None:
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=str(tmp_path),
+            use_writer_thread=True,
+            qsize=2,
+            backpressure=backpressure,
+        )
+        writer.write(self.instrument)
+        writer.flush()
+
+        # Block the writer thread once it has taken the first tick from the queue
+        writer._io_lock.acquire()
+        try:
+            writer.write(TestDataStubs.quote_tick(self.instrument, ts_init=0))
+            with writer._queue_cond:
+                assert writer._queue_cond.wait_for(
+                    lambda: writer._is_writing and writer.queue_depth == 0,
+                    timeout=5.0,
+                )
+
+            # Act
+            for i in range(1, 6):
+                writer.write(TestDataStubs.quote_tick(self.instrument, ts_init=i))
+            queue_depth = writer.queue_depth
+        finally:
+            writer._io_lock.release()
+        writer.close()
+
+        # Assert
+        batches = self._read_batches(f"{tmp_path}/quote_tick/AUDUSD.SIM.feather")
+        assert pa.Table.from_batches(batches).column("ts_init").to_pylist() == expected_ts_init
+        assert queue_depth == 2
+        assert writer.dropped_count == 3
+
+    def test_instantiate_with_invalid_backpressure_raises(self, tmp_path) -> None:
+        # Arrange, Act, Assert
+        with pytest.raises(KeyError):
+            StreamingFeatherWriter(path=str(tmp_path), backpressure="invalid")
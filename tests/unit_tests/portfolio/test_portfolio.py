@@ -1105,6 +1105,98 @@ class TestPortfolio:
         assert not self.portfolio.is_flat(AUDUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
 
+    def test_unrealized_pnl_with_several_positions_per_side_returns_total_of_positions(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        positions = []
+        for position_id, side, quantity, last_px in [
+            ("P-1", OrderSide.BUY, 100_000, "1.00000"),
+            ("P-2", OrderSide.BUY, 50_000, "0.90000"),
+            ("P-3", OrderSide.SELL, 100_000, "0.85000"),
+        ]:
+            order = self.order_factory.market(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(quantity),
+            )
+            self.cache.add_order(order, position_id=None)
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                strategy_id=StrategyId("S-1"),
+                account_id=account_id,
+                position_id=PositionId(position_id),
+                last_px=Price.from_str(last_px),
+            )
+            self.cache.update_order(order)
+            positions.append(Position(instrument=AUDUSD_SIM, fill=fill))
+
+        for position in positions:
+            self.cache.add_position(position, OmsType.HEDGING)
+            self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        # Act
+        result1 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.81000"),
+            ask_price=Price.from_str("0.81004"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+        result2 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+        # Assert
+        assert result1 == Money(-19753.50, USD)  # -19499.00 - 4749.50 + 4495.00
+        assert result2 == Money(-19504.00, USD)  # -19000.00 - 4500.00 + 3996.00
+        assert result2 == Money(
+            sum(p.unrealized_pnl(Price.from_str("0.81000")).as_double() for p in positions[:2])
+            + positions[2].unrealized_pnl(Price.from_str("0.81004")).as_double(),
+            USD,
+        )
+
     def test_modifying_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")
@@ -1197,6 +1289,191 @@ class TestPortfolio:
         assert self.portfolio.unrealized_pnls(BINANCE) == {}
         assert self.portfolio.net_exposures(BINANCE) is None
 
+    def test_net_exposures_when_price_changes_recalculates(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80501.00, USD)}
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(80501.00, USD)
+
+        # Act
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.90001"),
+            ask_price=Price.from_str("0.90005"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90001.00, USD)}
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(90001.00, USD)
+
+    def test_net_exposures_when_positions_change_updates_from_position_events(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50_000),
+        )
+
+        order3 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(30_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        fill3 = TestEventStubs.order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=AUDUSD_SIM, fill=fill2)
+        self.cache.add_position(position1, OmsType.HEDGING)
+        self.cache.add_position(position2, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position1))
+        self.portfolio.update_position(TestEventStubs.position_opened(position2))
+
+        # Long exposure at the bid plus short exposure at the ask
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(120753.50, USD)
+
+        # Act
+        position1.apply(fill3)
+        self.cache.update_position(position1)
+        self.portfolio.update_position(TestEventStubs.position_changed(position1))
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(96603.20, USD)}
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(96603.20, USD)
+
+        self.portfolio.initialize_positions()
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(96603.20, USD)
+
     def test_closing_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")